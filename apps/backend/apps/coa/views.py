@@ -15,7 +15,7 @@ from rest_framework_simplejwt.authentication import JWTAuthentication
 from apps.core.permissions import IsOrgMember, CanManageCoA, CanViewReports
 from apps.core.models import Account
 from common.exceptions import ValidationError, ResourceNotFound
-from common.views import wrap_response
+from common.views import wrap_response, query_bool
 
 from .services import AccountService
 from .serializers import (
@@ -42,18 +42,13 @@ class AccountListCreateView(APIView):
         """List accounts with optional filters."""
         # Parse query parameters
         account_type = request.query_params.get("account_type")
-        is_active = request.query_params.get("is_active")
-        is_system = request.query_params.get("is_system")
+        is_active = query_bool(request.query_params, "is_active")
+        is_system = query_bool(request.query_params, "is_system")
         parent_id = request.query_params.get("parent_id")
         search = request.query_params.get("search")
         order_by = request.query_params.get("order_by", "code")
-        include_balance = request.query_params.get("include_balance", "false").lower() == "true"
+        include_balance = query_bool(request.query_params, "include_balance", False)
         
-        # Convert boolean strings
-        if is_active is not None:
-            is_active = is_active.lower() == "true"
-        if is_system is not None:
-            is_system = is_system.lower() == "true"
         if parent_id:
             from uuid import UUID
             try:
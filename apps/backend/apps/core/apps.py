@@ -0,0 +1,17 @@
+"""Django app configuration for core module."""
+
+from django.apps import AppConfig
+
+
+class CoreConfig(AppConfig):
+    """Configuration for core Django app."""
+    
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.core'
+    verbose_name = 'Core'
+    
+    def ready(self):
+        """Connect signals when app is ready."""
+        from . import signals
+        
+        signals.connect()
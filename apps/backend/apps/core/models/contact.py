@@ -4,6 +4,8 @@ Contact model for LedgerSG.
 Maps to invoicing.contact table.
 """
 
+from functools import cached_property
+
 from django.db import models
 from common.models import TenantModel
 
@@ -83,3 +85,25 @@ class Contact(TenantModel):
     class Meta:
         managed = False
         db_table = 'invoicing"."contact'
+    
+    def __str__(self) -> str:
+        return self.name
+    
+    @cached_property
+    def snapshot(self) -> dict:
+        """Billing details copied onto documents as contact_snapshot."""
+        return {
+            "name": self.name,
+            "company_name": self.company_name,
+            "email": self.email,
+            "phone": self.phone,
+            "address": {
+                "line1": self.address_line_1,
+                "line2": self.address_line_2,
+                "city": self.city,
+                "postal_code": self.postal_code,
+                "country": self.country,
+            },
+            "uen": self.uen,
+            "peppol_id": self.peppol_id,
+        }
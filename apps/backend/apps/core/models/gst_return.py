@@ -62,8 +62,11 @@ class GSTReturn(TenantModel):
         max_digits=10, decimal_places=4, default=0,
         db_column="box7_input_tax_claimable"
     )
-    box8_net_gst = models.DecimalField(
-        max_digits=10, decimal_places=4, default=0,
+    # GENERATED ALWAYS in SQL (box6 - box7); never written by Django
+    box8_net_gst = models.GeneratedField(
+        expression=models.F("box6_output_tax") - models.F("box7_input_tax_claimable"),
+        output_field=models.DecimalField(max_digits=10, decimal_places=4),
+        db_persist=True,
         db_column="box8_net_gst"
     )
     box9_imports_under_schemes = models.DecimalField(
@@ -124,3 +127,24 @@ class GSTReturn(TenantModel):
     class Meta:
         managed = False
         db_table = 'gst"."return'
+        unique_together = [["org", "return_type", "period_start", "period_end"]]
+    
+    @property
+    def period_months(self) -> int:
+        """Number of calendar months the return period spans."""
+        return (
+            (self.period_end.year - self.period_start.year) * 12
+            + self.period_end.month - self.period_start.month + 1
+        )
+    
+    @property
+    def label(self) -> str:
+        """Period label, e.g. 'Jan 2024' (monthly) or 'Q1 2024' (quarterly)."""
+        if self.period_months == 1:
+            return self.period_start.strftime("%b %Y")
+        return f"Q{(self.period_start.month - 1) // 3 + 1} {self.period_start.year}"
+    
+    @property
+    def filing_frequency(self) -> str:
+        """Filing frequency implied by the period length."""
+        return "MONTHLY" if self.period_months == 1 else "QUARTERLY"
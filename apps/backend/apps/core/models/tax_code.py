@@ -42,3 +42,18 @@ class TaxCode(TenantModel):
         db_table = 'gst"."tax_code'
         # Include effective_from in unique constraint to allow rate history
         unique_together = [["org", "code", "effective_from"]]
+        indexes = [
+            # Tax code list filters (see TaxCodeService.list_tax_codes)
+            models.Index(
+                fields=["org", "is_active", "is_gst_charged", "code"],
+                name="idx_tax_code_org_active_gst",
+            ),
+        ]
+        constraints = [
+            # One current (open-ended) row per code
+            models.UniqueConstraint(
+                fields=["org", "code"],
+                condition=models.Q(effective_to__isnull=True, deleted_at__isnull=True),
+                name="uniq_tax_code_org_code_current",
+            ),
+        ]
@@ -9,6 +9,20 @@ from rest_framework import permissions
 from common.exceptions import UnauthorizedOrgAccess
 
 
+def has_org_permission(request, permission_field: str) -> bool:
+    """
+    Check a role permission flag for the current org.
+    
+    Superadmins have every permission; other users need the flag set on
+    request.org_role (attached by TenantContextMiddleware).
+    """
+    if getattr(request.user, 'is_superadmin', False):
+        return True
+    
+    org_role = getattr(request, 'org_role', None)
+    return bool(org_role and org_role.get(permission_field, False))
+
+
 class IsOrgMember(permissions.BasePermission):
     """
     Permission that checks if user belongs to the org in URL.
@@ -44,20 +58,32 @@ class HasOrgPermission(permissions.BasePermission):
     permission_field = None
     
     def has_permission(self, request, view):
-        # Superadmins have all permissions
-        if getattr(request.user, 'is_superadmin', False):
-            return True
-        
-        # Get org_role from request (set by middleware)
-        org_role = getattr(request, 'org_role', None)
-        if not org_role:
-            return False
-        
-        # Check specific permission
         if self.permission_field:
-            return org_role.get(self.permission_field, False)
+            return has_org_permission(request, self.permission_field)
         
-        return True
+        # No specific permission: any org role (or superadmin) will do
+        return bool(
+            getattr(request.user, 'is_superadmin', False)
+            or getattr(request, 'org_role', None)
+        )
+
+
+class HasMethodOrgPermission(permissions.BasePermission):
+    """
+    Permission that checks the org permission required per HTTP method.
+    
+    For views whose methods need different permissions; methods not
+    listed only need the view's other permission classes.
+    
+    Usage:
+        class MyView(APIView):
+            permission_classes = [IsAuthenticated, IsOrgMember, HasMethodOrgPermission]
+            method_permissions = {"POST": "can_create_invoices"}
+    """
+    
+    def has_permission(self, request, view):
+        permission_field = getattr(view, 'method_permissions', {}).get(request.method)
+        return permission_field is None or has_org_permission(request, permission_field)
 
 
 # Pre-defined permission classes for common operations
@@ -0,0 +1,47 @@
+"""
+Signal handlers for core module.
+
+Keeps the tenant middleware's cached org roles consistent with the
+membership and role tables they are read from.
+"""
+
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete
+
+from apps.core.models import Role, UserOrganisation
+from common.middleware.tenant_context import invalidate_org_role
+
+
+# Cached roles are dropped once the change commits: dropping them earlier
+# would let a request between the drop and the commit re-cache the old
+# (possibly revoked) role for the cache timeout.
+
+
+def invalidate_role_on_membership_change(sender, instance, **kwargs):
+    """Drop the cached role when a membership is saved or removed."""
+    user_id, org_id = instance.user_id, instance.org_id
+    transaction.on_commit(lambda: invalidate_org_role(user_id, org_id))
+
+
+def invalidate_role_on_role_change(sender, instance, **kwargs):
+    """Drop the cached role of every member holding a changed role."""
+    # Listed now, while a deleted role's memberships still exist
+    members = list(
+        UserOrganisation.objects.filter(role=instance).values_list("user_id", "org_id")
+    )
+    
+    def invalidate_members():
+        for user_id, org_id in members:
+            invalidate_org_role(user_id, org_id)
+    
+    transaction.on_commit(invalidate_members)
+
+
+def connect():
+    """Connect core signal handlers."""
+    post_save.connect(invalidate_role_on_membership_change, sender=UserOrganisation)
+    post_delete.connect(invalidate_role_on_membership_change, sender=UserOrganisation)
+    
+    post_save.connect(invalidate_role_on_role_change, sender=Role)
+    # Before the delete, while the memberships can still be listed
+    pre_delete.connect(invalidate_role_on_role_change, sender=Role)
@@ -104,6 +104,70 @@ def dashboard_auth_client(api_client, test_user):
     return api_client
 
 
+REQUIRED_DASHBOARD_KEYS = [
+    'gst_payable',
+    'gst_payable_display',
+    'outstanding_receivables',
+    'outstanding_payables',
+    'revenue_mtd',
+    'revenue_ytd',
+    'cash_on_hand',
+    'gst_threshold_status',
+    'gst_threshold_utilization',
+    'gst_threshold_amount',
+    'gst_threshold_limit',
+    'compliance_alerts',
+    'invoices_pending',
+    'invoices_overdue',
+    'invoices_peppol_pending',
+    'current_gst_period',
+    'last_updated',
+]
+
+
+def _check_required_keys(data):
+    """Dashboard response has every required key."""
+    for key in REQUIRED_DASHBOARD_KEYS:
+        assert key in data, f"Missing required key: {key}"
+
+
+def _check_types(data):
+    """Dashboard response fields have the expected data types."""
+    # String fields (formatted currency)
+    assert isinstance(data['gst_payable'], str)
+    assert isinstance(data['gst_payable_display'], str)
+    assert isinstance(data['outstanding_receivables'], str)
+    assert isinstance(data['cash_on_hand'], str)
+    
+    # Integer fields
+    assert isinstance(data['invoices_pending'], int)
+    assert isinstance(data['invoices_overdue'], int)
+    assert isinstance(data['gst_threshold_utilization'], int)
+    
+    # Array fields
+    assert isinstance(data['compliance_alerts'], list)
+    
+    # Object fields
+    assert isinstance(data['current_gst_period'], dict)
+
+
+def _check_statuses(data):
+    """GST threshold status is a valid enum value."""
+    valid_statuses = ['SAFE', 'WARNING', 'CRITICAL', 'EXCEEDED']
+    assert data['gst_threshold_status'] in valid_statuses
+
+
+def _check_alerts(data):
+    """Compliance alerts have the correct structure."""
+    for alert in data['compliance_alerts']:
+        assert 'id' in alert
+        assert 'severity' in alert
+        assert 'title' in alert
+        assert 'message' in alert
+        assert 'action_required' in alert
+        assert alert['severity'] in ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
+
+
 @pytest.mark.django_db
 class TestDashboardView:
     """Test suite for Dashboard API endpoint."""
@@ -191,87 +255,19 @@ class TestDashboardView:
         
         assert response.status_code == status.HTTP_403_FORBIDDEN
     
-    def test_dashboard_response_structure(self, dashboard_auth_client, dashboard_api_org):
-        """Test that dashboard response has correct structure."""
+    def test_dashboard_response(self, dashboard_auth_client, dashboard_api_org):
+        """Test dashboard response structure, types, statuses and alerts."""
         url = f"/api/v1/{dashboard_api_org.id}/dashboard/"
         response = dashboard_auth_client.get(url)
         
         assert response.status_code == status.HTTP_200_OK
         data = response.json()
         
-        # Check required keys
-        required_keys = [
-            'gst_payable',
-            'gst_payable_display',
-            'outstanding_receivables',
-            'outstanding_payables',
-            'revenue_mtd',
-            'revenue_ytd',
-            'cash_on_hand',
-            'gst_threshold_status',
-            'gst_threshold_utilization',
-            'gst_threshold_amount',
-            'gst_threshold_limit',
-            'compliance_alerts',
-            'invoices_pending',
-            'invoices_overdue',
-            'invoices_peppol_pending',
-            'current_gst_period',
-            'last_updated',
-        ]
-        
-        for key in required_keys:
-            assert key in data, f"Missing required key: {key}"
-    
-    def test_dashboard_response_types(self, dashboard_auth_client, dashboard_api_org):
-        """Test that dashboard response has correct data types."""
-        url = f"/api/v1/{dashboard_api_org.id}/dashboard/"
-        response = dashboard_auth_client.get(url)
-        
-        data = response.json()
-        
-        # String fields (formatted currency)
-        assert isinstance(data['gst_payable'], str)
-        assert isinstance(data['gst_payable_display'], str)
-        assert isinstance(data['outstanding_receivables'], str)
-        assert isinstance(data['cash_on_hand'], str)
-        
-        # Integer fields
-        assert isinstance(data['invoices_pending'], int)
-        assert isinstance(data['invoices_overdue'], int)
-        assert isinstance(data['gst_threshold_utilization'], int)
-        
-        # Array fields
-        assert isinstance(data['compliance_alerts'], list)
-        
-        # Object fields
-        assert isinstance(data['current_gst_period'], dict)
-    
-    def test_dashboard_gst_threshold_status_values(self, dashboard_auth_client, dashboard_api_org):
-        """Test that GST threshold status is valid enum value."""
-        url = f"/api/v1/{dashboard_api_org.id}/dashboard/"
-        response = dashboard_auth_client.get(url)
-        
-        data = response.json()
-        
-        valid_statuses = ['SAFE', 'WARNING', 'CRITICAL', 'EXCEEDED']
-        assert data['gst_threshold_status'] in valid_statuses
-    
-    def test_dashboard_compliance_alerts_structure(self, dashboard_auth_client, dashboard_api_org):
-        """Test compliance alerts have correct structure."""
-        url = f"/api/v1/{dashboard_api_org.id}/dashboard/"
-        response = dashboard_auth_client.get(url)
-        
-        data = response.json()
-        alerts = data['compliance_alerts']
-        
-        for alert in alerts:
-            assert 'id' in alert
-            assert 'severity' in alert
-            assert 'title' in alert
-            assert 'message' in alert
-            assert 'action_required' in alert
-            assert alert['severity'] in ['LOW', 'MEDIUM', 'HIGH', 'CRITICAL']
+        # One request, every check against this test's own org
+        _check_required_keys(data)
+        _check_types(data)
+        _check_statuses(data)
+        _check_alerts(data)
     
     def test_dashboard_only_get_allowed(self, dashboard_auth_client, dashboard_api_org):
         """Test that only GET method is allowed."""
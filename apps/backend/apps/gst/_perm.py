@@ -0,0 +1,30 @@
+"""
+Permission helpers for GST views.
+
+Org role flags are set on the request by TenantContextMiddleware.
+"""
+
+from apps.core.permissions import has_org_permission
+from common.exceptions import UnauthorizedOrgAccess
+
+
+def require_perm(request, permission: str) -> bool:
+    """
+    Require an org role permission (superadmins always pass).
+    
+    The check itself is apps.core.permissions.has_org_permission; this
+    only turns a denial into an exception for use inside views.
+    
+    Args:
+        request: The current request
+        permission: Org role permission flag, e.g. 'can_manage_coa'
+        
+    Returns:
+        True if permitted
+        
+    Raises:
+        UnauthorizedOrgAccess: If the user lacks the permission
+    """
+    if has_org_permission(request, permission):
+        return True
+    raise UnauthorizedOrgAccess("Insufficient permissions")
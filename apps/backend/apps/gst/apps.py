@@ -0,0 +1,17 @@
+"""Django app configuration for GST module."""
+
+from django.apps import AppConfig
+
+
+class GstConfig(AppConfig):
+    """Configuration for GST Django app."""
+    
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'apps.gst'
+    verbose_name = 'GST'
+    
+    def ready(self):
+        """Connect signals when app is ready."""
+        from . import signals
+        
+        signals.connect()
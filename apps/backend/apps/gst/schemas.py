@@ -0,0 +1,99 @@
+"""
+Request schemas for LedgerSG GST hot endpoints.
+
+Pydantic v2 models used instead of DRF serializers where request bodies
+need validation only (no model coupling). Field constraints mirror the
+corresponding serializers in apps.gst.serializers.
+"""
+
+from decimal import Decimal
+from typing import Annotated, List, Optional
+from uuid import UUID
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    ConfigDict,
+    Field,
+    StringConstraints,
+    model_validator,
+)
+
+
+_FOUR_PLACES = Decimal("0.0001")
+
+
+def _quantize_4dp(value: Decimal) -> Decimal:
+    """Pad to 4 dp as DRF's DecimalField(decimal_places=4) does ('0.09' -> '0.0900')."""
+    return value.quantize(_FOUR_PLACES)
+
+
+Amount = Annotated[Decimal, Field(max_digits=15, decimal_places=4), AfterValidator(_quantize_4dp)]
+Rate = Annotated[Decimal, Field(max_digits=5, decimal_places=4), AfterValidator(_quantize_4dp)]
+BoxAmount = Annotated[Decimal, Field(max_digits=10, decimal_places=4), AfterValidator(_quantize_4dp)]
+
+
+class GSTCalcRequest(BaseModel):
+    """GST calculation request for a single line (GSTCalculationRequestSerializer)."""
+    
+    amount: Amount
+    tax_code_id: Optional[UUID] = None
+    rate: Optional[Rate] = None
+    is_bcrs_deposit: bool = False
+    
+    @model_validator(mode="after")
+    def _require_tax_code_or_rate(self) -> "GSTCalcRequest":
+        """Validate that either tax_code_id or rate is provided."""
+        if not self.tax_code_id and self.rate is None:
+            raise ValueError("Either tax_code_id or rate must be provided.")
+        return self
+
+
+class LineGSTCalc(BaseModel):
+    """Line item of a document GST calculation (LineGSTCalculationSerializer)."""
+    
+    id: Optional[str] = None
+    amount: Amount
+    rate: Optional[Rate] = None
+    is_bcrs_deposit: bool = False
+
+
+class DocumentGSTCalcRequest(BaseModel):
+    """Document GST calculation request (DocumentGSTCalculationSerializer)."""
+    
+    lines: List[LineGSTCalc]
+    default_rate: Rate = Decimal("0.09")
+
+
+class F5BoxOverrides(BaseModel):
+    """
+    F5 box amounts overridden when filing, keyed by gst.return column.
+    
+    Every box is optional; dump with exclude_unset=True to get only the
+    boxes the client sent. Unknown keys (including the generated box8)
+    are ignored.
+    """
+    
+    model_config = ConfigDict(extra="ignore")
+    
+    box1_std_rated_supplies: BoxAmount = None
+    box2_zero_rated_supplies: BoxAmount = None
+    box3_exempt_supplies: BoxAmount = None
+    box4_total_supplies: BoxAmount = None
+    box5_total_taxable_purchases: BoxAmount = None
+    box6_output_tax: BoxAmount = None
+    box7_input_tax_claimable: BoxAmount = None
+    box9_imports_under_schemes: BoxAmount = None
+    box10_tourist_refund: BoxAmount = None
+    box11_bad_debt_relief: BoxAmount = None
+    box12_pre_reg_input_tax: BoxAmount = None
+    box13_total_revenue: BoxAmount = None
+    box14_reverse_charge_supplies: BoxAmount = None
+    box15_electronic_marketplace: BoxAmount = None
+
+
+class GSTReturnFileRequest(BaseModel):
+    """GST return filing request (GSTReturnFileSerializer)."""
+    
+    filing_reference: Optional[Annotated[str, StringConstraints(max_length=50)]] = None
+    boxes: Optional[F5BoxOverrides] = None
@@ -4,9 +4,11 @@ GST serializers for LedgerSG.
 Serializers for TaxCode and GSTReturn models.
 """
 
-from rest_framework import serializers
+from datetime import date
 from decimal import Decimal
 
+from rest_framework import serializers
+
 from apps.core.models import TaxCode, GSTReturn
 
 
@@ -19,16 +21,45 @@ class TaxCodeListSerializer(serializers.ModelSerializer):
         model = TaxCode
         fields = [
             "id", "code", "name", "rate", "rate_display",
-            "is_gst_charged", "is_active", "is_system",
-            "box_mapping", "effective_from"
+            "is_gst_charged", "is_input", "is_output", "is_active",
+            "f5_supply_box", "f5_purchase_box", "f5_tax_box", "effective_from"
         ]
-        read_only_fields = ["id", "is_system"]
+        read_only_fields = ["id"]
     
-    def get_rate_display(self, obj: TaxCode) -> str:
-        """Get formatted rate display."""
-        if obj.rate is None:
+    def get_rate_display(self, obj) -> str:
+        """Get formatted rate display (obj may be a TaxCode or a values() dict)."""
+        rate = obj["rate"] if isinstance(obj, dict) else obj.rate
+        if rate is None:
             return "N/A"
-        return f"{obj.rate * 100:.0f}%"
+        return f"{rate * 100:.0f}%"
+    
+    def to_representation(self, obj) -> dict:
+        """
+        Build the row directly instead of walking the DRF fields.
+        
+        Output matches the declared fields; rate keeps the column's
+        4 dp string form that DecimalField would produce.
+        """
+        if not isinstance(obj, dict):
+            return super().to_representation(obj)
+        
+        rate = obj["rate"]
+        effective_from = obj["effective_from"]
+        return {
+            "id": str(obj["id"]),
+            "code": obj["code"],
+            "name": obj["name"],
+            "rate": str(rate) if rate is not None else None,
+            "rate_display": self.get_rate_display(obj),
+            "is_gst_charged": obj["is_gst_charged"],
+            "is_input": obj["is_input"],
+            "is_output": obj["is_output"],
+            "is_active": obj["is_active"],
+            "f5_supply_box": obj["f5_supply_box"],
+            "f5_purchase_box": obj["f5_purchase_box"],
+            "f5_tax_box": obj["f5_tax_box"],
+            "effective_from": effective_from.isoformat() if effective_from else None,
+        }
 
 
 class TaxCodeDetailSerializer(serializers.ModelSerializer):
@@ -147,6 +178,7 @@ class DocumentGSTSummarySerializer(serializers.Serializer):
 class GSTReturnListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for GST return list views."""
     
+    due_date = serializers.DateField(source="filing_due_date")
     days_until_due = serializers.SerializerMethodField()
     net_gst = serializers.SerializerMethodField()
     
@@ -159,12 +191,32 @@ class GSTReturnListSerializer(serializers.ModelSerializer):
     
     def get_days_until_due(self, obj: GSTReturn) -> int:
         """Get days until due date."""
-        from datetime import date
-        return (obj.due_date - date.today()).days
+        return (obj.filing_due_date - date.today()).days
     
     def get_net_gst(self, obj: GSTReturn) -> str:
         """Get net GST amount."""
         return str(obj.box8_net_gst or Decimal("0.00"))
+    
+    def to_representation(self, obj: GSTReturn) -> dict:
+        """
+        Build the row directly instead of walking the DRF fields.
+        
+        Callers serializing many rows may pass context={"today": ...} so
+        the date is resolved once per list rather than once per row.
+        """
+        today = self.context.get("today") or date.today()
+        
+        return {
+            "id": str(obj.id),
+            "label": obj.label,
+            "period_start": obj.period_start.isoformat(),
+            "period_end": obj.period_end.isoformat(),
+            "due_date": obj.filing_due_date.isoformat(),
+            "status": obj.status,
+            "filing_frequency": obj.filing_frequency,
+            "days_until_due": (obj.filing_due_date - today).days,
+            "net_gst": str(obj.box8_net_gst or Decimal("0.00")),
+        }
 
 
 class GSTReturnDetailSerializer(serializers.ModelSerializer):
@@ -4,12 +4,13 @@ GST services for LedgerSG.
 Business logic services for GST tax codes, calculations, and returns.
 """
 
-from .tax_code_service import TaxCodeService, IRAS_TAX_CODES
+from .tax_code_service import TaxCodeService, IrasTaxCodeSpec, IRAS_TAX_CODES
 from .calculation_service import GSTCalculationService, calculate_gst_summary
 from .return_service import GSTReturnService
 
 __all__ = [
     "TaxCodeService",
+    "IrasTaxCodeSpec",
     "IRAS_TAX_CODES",
     "GSTCalculationService",
     "calculate_gst_summary",
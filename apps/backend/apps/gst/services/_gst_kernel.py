@@ -0,0 +1,103 @@
+"""
+Integer GST kernel for LedgerSG.
+
+Line GST is computed on plain integers so the hot per-line path avoids
+Decimal allocation and quantize calls. Amounts are counted in units of
+0.0001 (the precision of common.decimal_utils.money) and GST in cents.
+Callers convert to and from Decimal only at the boundary.
+"""
+
+from decimal import Decimal
+from typing import List, Sequence, Tuple
+
+
+def to_units(amount: Decimal) -> int:
+    """Convert a money() Decimal (4 dp) to an integer count of 0.0001."""
+    return int(amount.scaleb(4))
+
+
+def from_units(units: int) -> Decimal:
+    """Convert an integer count of 0.0001 back to a 4 dp Decimal."""
+    return Decimal(units).scaleb(-4)
+
+
+def from_cents(cents: int) -> Decimal:
+    """Convert an integer count of cents back to a 2 dp Decimal."""
+    return Decimal(cents).scaleb(-2)
+
+
+def scaled_rate(rate: Decimal) -> Tuple[int, int]:
+    """
+    Split a rate into an exact integer and power-of-ten scale.
+    
+    Returns (rate_int, scale) such that rate == rate_int / 10**scale.
+    """
+    scale = max(-rate.as_tuple().exponent, 0)
+    return int(rate.scaleb(scale)), scale
+
+
+def div_half_up(numerator: int, divisor: int) -> int:
+    """Integer division rounding half away from zero (ROUND_HALF_UP)."""
+    quotient, remainder = divmod(abs(numerator), divisor)
+    if remainder * 2 >= divisor:
+        quotient += 1
+    return quotient if numerator >= 0 else -quotient
+
+
+def line_gst(
+    net_units: int,
+    rate_int: int,
+    rate_scale: int,
+    is_bcrs_deposit: bool = False
+) -> Tuple[int, int, int]:
+    """
+    Calculate GST for one line in integer units.
+    
+    Args:
+        net_units: Line amount in units of 0.0001
+        rate_int: Rate numerator from scaled_rate()
+        rate_scale: Rate power-of-ten scale from scaled_rate()
+        is_bcrs_deposit: Whether this is a (GST exempt) BCRS deposit
+        
+    Returns:
+        Tuple of (net_units, gst_cents, total_units)
+    """
+    if is_bcrs_deposit or rate_int <= 0:
+        return net_units, 0, net_units
+    
+    gst_cents = div_half_up(net_units * rate_int, 10 ** (rate_scale + 2))
+    return net_units, gst_cents, net_units + gst_cents * 100
+
+
+def gst_cents_batch(
+    net_units: Sequence[int],
+    rate_ints: Sequence[int],
+    rate_scales: Sequence[int]
+) -> List[int]:
+    """
+    Calculate GST in cents for many lines (vector form of line_gst).
+    
+    Args:
+        net_units: Line amounts in units of 0.0001
+        rate_ints: Rate numerators from scaled_rate(), per line
+        rate_scales: Rate power-of-ten scales from scaled_rate(), per line
+        
+    Returns:
+        GST cents per line, in input order
+    """
+    divisors = {}
+    out = []
+    append = out.append
+    for units, rate_int, rate_scale in zip(net_units, rate_ints, rate_scales):
+        if rate_int <= 0:
+            append(0)
+            continue
+        divisor = divisors.get(rate_scale)
+        if divisor is None:
+            divisor = divisors[rate_scale] = 10 ** (rate_scale + 2)
+        product = units * rate_int
+        quotient, remainder = divmod(abs(product), divisor)
+        if remainder * 2 >= divisor:
+            quotient += 1
+        append(quotient if product >= 0 else -quotient)
+    return out
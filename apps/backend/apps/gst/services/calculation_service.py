@@ -8,12 +8,242 @@ Handles all GST calculations including:
 - Rounding per IRAS standards
 """
 
-from typing import Optional, List, Dict, Any, Tuple
+from functools import lru_cache, wraps
+from typing import Optional, List, Dict, Any, Iterable, Iterator, Tuple
 from decimal import Decimal, ROUND_HALF_UP
 from uuid import UUID
 
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Q
+
 from common.decimal_utils import money
 
+from ._gst_kernel import (
+    div_half_up,
+    from_cents,
+    from_units,
+    gst_cents_batch,
+    line_gst,
+    scaled_rate,
+    to_units,
+)
+
+
+# Cent quantize pattern, shared instead of re-parsing "0.01" per use
+_Q2 = Decimal("0.01")
+
+
+@lru_cache(maxsize=8)
+def _quant_pattern(rounding: int) -> Decimal:
+    """Return the quantize pattern for `rounding` decimal places."""
+    return Decimal((0, (1,), -rounding))
+
+
+@lru_cache(maxsize=16)
+def _inv_plus_one(rate: Decimal) -> Tuple[int, int]:
+    """
+    Return 1 / (1 + rate) as an integer (multiplier, divisor) pair.
+    
+    Scaled so that total_units * multiplier / divisor is the net amount in
+    cents; dividing with div_half_up avoids a high-precision Decimal
+    division per call and is exact for any rate.
+    """
+    rate_int, scale = scaled_rate(rate)
+    return 10 ** scale, (10 ** scale + rate_int) * 100
+
+
+@lru_cache(maxsize=32)
+def _rate_to_decimal(rate) -> Decimal:
+    """
+    Convert a line rate to Decimal, parsing each distinct rate once.
+    
+    Documents almost always repeat one or two rates across every line,
+    so the str() + Decimal parse is paid per distinct rate, not per line.
+    """
+    return rate if isinstance(rate, Decimal) else Decimal(str(rate))
+
+
+# F5 box amounts are cached per period for an hour. The key carries a
+# per-org version that the gst app's signal handlers (and bulk writers
+# that bypass signals) bump, plus the global tax code map version, so any
+# edit produces a fresh key.
+F5_CACHE_TIMEOUT = 60 * 60
+
+
+def _f5_version_key(org_id) -> str:
+    return f"gst:f5:ver:{org_id}"
+
+
+def _bump_version(key) -> None:
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, 1, None)
+
+
+def invalidate_f5_cache(org_id) -> None:
+    """
+    Invalidate cached F5 box amounts for an organisation.
+    
+    The version is bumped once the current transaction commits (at once
+    outside one): bumping earlier would let a concurrent reader cache the
+    pre-commit snapshot under the new version.
+    """
+    key = _f5_version_key(org_id)
+    transaction.on_commit(lambda: _bump_version(key))
+
+
+def _cache_f5_by_period(func):
+    """
+    Memoize F5 box amounts keyed by org, period and the F5 versions.
+    
+    refresh=True skips the cached value, recomputes and stores the result.
+    """
+    @wraps(func)
+    def wrapper(org_id, period_start, period_end, refresh=False):
+        versions = cache.get_many([_f5_version_key(org_id), _TAX_CODE_MAP_VERSION_KEY])
+        key = (
+            f"gst:f5:boxes:{org_id}:{period_start}:{period_end}:"
+            f"{versions.get(_f5_version_key(org_id), 0)}:"
+            f"{versions.get(_TAX_CODE_MAP_VERSION_KEY, 0)}"
+        )
+        
+        boxes = None if refresh else cache.get(key)
+        if boxes is None:
+            boxes = func(org_id, period_start, period_end)
+            cache.set(key, boxes, F5_CACHE_TIMEOUT)
+        return boxes
+    
+    return wrapper
+
+
+# Document statuses whose lines count towards the F5 return
+_F5_POSTED_STATUSES_SQL = "'APPROVED', 'SENT', 'PARTIALLY_PAID', 'PAID'"
+
+# F5 tax code groups: each group's tax_code ids are passed to the query
+# as a uuid[] parameter of the same name, so no tax_code JOIN is needed.
+_F5_CODE_GROUPS = {
+    "SR": "std_rated",
+    "ME": "std_rated",
+    "ZR": "zero_rated",
+    "ES": "exempt",
+    "TX-E33": "taxable_purchase",
+    "IM": "imported",
+}
+
+# Per-box conditional sums over document_line dl
+_F5_BOX_SUMS_SQL = """
+    COALESCE(SUM(CASE WHEN dl.tax_code_id = ANY(%(std_rated)s::uuid[])
+        THEN dl.line_amount ELSE 0 END), 0) AS box1,
+    COALESCE(SUM(CASE WHEN dl.tax_code_id = ANY(%(zero_rated)s::uuid[])
+        THEN dl.line_amount ELSE 0 END), 0) AS box2,
+    COALESCE(SUM(CASE WHEN dl.tax_code_id = ANY(%(exempt)s::uuid[])
+        THEN dl.line_amount ELSE 0 END), 0) AS box3,
+    COALESCE(SUM(CASE WHEN dl.tax_code_id = ANY(%(std_rated)s::uuid[])
+        THEN dl.gst_amount ELSE 0 END), 0) AS box5,
+    COALESCE(SUM(CASE WHEN dl.tax_code_id = ANY(%(taxable_purchase)s::uuid[])
+        THEN dl.line_amount ELSE 0 END), 0) AS box6,
+    COALESCE(SUM(CASE WHEN dl.tax_code_id = ANY(%(taxable_purchase)s::uuid[])
+        THEN dl.gst_amount ELSE 0 END), 0) AS box7,
+    COALESCE(SUM(CASE WHEN dl.tax_code_id = ANY(%(imported)s::uuid[])
+        THEN dl.line_amount ELSE 0 END), 0) AS box9
+"""
+
+_TAX_CODE_MAP_VERSION_KEY = "gst:f5:taxcodes:ver"
+
+
+def _tax_code_map(org_id) -> Dict[str, List[UUID]]:
+    """
+    Return the F5 tax code groups for an organisation as lists of ids.
+    
+    Covers the org's own tax codes plus global (org-less) ones. Cached in
+    the shared cache until a tax code changes (see invalidate_tax_code_map).
+    """
+    version = cache.get(_TAX_CODE_MAP_VERSION_KEY, 0)
+    key = f"gst:f5:taxcodes:{org_id}:{version}"
+    
+    groups = cache.get(key)
+    if groups is None:
+        from apps.core.models import TaxCode
+        
+        groups = {group: [] for group in _F5_CODE_GROUPS.values()}
+        rows = TaxCode.objects.filter(
+            Q(org_id=org_id) | Q(org_id__isnull=True),
+            code__in=list(_F5_CODE_GROUPS),
+        ).values_list("id", "code")
+        for tax_code_id, code in rows:
+            groups[_F5_CODE_GROUPS[code]].append(tax_code_id)
+        cache.set(key, groups, None)
+    
+    return groups
+
+
+def invalidate_tax_code_map(org_id) -> None:
+    """
+    Invalidate the cached F5 tax code groups after a tax code change.
+    
+    Cached F5 box amounts were bucketed with the old groups, so they are
+    invalidated too. Runs once the current transaction commits, like
+    invalidate_f5_cache.
+    """
+    if org_id is None:
+        # Global codes apply to every organisation; the version is part of
+        # both the group and the F5 box cache keys
+        transaction.on_commit(lambda: _bump_version(_TAX_CODE_MAP_VERSION_KEY))
+    else:
+        def drop_groups():
+            version = cache.get(_TAX_CODE_MAP_VERSION_KEY, 0)
+            cache.delete(f"gst:f5:taxcodes:{org_id}:{version}")
+        
+        transaction.on_commit(drop_groups)
+        invalidate_f5_cache(org_id)
+
+# Box columns (including derived boxes) selected from the sums subquery b
+_F5_BOX_COLUMNS_SQL = """
+    b.box1, b.box2, b.box3,
+    b.box1 + b.box2 + b.box3 AS box4,
+    b.box5, b.box6, b.box7,
+    b.box5 - b.box7 AS box8,
+    b.box9,
+    b.box1 + b.box2 + b.box3 AS box13,
+    b.box3 AS box14
+"""
+
+
+def _f5_boxes_from_row(row) -> Dict[str, Decimal]:
+    """Map a row of _F5_BOX_COLUMNS_SQL to F5 box amounts in cents."""
+    box1, box2, box3, box4, box5, box6, box7, box8, box9, box13, box14 = row
+    
+    boxes = {
+        # Output tax boxes
+        "box1": box1,  # Standard-rated supplies
+        "box2": box2,  # Zero-rated supplies
+        "box3": box3,  # Exempt supplies
+        "box4": box4,  # Total supplies (1+2+3)
+        "box5": box5,  # Output tax due
+        
+        # Input tax boxes
+        "box6": box6,  # Taxable purchases
+        "box7": box7,  # Input tax claims
+        "box8": box8,  # Net GST (5-7)
+        
+        # Additional boxes
+        "box9": box9,  # Goods imported
+        "box10": Decimal("0.00"),  # GST on imports under MG/IGDS
+        "box11": Decimal("0.00"),  # Service imports (reverse charge)
+        "box12": Decimal("0.00"),  # Output tax on reverse charge
+        "box13": box13,  # Revenue
+        "box14": box14,  # Exempt supplies (repeat)
+    }
+    
+    return {box: value.quantize(_Q2) for box, value in boxes.items()}
+
+
+def _stringify_boxes(boxes: Dict[str, Decimal]) -> Dict[str, str]:
+    """Format F5 box amounts for output."""
+    return {box: str(value) for box, value in boxes.items()}
+
 
 class GSTCalculationService:
     """Service class for GST calculations."""
@@ -55,10 +285,13 @@ class GSTCalculationService:
                 "is_bcrs_exempt": True,
             }
         
-        # Calculate GST
-        if rate and rate > 0:
+        if rounding == 2 and rate is not None:
+            # Cent rounding (the IRAS case) runs on the integer kernel
+            _, gst_cents, _ = line_gst(to_units(amount), *scaled_rate(Decimal(str(rate))))
+            gst_amount = from_cents(gst_cents)
+        elif rate and rate > 0:
             gst_amount = (amount * rate).quantize(
-                Decimal(f"0.{('0' * rounding)}1"),
+                _quant_pattern(rounding),
                 rounding=ROUND_HALF_UP
             )
         else:
@@ -73,6 +306,110 @@ class GSTCalculationService:
             "is_bcrs_exempt": False,
         }
     
+    @staticmethod
+    def calculate_lines_gst(
+        amounts: List[Decimal],
+        rates: List[Decimal],
+        bcrs_flags: List[bool]
+    ) -> List[Decimal]:
+        """
+        Calculate cent-rounded GST for many lines in one pass.
+        
+        Same per-line result as calculate_line_gst()["gst_amount"], but
+        rates are scaled once per distinct rate and the GST computed by
+        the integer batch kernel, for imports adding many lines.
+        
+        Args:
+            amounts: Line amounts (excluding GST)
+            rates: GST rate per line
+            bcrs_flags: Whether each line is a BCRS deposit
+            
+        Returns:
+            GST amount per line, in input order
+        """
+        scaled = {}
+        rate_ints = []
+        rate_scales = []
+        for rate, is_bcrs in zip(rates, bcrs_flags):
+            if rate not in scaled:
+                scaled[rate] = scaled_rate(Decimal(str(rate)))
+            rate_int, rate_scale = scaled[rate]
+            rate_ints.append(0 if is_bcrs else rate_int)
+            rate_scales.append(rate_scale)
+        
+        gst_cents = gst_cents_batch(
+            [to_units(money(amount)) for amount in amounts], rate_ints, rate_scales
+        )
+        return [from_cents(cents) for cents in gst_cents]
+    
+    @staticmethod
+    def _iter_line_gst(
+        lines: Iterable[Dict[str, Any]],
+        default_rate: Decimal = DEFAULT_GST_RATE
+    ) -> Iterator[Tuple[Dict[str, Any], int, int, int, bool]]:
+        """
+        Yield per-line GST results in integer units.
+        
+        Amounts are in units of 0.0001 (money() precision) and GST in
+        cents, so per-line IRAS rounding stays exact without allocating
+        intermediate Decimals for every line.
+        
+        Yields:
+            Tuples of (line, net_units, gst_cents, total_units, is_bcrs)
+        """
+        for line in lines:
+            is_bcrs = bool(line.get("is_bcrs_deposit", False))
+            net_units, gst_cents, total_units = line_gst(
+                to_units(money(line.get("amount", 0))),
+                *scaled_rate(_rate_to_decimal(line.get("rate", default_rate))),
+                is_bcrs_deposit=is_bcrs,
+            )
+            yield line, net_units, gst_cents, total_units, is_bcrs
+    
+    @staticmethod
+    def _line_columns(
+        lines: List[Dict[str, Any]],
+        default_rate: Decimal = DEFAULT_GST_RATE
+    ) -> Tuple[List[int], List[int], List[int], List[bool]]:
+        """
+        Split document lines into parallel integer columns.
+        
+        BCRS deposit lines get a zero rate so gst_cents_batch() leaves
+        them untaxed; the flag column is kept for the exempt total.
+        
+        Returns:
+            Tuple of (net_units, rate_ints, rate_scales, is_bcrs) lists
+        """
+        net_units = []
+        rate_ints = []
+        rate_scales = []
+        bcrs_flags = []
+        
+        for line in lines:
+            is_bcrs = bool(line.get("is_bcrs_deposit", False))
+            rate_int, rate_scale = scaled_rate(
+                _rate_to_decimal(line.get("rate", default_rate))
+            )
+            net_units.append(to_units(money(line.get("amount", 0))))
+            rate_ints.append(0 if is_bcrs else rate_int)
+            rate_scales.append(rate_scale)
+            bcrs_flags.append(is_bcrs)
+        
+        return net_units, rate_ints, rate_scales, bcrs_flags
+    
+    @staticmethod
+    def _summarize(total_net: int, total_gst: int, bcrs_total: int) -> Dict[str, str]:
+        """Build the document summary from integer totals."""
+        total_amount = total_net + total_gst * 100
+        
+        return {
+            "total_net": str(from_units(total_net).quantize(_Q2)),
+            "total_gst": str(from_cents(total_gst).quantize(_Q2)),
+            "total_amount": str(from_units(total_amount).quantize(_Q2)),
+            "bcrs_exempt_total": str(from_units(bcrs_total).quantize(_Q2)),
+            "taxable_amount": str(from_units(total_net - bcrs_total).quantize(_Q2)),
+        }
+    
     @staticmethod
     def calculate_document_gst(
         lines: List[Dict[str, Any]],
@@ -91,50 +428,95 @@ class GSTCalculationService:
         Returns:
             Document totals with breakdown
         """
-        total_net = Decimal("0.00")
-        total_gst = Decimal("0.00")
-        total_amount = Decimal("0.00")
-        bcrs_total = Decimal("0.00")
+        net_units, rate_ints, rate_scales, bcrs_flags = (
+            GSTCalculationService._line_columns(lines, default_rate)
+        )
+        gst_cents = gst_cents_batch(net_units, rate_ints, rate_scales)
         
-        line_results = []
+        total_net = sum(net_units)
+        total_gst = sum(gst_cents)
+        bcrs_total = sum(
+            units for units, is_bcrs in zip(net_units, bcrs_flags) if is_bcrs
+        )
         
-        for line in lines:
-            amount = money(line.get("amount", 0))
-            rate = Decimal(str(line.get("rate", default_rate)))
-            is_bcrs = line.get("is_bcrs_deposit", False)
-            
-            result = GSTCalculationService.calculate_line_gst(
-                amount=amount,
-                rate=rate,
-                is_bcrs_deposit=is_bcrs
-            )
-            
-            line_results.append({
+        line_results = [
+            {
                 "line_id": line.get("id"),
-                "net_amount": str(result["net_amount"]),
-                "gst_amount": str(result["gst_amount"]),
-                "total_amount": str(result["total_amount"]),
-                "is_bcrs_exempt": result["is_bcrs_exempt"],
-            })
-            
-            total_net += result["net_amount"]
-            total_gst += result["gst_amount"]
-            total_amount += result["total_amount"]
-            
-            if result["is_bcrs_exempt"]:
-                bcrs_total += result["net_amount"]
+                "net_amount": str(from_units(units)),
+                "gst_amount": str(from_cents(cents)),
+                "total_amount": str(from_units(units + cents * 100)),
+                "is_bcrs_exempt": is_bcrs,
+            }
+            for line, units, cents, is_bcrs in zip(lines, net_units, gst_cents, bcrs_flags)
+        ]
         
         return {
             "lines": line_results,
-            "summary": {
-                "total_net": str(total_net.quantize(Decimal("0.01"))),
-                "total_gst": str(total_gst.quantize(Decimal("0.01"))),
-                "total_amount": str(total_amount.quantize(Decimal("0.01"))),
-                "bcrs_exempt_total": str(bcrs_total.quantize(Decimal("0.01"))),
-                "taxable_amount": str((total_net - bcrs_total).quantize(Decimal("0.01"))),
-            }
+            "summary": GSTCalculationService._summarize(total_net, total_gst, bcrs_total),
         }
     
+    @staticmethod
+    def calculate_document_summary(
+        lines: Iterable[Dict[str, Any]],
+        default_rate: Decimal = DEFAULT_GST_RATE
+    ) -> Dict[str, str]:
+        """
+        Calculate only the document GST summary.
+        
+        Same totals as calculate_document_gst()["summary"], but no
+        per-line results are built, so memory stays constant and `lines`
+        may be any iterable (e.g. a queryset iterator).
+        
+        Args:
+            lines: Line dictionaries (see calculate_document_gst)
+            default_rate: Default GST rate if not specified per line
+            
+        Returns:
+            Document summary
+        """
+        total_net = 0
+        total_gst = 0
+        bcrs_total = 0
+        
+        for _, net_units, gst_cents, _, is_bcrs in (
+            GSTCalculationService._iter_line_gst(lines, default_rate)
+        ):
+            total_net += net_units
+            total_gst += gst_cents
+            
+            if is_bcrs:
+                bcrs_total += net_units
+        
+        return GSTCalculationService._summarize(total_net, total_gst, bcrs_total)
+    
+    @staticmethod
+    def calculate_document_gst_lines(
+        lines: Iterable[Dict[str, Any]],
+        default_rate: Decimal = DEFAULT_GST_RATE
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily calculate GST for each line of a document.
+        
+        Amounts are yielded as Decimals; stringify them at the API layer.
+        
+        Args:
+            lines: Line dictionaries (see calculate_document_gst)
+            default_rate: Default GST rate if not specified per line
+            
+        Yields:
+            Per-line dictionaries with net, GST and total amounts
+        """
+        for line, net_units, gst_cents, total_units, is_bcrs in (
+            GSTCalculationService._iter_line_gst(lines, default_rate)
+        ):
+            yield {
+                "line_id": line.get("id"),
+                "net_amount": from_units(net_units),
+                "gst_amount": from_cents(gst_cents),
+                "total_amount": from_units(total_units),
+                "is_bcrs_exempt": is_bcrs,
+            }
+    
     @staticmethod
     def calculate_tax_inclusive_gst(
         total_amount: Decimal,
@@ -163,17 +545,17 @@ class GSTCalculationService:
                 "total_amount": total_amount,
             }
         
-        # Calculate net amount
-        net_amount = (total_amount / (1 + rate)).quantize(
-            Decimal("0.01"),
-            rounding=ROUND_HALF_UP
+        # Net = Total / (1 + rate), as an exact integer ratio rounded HALF_UP
+        multiplier, divisor = _inv_plus_one(rate)
+        net_amount = from_cents(
+            div_half_up(to_units(total_amount) * multiplier, divisor)
         )
         
         gst_amount = total_amount - net_amount
         
         return {
             "net_amount": net_amount,
-            "gst_amount": gst_amount.quantize(Decimal("0.01")),
+            "gst_amount": gst_amount.quantize(_Q2),
             "total_amount": total_amount,
         }
     
@@ -181,7 +563,7 @@ class GSTCalculationService:
     def validate_gst_precision(
         calculated_gst: Decimal,
         expected_gst: Decimal,
-        tolerance: Decimal = Decimal("0.01")
+        tolerance: Decimal = _Q2
     ) -> bool:
         """
         Validate GST calculation matches expected within tolerance.
@@ -193,11 +575,16 @@ class GSTCalculationService:
             expected_gst: Expected GST amount
             tolerance: Allowed difference (default: 0.01)
             
+        Inputs are assumed to already be rounded to cents; the comparison
+        is done on integer cents.
+        
         Returns:
             True if within tolerance
         """
-        diff = abs(calculated_gst - expected_gst)
-        return diff <= tolerance
+        calculated_cents = int(calculated_gst.scaleb(2).to_integral_value())
+        expected_cents = int(expected_gst.scaleb(2).to_integral_value())
+        tolerance_cents = int(tolerance.scaleb(2).to_integral_value())
+        return abs(calculated_cents - expected_cents) <= tolerance_cents
     
     @staticmethod
     def get_f5_box_amounts(
@@ -206,9 +593,10 @@ class GSTCalculationService:
         period_end: str
     ) -> Dict[str, Any]:
         """
-        Calculate F5 form box amounts for a period.
+        Calculate F5 form box amounts for a period, formatted as strings.
         
-        This queries the database for aggregated amounts by tax code.
+        See get_f5_box_amounts_decimal(); internal callers that store the
+        amounts should use that directly and skip the str round-trip.
         
         Args:
             org_id: Organisation ID
@@ -218,92 +606,119 @@ class GSTCalculationService:
         Returns:
             F5 box amounts dictionary
         """
+        return _stringify_boxes(
+            GSTCalculationService.get_f5_box_amounts_decimal(
+                org_id, period_start, period_end
+            )
+        )
+    
+    @staticmethod
+    @_cache_f5_by_period
+    def get_f5_box_amounts_decimal(
+        org_id: UUID,
+        period_start: str,
+        period_end: str
+    ) -> Dict[str, Decimal]:
+        """
+        Calculate F5 form box amounts for a period.
+        
+        Box bucketing is done by conditional aggregation in the database,
+        so the query returns a single row of box totals regardless of how
+        many tax codes were used in the period. The posted-document date
+        range is served by idx_document_org_date_posted and the line sums
+        by idx_docline_f5_compute (see database_schema.sql). Results are
+        cached until a document in the period changes.
+        
+        Args:
+            org_id: Organisation ID
+            period_start: Period start date (YYYY-MM-DD)
+            period_end: Period end date (YYYY-MM-DD)
+            
+        Returns:
+            F5 box amounts dictionary of Decimals rounded to cents
+        """
         from django.db import connection
         
         with connection.cursor() as cursor:
             cursor.execute(
-                """
-                SELECT 
-                    tc.code as tax_code,
-                    tc.box_mapping,
-                    SUM(il.amount) as total_amount,
-                    SUM(il.gst_amount) as total_gst,
-                    COUNT(*) as line_count
-                FROM invoicing.invoice_line il
-                JOIN invoicing.invoice i ON i.id = il.invoice_id
-                JOIN gst.tax_code tc ON tc.id = il.tax_code_id
-                WHERE i.org_id = %s
-                    AND i.document_date BETWEEN %s AND %s
-                    AND i.status IN ('APPROVED', 'SENT', 'PAID_PARTIAL', 'PAID')
-                    AND NOT il.is_voided
-                GROUP BY tc.code, tc.box_mapping
+                f"""
+                SELECT {_F5_BOX_COLUMNS_SQL}
+                FROM (
+                    SELECT {_F5_BOX_SUMS_SQL}
+                    FROM invoicing.document_line dl
+                    JOIN invoicing.document d ON d.id = dl.document_id
+                    WHERE d.org_id = %(org_id)s
+                        AND d.document_date BETWEEN %(period_start)s AND %(period_end)s
+                        AND d.status IN ({_F5_POSTED_STATUSES_SQL})
+                ) b
                 """,
-                [str(org_id), period_start, period_end]
+                {
+                    "org_id": str(org_id),
+                    "period_start": period_start,
+                    "period_end": period_end,
+                    **_tax_code_map(org_id),
+                }
             )
             
-            results = cursor.fetchall()
-        
-        # Initialize all boxes
-        boxes = {
-            # Output tax boxes
-            "box1": Decimal("0.00"),  # Standard-rated supplies
-            "box2": Decimal("0.00"),  # Zero-rated supplies
-            "box3": Decimal("0.00"),  # Exempt supplies
-            "box4": Decimal("0.00"),  # Total supplies (1+2+3)
-            "box5": Decimal("0.00"),  # Output tax due
-            
-            # Input tax boxes
-            "box6": Decimal("0.00"),  # Taxable purchases
-            "box7": Decimal("0.00"),  # Input tax claims
-            "box8": Decimal("0.00"),  # Net GST (5-7)
+            row = cursor.fetchone()
+        
+        return _f5_boxes_from_row(row)
+    
+    @staticmethod
+    def get_f5_box_amounts_bulk(
+        org_id: UUID,
+        periods: List[Tuple[str, str]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Calculate F5 box amounts for many periods in one query.
+        
+        Intended for bulk recalculation jobs: the period bounds are passed
+        as arrays and unnested, so the documents are scanned once and
+        aggregated per period instead of one query per return.
+        
+        Args:
+            org_id: Organisation ID
+            periods: List of (period_start, period_end) dates (YYYY-MM-DD)
             
-            # Additional boxes
-            "box9": Decimal("0.00"),  # Goods imported
-            "box10": Decimal("0.00"),  # GST on imports under MG/IGDS
-            "box11": Decimal("0.00"),  # Service imports (reverse charge)
-            "box12": Decimal("0.00"),  # Output tax on reverse charge
-            "box13": Decimal("0.00"),  # Revenue
-            "box14": Decimal("0.00"),  # Exempt supplies (repeat)
-        }
+        Returns:
+            F5 box amounts dictionaries, in the same order as `periods`
+        """
+        from django.db import connection
+        
+        if not periods:
+            return []
         
-        # Aggregate by box mapping
-        for row in results:
-            tax_code, box_mapping, amount, gst_amount, count = row
-            amount = Decimal(str(amount or 0))
-            gst_amount = Decimal(str(gst_amount or 0))
+        starts = [start for start, _ in periods]
+        ends = [end for _, end in periods]
+        
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"""
+                SELECT b.idx, {_F5_BOX_COLUMNS_SQL}
+                FROM (
+                    SELECT p.idx, {_F5_BOX_SUMS_SQL}
+                    FROM unnest(%(starts)s::date[], %(ends)s::date[])
+                        WITH ORDINALITY AS p(ps, pe, idx)
+                    LEFT JOIN invoicing.document d
+                        ON d.org_id = %(org_id)s
+                        AND d.document_date BETWEEN p.ps AND p.pe
+                        AND d.status IN ({_F5_POSTED_STATUSES_SQL})
+                    LEFT JOIN invoicing.document_line dl ON dl.document_id = d.id
+                    GROUP BY p.idx
+                ) b
+                ORDER BY b.idx
+                """,
+                {
+                    "starts": starts,
+                    "ends": ends,
+                    "org_id": str(org_id),
+                    **_tax_code_map(org_id),
+                }
+            )
             
-            if box_mapping and box_mapping in boxes:
-                if tax_code in ["SR", "ME"]:
-                    # Standard-rated: add to Box 1 and Box 5
-                    boxes["box1"] += amount
-                    boxes["box5"] += gst_amount
-                    boxes["box13"] += amount
-                elif tax_code == "ZR":
-                    # Zero-rated: Box 2
-                    boxes["box2"] += amount
-                    boxes["box13"] += amount
-                elif tax_code == "ES":
-                    # Exempt: Box 3 and 14
-                    boxes["box3"] += amount
-                    boxes["box14"] += amount
-                    boxes["box13"] += amount
-                elif tax_code == "IM":
-                    # Import: Box 9
-                    boxes["box9"] += amount
-                elif tax_code == "TX-E33":
-                    # Purchase with GST: Box 6 and 7
-                    boxes["box6"] += amount
-                    boxes["box7"] += gst_amount
-        
-        # Calculate derived boxes
-        boxes["box4"] = boxes["box1"] + boxes["box2"] + boxes["box3"]
-        boxes["box8"] = boxes["box5"] - boxes["box7"]
-        
-        # Format for output
-        return {
-            box: str(value.quantize(Decimal("0.01")))
-            for box, value in boxes.items()
-        }
+            rows = cursor.fetchall()
+        
+        return [_stringify_boxes(_f5_boxes_from_row(row[1:])) for row in rows]
 
 
 def calculate_gst_summary(
@@ -4,19 +4,86 @@ GST Return service for LedgerSG.
 Handles GST return periods and F5 form generation.
 """
 
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Sequence
 from decimal import Decimal
 from uuid import UUID
 from datetime import date, timedelta
 from calendar import monthrange
 
-from django.db import connection, transaction
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
 
 from apps.core.models import GSTReturn, FiscalPeriod
 from apps.gst.services.calculation_service import GSTCalculationService
 from common.exceptions import ValidationError, DuplicateResource, ResourceNotFound
 
 
+# Box columns a filer may override; box8 is generated by the database
+_BOX_FIELDS = frozenset(
+    field.name for field in GSTReturn._meta.concrete_fields
+    if field.name.startswith("box") and not field.generated
+)
+
+# Calculated F5 boxes (GSTCalculationService numbering) and the gst.return
+# columns they are stored in. box8 is generated by the database.
+_F5_BOX_COLUMNS = (
+    ("box1", "box1_std_rated_supplies"),
+    ("box2", "box2_zero_rated_supplies"),
+    ("box3", "box3_exempt_supplies"),
+    ("box4", "box4_total_supplies"),
+    ("box5", "box6_output_tax"),
+    ("box6", "box5_total_taxable_purchases"),
+    ("box7", "box7_input_tax_claimable"),
+    ("box13", "box13_total_revenue"),
+)
+
+# F5 JSON box keys, in box order (box8 is generated by the database)
+_F5_JSON_BOXES = tuple(
+    field.name for field in GSTReturn._meta.concrete_fields
+    if field.name.startswith("box")
+)
+
+# Most deadlines returned to the dashboard widget
+UPCOMING_DEADLINES_LIMIT = 50
+
+# Columns read by GSTReturnListSerializer; list endpoints load only these
+_RETURN_LIST_FIELDS = (
+    "id", "org_id", "return_type", "period_start", "period_end",
+    "filing_due_date", "status", "box8_net_gst",
+)
+
+
+def _add_months(first_of_month: date, months: int) -> date:
+    """Shift a first-of-month date by a number of months."""
+    index = first_of_month.year * 12 + first_of_month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _month_end(day: date) -> date:
+    """Return the last day of the month containing `day`."""
+    return day.replace(day=monthrange(day.year, day.month)[1])
+
+
+def _build_f5_json(gst_return: GSTReturn) -> Dict[str, Any]:
+    """Build the F5 JSON payload from the gst.return columns."""
+    return {
+        "id": str(gst_return.id),
+        "return_type": gst_return.return_type,
+        "label": gst_return.label,
+        "period_start": gst_return.period_start.isoformat(),
+        "period_end": gst_return.period_end.isoformat(),
+        "due_date": gst_return.filing_due_date.isoformat(),
+        "status": gst_return.status,
+        "filing_frequency": gst_return.filing_frequency,
+        "boxes": {box: str(getattr(gst_return, box) or 0) for box in _F5_JSON_BOXES},
+        "filing": {
+            "filed_at": gst_return.filed_at.isoformat() if gst_return.filed_at else None,
+            "filed_by": str(gst_return.filed_by_id) if gst_return.filed_by_id else None,
+            "filing_reference": gst_return.iras_confirmation or None,
+        },
+    }
+
+
 class GSTReturnService:
     """Service class for GST return operations."""
     
@@ -37,30 +104,68 @@ class GSTReturnService:
         Returns:
             List of GSTReturn instances
         """
-        queryset = GSTReturn.objects.filter(org_id=org_id)
+        queryset = GSTReturn.objects.filter(org_id=org_id).only(*_RETURN_LIST_FIELDS)
         
         if status:
             queryset = queryset.filter(status=status)
         
         if year:
-            queryset = queryset.filter(period_start__year=year)
+            # Half-open range so idx_gst_return_org (org_id, period_start)
+            # serves the filter as an index range scan
+            queryset = queryset.filter(
+                period_start__gte=date(year, 1, 1),
+                period_start__lt=date(year + 1, 1, 1),
+            )
         
         return list(queryset.order_by("-period_start"))
     
     @staticmethod
-    def get_return(org_id: UUID, return_id: UUID) -> GSTReturn:
+    def get_return(
+        org_id: UUID,
+        return_id: UUID,
+        fields: Optional[Sequence[str]] = None
+    ) -> GSTReturn:
         """
         Get GST return by ID.
         
         Args:
             org_id: Organisation ID
             return_id: GST return ID
+            fields: Only load these columns (default: the full row). Use
+                for status checks that never touch the box amounts.
             
         Returns:
             GSTReturn instance
         """
+        queryset = GSTReturn.objects.all()
+        if fields:
+            queryset = queryset.only(*fields)
+        
         try:
-            return GSTReturn.objects.get(id=return_id, org_id=org_id)
+            return queryset.get(id=return_id, org_id=org_id)
+        except GSTReturn.DoesNotExist:
+            raise ResourceNotFound(f"GST return {return_id} not found")
+    
+    @staticmethod
+    def _get_return_locked(org_id: UUID, return_id: UUID) -> GSTReturn:
+        """
+        Get GST return by ID, locking its row for the current transaction.
+        
+        Must be called inside transaction.atomic(). Only the return row is
+        locked (of=("self",)), never joined rows. Read-only paths should
+        use get_return().
+        
+        Args:
+            org_id: Organisation ID
+            return_id: GST return ID
+            
+        Returns:
+            Locked GSTReturn instance
+        """
+        try:
+            return GSTReturn.objects.select_for_update(of=("self",)).get(
+                id=return_id, org_id=org_id
+            )
         except GSTReturn.DoesNotExist:
             raise ResourceNotFound(f"GST return {return_id} not found")
     
@@ -81,82 +186,71 @@ class GSTReturnService:
             periods: Number of periods to create
             
         Returns:
-            List of created GSTReturn instances
+            List of created GSTReturn instances (periods that already
+            existed are skipped and not returned)
         """
         if filing_frequency not in ["MONTHLY", "QUARTERLY"]:
             raise ValidationError("Filing frequency must be MONTHLY or QUARTERLY")
         
-        created = []
-        current_date = start_date
-        
-        for _ in range(periods):
-            if filing_frequency == "MONTHLY":
-                # Monthly period
-                period_start = current_date.replace(day=1)
-                last_day = monthrange(current_date.year, current_date.month)[1]
-                period_end = current_date.replace(day=last_day)
-                label = period_start.strftime("%b %Y")
-                
-                # Due date is last day of following month
-                if current_date.month == 12:
-                    due_date = date(current_date.year + 1, 1, 31)
-                else:
-                    due_date = date(current_date.year, current_date.month + 1, 1)
-                    last_day_next = monthrange(due_date.year, due_date.month)[1]
-                    due_date = due_date.replace(day=last_day_next)
-                
-                # Move to next month
-                if current_date.month == 12:
-                    current_date = date(current_date.year + 1, 1, 1)
-                else:
-                    current_date = date(current_date.year, current_date.month + 1, 1)
-                
-            else:  # QUARTERLY
-                # Quarterly period
-                quarter = (current_date.month - 1) // 3
-                quarter_start_month = quarter * 3 + 1
-                period_start = date(current_date.year, quarter_start_month, 1)
-                
-                quarter_end_month = quarter_start_month + 2
-                last_day = monthrange(current_date.year, quarter_end_month)[1]
-                period_end = date(current_date.year, quarter_end_month, last_day)
-                
-                label = f"Q{quarter + 1} {current_date.year}"
-                
-                # Due date is last day of month following quarter end
-                if quarter_end_month == 12:
-                    due_date = date(current_date.year + 1, 1, 31)
-                else:
-                    due_month = quarter_end_month + 1
-                    last_day_due = monthrange(current_date.year, due_month)[1]
-                    due_date = date(current_date.year, due_month, last_day_due)
-                
-                # Move to next quarter
-                if quarter == 3:
-                    current_date = date(current_date.year + 1, 1, 1)
-                else:
-                    current_date = date(current_date.year, (quarter + 1) * 3 + 1, 1)
+        step = 1 if filing_frequency == "MONTHLY" else 3
+        
+        # First period starts at the month (or quarter) containing start_date
+        first_month = start_date.month - (start_date.month - 1) % step
+        first_start = date(start_date.year, first_month, 1)
+        
+        planned = []
+        for i in range(periods):
+            period_start = _add_months(first_start, step * i)
+            period_end = _month_end(_add_months(period_start, step - 1))
             
-            # Check if period already exists
-            if GSTReturn.objects.filter(
-                org_id=org_id,
-                period_start=period_start,
-                period_end=period_end
-            ).exists():
-                continue
+            # Due date is last day of the month following period end
+            filing_due_date = _month_end(_add_months(period_start, step))
             
-            gst_return = GSTReturn.objects.create(
-                org_id=org_id,
-                period_start=period_start,
-                period_end=period_end,
-                due_date=due_date,
-                filing_frequency=filing_frequency,
-                label=label,
-                status="DRAFT",
+            planned.append((period_start, period_end, filing_due_date))
+        
+        if not planned:
+            return []
+        
+        def build_missing():
+            # One SELECT for periods that already exist instead of one per period
+            existing = set(
+                GSTReturn.objects.filter(
+                    org_id=org_id,
+                    return_type="F5",
+                    period_start__in=[p[0] for p in planned],
+                ).values_list("period_start", "period_end")
             )
-            created.append(gst_return)
+            return [
+                GSTReturn(
+                    org_id=org_id,
+                    return_type="F5",
+                    period_start=period_start,
+                    period_end=period_end,
+                    filing_due_date=filing_due_date,
+                    status="DRAFT",
+                )
+                for period_start, period_end, filing_due_date in planned
+                if (period_start, period_end) not in existing
+            ]
         
-        return created
+        to_create = build_missing()
+        try:
+            with transaction.atomic():
+                return GSTReturn.objects.bulk_create(to_create, batch_size=100)
+        except IntegrityError:
+            # A concurrent request created some of the same periods after our
+            # SELECT; re-plan, and let the unique (org, return_type,
+            # period_start, period_end) key drop any still racing
+            to_create = build_missing()
+            GSTReturn.objects.bulk_create(to_create, batch_size=100, ignore_conflicts=True)
+            # ignore_conflicts leaves primary keys unset; read the rows back
+            return list(
+                GSTReturn.objects.filter(
+                    org_id=org_id,
+                    return_type="F5",
+                    period_start__in=[r.period_start for r in to_create],
+                ).order_by("period_start")
+            )
     
     @staticmethod
     def generate_f5(
@@ -184,26 +278,19 @@ class GSTReturnService:
                 "Use force_recalculate=true to override."
             )
         
-        # Get box amounts
-        boxes = GSTCalculationService.get_f5_box_amounts(
+        # Get box amounts; a forced recalculation bypasses the F5 cache
+        boxes = GSTCalculationService.get_f5_box_amounts_decimal(
             org_id=org_id,
             period_start=gst_return.period_start.isoformat(),
-            period_end=gst_return.period_end.isoformat()
+            period_end=gst_return.period_end.isoformat(),
+            refresh=force_recalculate,
         )
         
         # Update GST return
-        gst_return.box1_std_rated_supplies = Decimal(boxes["box1"])
-        gst_return.box2_zero_rated_supplies = Decimal(boxes["box2"])
-        gst_return.box3_exempt_supplies = Decimal(boxes["box3"])
-        gst_return.box4_total_supplies = Decimal(boxes["box4"])
-        gst_return.box5_output_tax = Decimal(boxes["box5"])
-        gst_return.box6_taxable_purchases = Decimal(boxes["box6"])
-        gst_return.box7_input_tax = Decimal(boxes["box7"])
-        gst_return.box8_net_gst = Decimal(boxes["box8"])
-        gst_return.box13_revenue = Decimal(boxes["box13"])
-        gst_return.box14_exempt_supplies = Decimal(boxes["box14"])
-        
-        gst_return.save()
+        for box, field in _F5_BOX_COLUMNS:
+            setattr(gst_return, field, boxes[box])
+        
+        gst_return.save(update_fields=[field for _, field in _F5_BOX_COLUMNS])
         
         return gst_return
     
@@ -229,31 +316,32 @@ class GSTReturnService:
             Filed GSTReturn instance
         """
         with transaction.atomic():
-            gst_return = GSTReturnService.get_return(org_id, return_id)
+            gst_return = GSTReturnService._get_return_locked(org_id, return_id)
             
             if gst_return.status not in ["DRAFT", "AMENDING"]:
                 raise ValidationError(
                     f"Cannot file return with status '{gst_return.status}'"
                 )
             
+            update_fields = ["status", "filed_at", "filed_by"]
+            
             # Apply box overrides if provided
             if boxes:
                 for box_name, value in boxes.items():
-                    if hasattr(gst_return, box_name):
+                    if box_name in _BOX_FIELDS:
                         setattr(gst_return, box_name, value)
-            
-            # Recalculate net GST
-            gst_return.box8_net_gst = (
-                gst_return.box5_output_tax - gst_return.box7_input_tax
-            )
+                        update_fields.append(box_name)
             
             # Update status
             gst_return.status = "FILED"
             gst_return.filed_at = timezone.now()
             gst_return.filed_by_id = filed_by_id
-            gst_return.filing_reference = filing_reference
+            if filing_reference:
+                # The IRAS reference is stored in gst.return.iras_confirmation
+                gst_return.iras_confirmation = filing_reference
+                update_fields.append("iras_confirmation")
             
-            gst_return.save()
+            gst_return.save(update_fields=update_fields)
             
             return gst_return
     
@@ -280,8 +368,12 @@ class GSTReturnService:
             raise ValidationError("Only filed returns can be amended")
         
         gst_return.status = "AMENDING"
-        gst_return.amendment_reason = reason
-        gst_return.save()
+        # gst.return has no amendment column; keep the reason in the notes
+        amendment_note = f"Amendment reason: {reason}"
+        gst_return.notes = (
+            f"{gst_return.notes}\n{amendment_note}" if gst_return.notes else amendment_note
+        )
+        gst_return.save(update_fields=["status", "notes"])
         
         return gst_return
     
@@ -306,20 +398,22 @@ class GSTReturnService:
         Returns:
             Updated GSTReturn instance
         """
-        gst_return = GSTReturnService.get_return(org_id, return_id)
-        
-        if gst_return.status != "FILED":
-            raise ValidationError("Only filed returns can be paid")
-        
-        gst_return.paid_at = payment_date
-        gst_return.payment_amount = payment_amount
-        gst_return.payment_reference = payment_reference
-        
-        # Check if fully paid
-        if abs(payment_amount - gst_return.box8_net_gst) < Decimal("0.01"):
-            gst_return.status = "PAID"
-        
-        gst_return.save()
+        with transaction.atomic():
+            gst_return = GSTReturnService._get_return_locked(org_id, return_id)
+            
+            if gst_return.status != "FILED":
+                raise ValidationError("Only filed returns can be paid")
+            
+            gst_return.paid_at = payment_date
+            gst_return.payment_amount = payment_amount
+            gst_return.payment_reference = payment_reference
+            
+            # Check if fully paid
+            if abs(payment_amount - gst_return.box8_net_gst) < Decimal("0.01"):
+                gst_return.status = "PAID"
+            
+            # Payment details are not columns on gst.return; only status is stored
+            gst_return.save(update_fields=["status"])
         
         return gst_return
     
@@ -337,42 +431,7 @@ class GSTReturnService:
         """
         gst_return = GSTReturnService.get_return(org_id, return_id)
         
-        return {
-            "id": str(gst_return.id),
-            "label": gst_return.label,
-            "period_start": gst_return.period_start.isoformat(),
-            "period_end": gst_return.period_end.isoformat(),
-            "due_date": gst_return.due_date.isoformat(),
-            "status": gst_return.status,
-            "filing_frequency": gst_return.filing_frequency,
-            "boxes": {
-                "box1_standard_rated_supplies": str(gst_return.box1_std_rated_supplies),
-                "box2_zero_rated_supplies": str(gst_return.box2_zero_rated_supplies),
-                "box3_exempt_supplies": str(gst_return.box3_exempt_supplies),
-                "box4_total_supplies": str(gst_return.box4_total_supplies),
-                "box5_output_tax": str(gst_return.box5_output_tax),
-                "box6_taxable_purchases": str(gst_return.box6_taxable_purchases),
-                "box7_input_tax": str(gst_return.box7_input_tax),
-                "box8_net_gst": str(gst_return.box8_net_gst),
-                "box9_goods_imported": str(gst_return.box9_goods_imported or 0),
-                "box10_gst_imports_mg_igds": str(gst_return.box10_gst_imports_mg_igds or 0),
-                "box11_service_imports": str(gst_return.box11_service_imports or 0),
-                "box12_output_tax_reverse_charge": str(gst_return.box12_output_tax_reverse_charge or 0),
-                "box13_revenue": str(gst_return.box13_revenue),
-                "box14_exempt_supplies": str(gst_return.box14_exempt_supplies),
-                "box15_imports_exports_indicator": gst_return.box15_indicator or "N",
-            },
-            "filing": {
-                "filed_at": gst_return.filed_at.isoformat() if gst_return.filed_at else None,
-                "filed_by": str(gst_return.filed_by_id) if gst_return.filed_by_id else None,
-                "filing_reference": gst_return.filing_reference,
-            },
-            "payment": {
-                "paid_at": gst_return.paid_at.isoformat() if gst_return.paid_at else None,
-                "payment_amount": str(gst_return.payment_amount) if gst_return.payment_amount else None,
-                "payment_reference": gst_return.payment_reference,
-            },
-        }
+        return _build_f5_json(gst_return)
     
     @staticmethod
     def get_upcoming_deadlines(
@@ -387,18 +446,16 @@ class GSTReturnService:
             days: Number of days to look ahead
             
         Returns:
-            List of GSTReturn instances with upcoming deadlines
+            List of GSTReturn instances with upcoming deadlines, soonest
+            first and capped at UPCOMING_DEADLINES_LIMIT
         """
         today = date.today()
         deadline = today + timedelta(days=days)
         
+        # Served by idx_gst_return_draft_due (org_id, filing_due_date) WHERE DRAFT
         return list(GSTReturn.objects.filter(
             org_id=org_id,
             status="DRAFT",
-            due_date__lte=deadline,
-            due_date__gte=today
-        ).order_by("due_date"))
-
-
-# Import at end to avoid circular imports
-from django.utils import timezone
+            filing_due_date__lte=deadline,
+            filing_due_date__gte=today
+        ).only(*_RETURN_LIST_FIELDS).order_by("filing_due_date")[:UPCOMING_DEADLINES_LIMIT])
@@ -8,75 +8,268 @@ Manages GST tax codes including:
 - Getting current GST rate
 """
 
-from typing import Optional, List, Dict, Any
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Optional, List, Dict, Any, Iterable, Mapping
 from decimal import Decimal
 from uuid import UUID
 from datetime import date
 
+from django.core.cache import cache
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Max
+from django.utils import timezone
+
 from apps.core.models import TaxCode
+from common.db.routers import read_db
+from common.decimal_utils import money
+from common.middleware.request_memo import request_memo
 from common.exceptions import ValidationError, DuplicateResource, ResourceNotFound
 
+from ._gst_kernel import from_cents, gst_cents_batch, scaled_rate, to_units
+from .calculation_service import invalidate_tax_code_map
+
+
+@dataclass(frozen=True, slots=True)
+class IrasTaxCodeSpec:
+    """Definition of an IRAS-defined (seeded) tax code."""
+    
+    code: str
+    name: str
+    rate: Optional[Decimal]
+    is_gst_charged: bool
+    description: str
+    box_mapping: Optional[str]
+    is_bcrs_exempt: bool = False
+
 
 # IRAS-defined tax codes (seeded)
-IRAS_TAX_CODES = {
-    "SR": {
-        "name": "Standard-Rated",
-        "rate": Decimal("0.09"),  # 9% GST
-        "is_gst_charged": True,
-        "description": "Standard-rated supplies (9% GST)",
-        "box_mapping": "box1",  # F5 Box 1
-    },
-    "ZR": {
-        "name": "Zero-Rated",
-        "rate": Decimal("0.00"),  # 0% GST
-        "is_gst_charged": True,
-        "description": "Zero-rated supplies (exports, international services)",
-        "box_mapping": "box2",  # F5 Box 2
-    },
-    "ES": {
-        "name": "Exempt",
-        "rate": None,  # No GST
-        "is_gst_charged": False,
-        "description": "Exempt supplies (financial services, residential rent)",
-        "box_mapping": "box3",  # F5 Box 3
-    },
-    "OS": {
-        "name": "Out-of-Scope",
-        "rate": None,  # No GST
-        "is_gst_charged": False,
-        "description": "Out-of-scope supplies (asset sales, private transactions)",
-        "box_mapping": None,  # Not reported
-    },
-    "IM": {
-        "name": "Import",
-        "rate": Decimal("0.09"),  # 9% GST
-        "is_gst_charged": True,
-        "description": "Imported goods",
-        "box_mapping": "box9",  # F5 Box 9
-    },
-    "ME": {
-        "name": "Metered",
-        "rate": Decimal("0.09"),  # 9% GST
-        "is_gst_charged": True,
-        "description": "Metered services (utilities with special rules)",
-        "box_mapping": "box1",  # F5 Box 1
-    },
-    "TX-E33": {
-        "name": "Purchase with GST",
-        "rate": Decimal("0.09"),
-        "is_gst_charged": True,
-        "description": "Purchase with GST incurred",
-        "box_mapping": "box6",  # F5 Box 6
-    },
-    "BL": {
-        "name": "BCRS Deposit",
-        "rate": Decimal("0.00"),
-        "is_gst_charged": False,
-        "description": "Beverage container deposit (GST exempt)",
-        "box_mapping": None,
-        "is_bcrs_exempt": True,
-    },
-}
+IRAS_TAX_CODE_SPECS = (
+    IrasTaxCodeSpec(
+        code="SR",
+        name="Standard-Rated",
+        rate=Decimal("0.09"),  # 9% GST
+        is_gst_charged=True,
+        description="Standard-rated supplies (9% GST)",
+        box_mapping="box1",  # F5 Box 1
+    ),
+    IrasTaxCodeSpec(
+        code="ZR",
+        name="Zero-Rated",
+        rate=Decimal("0.00"),  # 0% GST
+        is_gst_charged=True,
+        description="Zero-rated supplies (exports, international services)",
+        box_mapping="box2",  # F5 Box 2
+    ),
+    IrasTaxCodeSpec(
+        code="ES",
+        name="Exempt",
+        rate=None,  # No GST
+        is_gst_charged=False,
+        description="Exempt supplies (financial services, residential rent)",
+        box_mapping="box3",  # F5 Box 3
+    ),
+    IrasTaxCodeSpec(
+        code="OS",
+        name="Out-of-Scope",
+        rate=None,  # No GST
+        is_gst_charged=False,
+        description="Out-of-scope supplies (asset sales, private transactions)",
+        box_mapping=None,  # Not reported
+    ),
+    IrasTaxCodeSpec(
+        code="IM",
+        name="Import",
+        rate=Decimal("0.09"),  # 9% GST
+        is_gst_charged=True,
+        description="Imported goods",
+        box_mapping="box9",  # F5 Box 9
+    ),
+    IrasTaxCodeSpec(
+        code="ME",
+        name="Metered",
+        rate=Decimal("0.09"),  # 9% GST
+        is_gst_charged=True,
+        description="Metered services (utilities with special rules)",
+        box_mapping="box1",  # F5 Box 1
+    ),
+    IrasTaxCodeSpec(
+        code="TX-E33",
+        name="Purchase with GST",
+        rate=Decimal("0.09"),
+        is_gst_charged=True,
+        description="Purchase with GST incurred",
+        box_mapping="box6",  # F5 Box 6
+    ),
+    IrasTaxCodeSpec(
+        code="BL",
+        name="BCRS Deposit",
+        rate=Decimal("0.00"),
+        is_gst_charged=False,
+        description="Beverage container deposit (GST exempt)",
+        box_mapping=None,
+        is_bcrs_exempt=True,
+    ),
+)
+
+# IRAS tax code specs by code
+IRAS_TAX_CODES: Mapping[str, IrasTaxCodeSpec] = MappingProxyType(
+    {spec.code: spec for spec in IRAS_TAX_CODE_SPECS}
+)
+
+# SG standard rate changes at most yearly, so a day-long TTL is safe
+GST_RATE_CACHE_TIMEOUT = 86400
+
+# Tax code snapshots by (org_id, code) or (org_id, id); short TTL as a
+# backstop to versioning
+TAX_CODE_CACHE_TIMEOUT = 300
+
+# Columns held in a tax code snapshot
+_SNAPSHOT_FIELDS = ("id", "code", "rate", "is_gst_charged", "is_active")
+
+
+def _gst_rate_version_key(org_id) -> str:
+    return f"gst:sr:ver:{org_id}"
+
+
+def invalidate_gst_rate_cache(org_id) -> None:
+    """Invalidate cached standard rates and tax code snapshots for an organisation."""
+    try:
+        cache.incr(_gst_rate_version_key(org_id))
+    except ValueError:
+        cache.set(_gst_rate_version_key(org_id), 1, None)
+
+
+def _normalize_code(code: str) -> str:
+    """Strip and upper-case a tax code, skipping upper() if already upper."""
+    code = code.strip()
+    if not code.isascii() or not code.isupper():
+        code = code.upper()
+    return code
+
+
+# Request memo slot for get_tax_code_by_code results
+_TAX_CODE_MEMO_KEY = "gst:tax_code_by_code"
+
+
+def clear_tax_code_memo() -> None:
+    """Forget tax codes memoised for the current request after a write."""
+    memo = request_memo()
+    if memo is not None:
+        memo.pop(_TAX_CODE_MEMO_KEY, None)
+
+
+# Codes reserved for IRAS (the "system" codes) and the F5 boxes custom
+# codes may map to
+_RESERVED_CODES = frozenset(IRAS_TAX_CODES)
+_VALID_BOXES = frozenset({"box1", "box2", "box3", "box6", "box9", "box11"})
+
+
+def _box_columns(box_mapping: Optional[str]) -> Dict[str, Any]:
+    """
+    Translate an F5 box_mapping ('box1', ...) into gst.tax_code columns.
+    
+    Supply boxes 1-3 set f5_supply_box (standard-rated also carries output
+    tax in box 6); purchase boxes 5 and 9 set f5_purchase_box (box 5 with
+    input tax in box 7) and mark the code as input; any other box is a tax
+    box. Codes with no box are output codes, so chk_io_flag always holds.
+    """
+    columns = {
+        "f5_supply_box": None,
+        "f5_purchase_box": None,
+        "f5_tax_box": None,
+        "is_input": False,
+        "is_output": True,
+    }
+    if box_mapping is None:
+        return columns
+    
+    box = int(box_mapping.removeprefix("box"))
+    if box in (1, 2, 3):
+        columns["f5_supply_box"] = box
+        if box == 1:
+            columns["f5_tax_box"] = 6
+    elif box in (5, 9):
+        columns["f5_purchase_box"] = box
+        if box == 5:
+            columns["f5_tax_box"] = 7
+        columns["is_input"] = True
+        columns["is_output"] = False
+    else:
+        columns["f5_tax_box"] = box
+    return columns
+
+
+def _box_mapping(tax_code: TaxCode) -> Optional[str]:
+    """The F5 box ('box1', ...) a tax code's line amounts report in, if any."""
+    box = tax_code.f5_supply_box or tax_code.f5_purchase_box
+    return f"box{box}" if box else None
+
+
+# TaxCode constructor kwargs (all but org_id) for seeding IRAS codes
+_SEED_KWARGS = tuple(
+    {
+        "code": spec.code,
+        "name": spec.name,
+        # gst.tax_code.rate is NOT NULL; codes without GST store 0
+        "rate": spec.rate if spec.rate is not None else Decimal("0.00"),
+        "is_gst_charged": spec.is_gst_charged,
+        "description": spec.description,
+        "is_active": True,
+        "effective_from": date(2024, 1, 1),  # 9% effective from 2024
+        **_box_columns(spec.box_mapping),
+    }
+    for spec in IRAS_TAX_CODE_SPECS
+)
+
+# Columns update_tax_code may write; keys, tenant and audit columns excluded
+_UPDATABLE_FIELDS = frozenset({
+    "code", "name", "description", "rate", "is_gst_charged",
+    "is_input", "is_output", "is_claimable", "is_reverse_charge",
+    "f5_supply_box", "f5_purchase_box", "f5_tax_box", "display_order",
+    "is_active", "effective_from", "effective_to",
+})
+
+# Public view of IRAS_TAX_CODES, built once; read-only so callers can't
+# mutate the shared copy.
+_IRAS_TAX_CODES_INFO = MappingProxyType({
+    spec.code: MappingProxyType({
+        "name": spec.name,
+        "rate": str(spec.rate) if spec.rate else None,
+        "is_gst_charged": spec.is_gst_charged,
+        "description": spec.description,
+        "box_mapping": spec.box_mapping,
+    })
+    for spec in IRAS_TAX_CODE_SPECS
+})
+
+
+# Columns returned by list_tax_codes_fast (TaxCodeListSerializer fields)
+_LIST_FIELDS = (
+    "id", "code", "name", "rate", "is_gst_charged", "is_input", "is_output",
+    "is_active", "f5_supply_box", "f5_purchase_box", "f5_tax_box", "effective_from",
+)
+
+
+def _filter_tax_codes(
+    org_id: UUID,
+    is_active: Optional[bool],
+    is_gst_charged: Optional[bool],
+    include_system: bool
+):
+    """Build the filtered tax code queryset shared by the list methods."""
+    queryset = TaxCode.objects.filter(org_id=org_id)
+    
+    if is_active is not None:
+        queryset = queryset.filter(is_active=is_active)
+    
+    if is_gst_charged is not None:
+        queryset = queryset.filter(is_gst_charged=is_gst_charged)
+    
+    if not include_system:
+        queryset = queryset.exclude(code__in=_RESERVED_CODES)
+    
+    return queryset
 
 
 class TaxCodeService:
@@ -96,23 +289,54 @@ class TaxCodeService:
             org_id: Organisation ID
             is_active: Filter by active status
             is_gst_charged: Filter by GST-charged flag
-            include_system: Include system tax codes
+            include_system: Include system (IRAS-reserved) tax codes
             
         Returns:
             List of TaxCode instances
         """
-        queryset = TaxCode.objects.filter(org_id=org_id)
+        queryset = _filter_tax_codes(org_id, is_active, is_gst_charged, include_system)
+        return list(queryset.order_by("code"))
+    
+    @staticmethod
+    def list_tax_codes_fast(
+        org_id: UUID,
+        is_active: Optional[bool] = None,
+        is_gst_charged: Optional[bool] = None,
+        include_system: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        List tax codes as plain dicts for the list endpoint.
         
-        if is_active is not None:
-            queryset = queryset.filter(is_active=is_active)
+        Same filters as list_tax_codes, but selects only _LIST_FIELDS and
+        skips model instantiation.
         
-        if is_gst_charged is not None:
-            queryset = queryset.filter(is_gst_charged=is_gst_charged)
+        Returns:
+            List of dicts keyed by _LIST_FIELDS
+        """
+        queryset = _filter_tax_codes(org_id, is_active, is_gst_charged, include_system)
+        return list(queryset.values(*_LIST_FIELDS).order_by("code"))
+    
+    @staticmethod
+    def get_tax_code_list_etag(org_id: UUID) -> str:
+        """
+        Get an entity tag for the organisation's tax code list.
         
-        if not include_system:
-            queryset = queryset.filter(is_system=False)
+        Derived from MAX(updated_at) and COUNT(*) in one aggregate query:
+        every write path sets updated_at, and deletions change the count.
         
-        return list(queryset.order_by("code"))
+        Args:
+            org_id: Organisation ID
+            
+        Returns:
+            Quoted ETag value
+        """
+        state = TaxCode.objects.filter(org_id=org_id).aggregate(
+            last_updated=Max("updated_at"),
+            count=Count("id"),
+        )
+        last_updated = state["last_updated"]
+        stamp = int(last_updated.timestamp() * 1_000_000) if last_updated else 0
+        return f'"tc-{stamp:x}-{state["count"]:x}"'
     
     @staticmethod
     def get_tax_code(org_id: UUID, tax_code_id: UUID) -> TaxCode:
@@ -134,6 +358,56 @@ class TaxCodeService:
         except TaxCode.DoesNotExist:
             raise ResourceNotFound(f"Tax code {tax_code_id} not found")
     
+    @staticmethod
+    def get_tax_codes_bulk(
+        org_id: UUID,
+        tax_code_ids: Iterable[UUID]
+    ) -> Dict[UUID, TaxCode]:
+        """
+        Get several tax codes by ID in one query.
+        
+        Args:
+            org_id: Organisation ID
+            tax_code_ids: Tax code IDs (duplicates are fine)
+            
+        Returns:
+            Dict of tax code ID to TaxCode instance
+            
+        Raises:
+            ResourceNotFound: If any tax code doesn't exist
+        """
+        wanted = set(tax_code_ids)
+        tax_codes = TaxCode.objects.filter(org_id=org_id).in_bulk(wanted)
+        
+        for tax_code_id in wanted:
+            if tax_code_id not in tax_codes:
+                raise ResourceNotFound(f"Tax code {tax_code_id} not found")
+        
+        return tax_codes
+    
+    @staticmethod
+    def get_tax_code_readonly(org_id: UUID, tax_code_id: UUID) -> TaxCode:
+        """
+        Get tax code by ID from the read database (replica if configured).
+        
+        For read paths that tolerate replica lag; writes must use
+        get_tax_code so they see the primary.
+        
+        Args:
+            org_id: Organisation ID
+            tax_code_id: Tax code ID
+            
+        Returns:
+            TaxCode instance
+            
+        Raises:
+            ResourceNotFound: If tax code doesn't exist
+        """
+        try:
+            return TaxCode.objects.using(read_db()).get(id=tax_code_id, org_id=org_id)
+        except TaxCode.DoesNotExist:
+            raise ResourceNotFound(f"Tax code {tax_code_id} not found")
+    
     @staticmethod
     def get_tax_code_by_code(org_id: UUID, code: str) -> Optional[TaxCode]:
         """
@@ -146,10 +420,83 @@ class TaxCodeService:
         Returns:
             TaxCode instance or None
         """
+        code = _normalize_code(code)
+        memo = request_memo()
+        if memo is not None:
+            lookups = memo.setdefault(_TAX_CODE_MEMO_KEY, {})
+            if (org_id, code) in lookups:
+                return lookups[(org_id, code)]
+        
         try:
-            return TaxCode.objects.get(org_id=org_id, code=code.upper())
+            tax_code = TaxCode.objects.get(org_id=org_id, code=code)
         except TaxCode.DoesNotExist:
-            return None
+            tax_code = None
+        
+        if memo is not None:
+            lookups[(org_id, code)] = tax_code
+        return tax_code
+    
+    @staticmethod
+    def get_tax_code_snapshot(org_id: UUID, code: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached snapshot of a tax code's calculation fields by code.
+        
+        Snapshots are plain dicts held in the shared cache, so repeated
+        lookups across requests and workers skip the database. They are
+        dropped whenever the organisation's tax codes change.
+        
+        Args:
+            org_id: Organisation ID
+            code: Tax code (e.g., 'SR', 'ZR')
+            
+        Returns:
+            Dict with id, code, rate, is_gst_charged and is_active, or None
+        """
+        code = _normalize_code(code)
+        version = cache.get(_gst_rate_version_key(org_id), 0)
+        key = f"gst:tc:{org_id}:{code}:{version}"
+        
+        snapshot = cache.get(key)
+        if snapshot is None:
+            snapshot = TaxCode.objects.using(read_db()).filter(
+                org_id=org_id, code=code
+            ).values(*_SNAPSHOT_FIELDS).first()
+            # Only hits are cached; misses are keyed by caller input
+            if snapshot is not None:
+                cache.set(key, snapshot, TAX_CODE_CACHE_TIMEOUT)
+        
+        return snapshot
+    
+    @staticmethod
+    def get_tax_code_snapshot_by_id(org_id: UUID, tax_code_id: UUID) -> Dict[str, Any]:
+        """
+        Get a cached snapshot of a tax code's calculation fields by ID.
+        
+        Same snapshot and invalidation as get_tax_code_snapshot.
+        
+        Args:
+            org_id: Organisation ID
+            tax_code_id: Tax code ID
+            
+        Returns:
+            Dict with id, code, rate, is_gst_charged and is_active
+            
+        Raises:
+            ResourceNotFound: If tax code doesn't exist
+        """
+        version = cache.get(_gst_rate_version_key(org_id), 0)
+        key = f"gst:tc:id:{org_id}:{tax_code_id}:{version}"
+        
+        snapshot = cache.get(key)
+        if snapshot is None:
+            snapshot = TaxCode.objects.using(read_db()).filter(
+                org_id=org_id, id=tax_code_id
+            ).values(*_SNAPSHOT_FIELDS).first()
+            if snapshot is None:
+                raise ResourceNotFound(f"Tax code {tax_code_id} not found")
+            cache.set(key, snapshot, TAX_CODE_CACHE_TIMEOUT)
+        
+        return snapshot
     
     @staticmethod
     def create_tax_code(
@@ -174,8 +521,8 @@ class TaxCodeService:
             rate: GST rate (e.g., 0.09 for 9%) or None
             is_gst_charged: Whether GST is charged
             description: Description
-            box_mapping: F5 box mapping
-            **kwargs: Additional fields
+            box_mapping: F5 box mapping, stored as the f5_* columns
+            **kwargs: Additional fields (override the box columns)
             
         Returns:
             Created TaxCode instance
@@ -184,7 +531,7 @@ class TaxCodeService:
             ValidationError: If code is reserved or invalid
             DuplicateResource: If code already exists
         """
-        code = code.upper().strip()
+        code = _normalize_code(code)
         
         # Validate code format
         if not code:
@@ -194,39 +541,40 @@ class TaxCodeService:
             raise ValidationError("Tax code must be between 2 and 10 characters.")
         
         # Check if code is reserved (IRAS system codes)
-        if code in IRAS_TAX_CODES:
+        if code in _RESERVED_CODES:
             raise ValidationError(
                 f"Tax code '{code}' is reserved for IRAS-defined codes. "
                 "Use a different code for custom tax codes."
             )
         
-        # Check uniqueness
-        if TaxCode.objects.filter(org_id=org_id, code=code).exists():
-            raise DuplicateResource(f"Tax code '{code}' already exists.")
-        
         # Validate rate
         if rate is not None and (rate < 0 or rate > 1):
             raise ValidationError("GST rate must be between 0 and 1 (e.g., 0.09 for 9%).")
         
         # Validate box_mapping
-        valid_boxes = ["box1", "box2", "box3", "box6", "box9", "box11", None]
-        if box_mapping and box_mapping not in valid_boxes:
-            raise ValidationError(f"Invalid box mapping. Valid: {valid_boxes}")
-        
-        # Create tax code
-        tax_code = TaxCode.objects.create(
-            org_id=org_id,
-            code=code,
-            name=name.strip(),
-            rate=rate,
-            is_gst_charged=is_gst_charged,
-            description=description.strip(),
-            box_mapping=box_mapping,
-            is_system=False,  # Custom codes are never system
-            is_active=True,
-            effective_from=date.today(),
-            **kwargs
-        )
+        if box_mapping is not None and box_mapping not in _VALID_BOXES:
+            raise ValidationError(f"Invalid box mapping. Valid: {sorted(_VALID_BOXES)}")
+        
+        # Create tax code; uniqueness is enforced by the database
+        try:
+            with transaction.atomic():
+                tax_code = TaxCode.objects.create(
+                    org_id=org_id,
+                    code=code,
+                    name=name.strip(),
+                    # gst.tax_code.rate is NOT NULL; codes without GST store 0
+                    rate=rate if rate is not None else Decimal("0.00"),
+                    is_gst_charged=is_gst_charged,
+                    description=description.strip(),
+                    is_active=True,
+                    effective_from=date.today(),
+                    **{**_box_columns(box_mapping), **kwargs}
+                )
+        except IntegrityError as exc:
+            # Only unique violations (23505) mean a duplicate code
+            if getattr(exc.__cause__, "sqlstate", None) != "23505":
+                raise
+            raise DuplicateResource(f"Tax code '{code}' already exists.")
         
         return tax_code
     
@@ -239,8 +587,8 @@ class TaxCodeService:
         """
         Update tax code.
         
-        System tax codes can only have description updated.
-        Custom tax codes can be fully modified.
+        System tax codes (IRAS-reserved codes) can only have description
+        and active status updated. Custom tax codes can be fully modified.
         
         Args:
             org_id: Organisation ID
@@ -250,10 +598,14 @@ class TaxCodeService:
         Returns:
             Updated TaxCode instance
         """
-        tax_code = TaxCodeService.get_tax_code(org_id, tax_code_id)
+        code = TaxCode.objects.filter(
+            id=tax_code_id, org_id=org_id
+        ).values_list("code", flat=True).first()
+        if code is None:
+            raise ResourceNotFound(f"Tax code {tax_code_id} not found")
         
-        # System codes have limited update capability
-        if tax_code.is_system:
+        # System (IRAS-reserved) codes have limited update capability
+        if code in _RESERVED_CODES:
             allowed_fields = {"description", "is_active"}
             for key in list(updates.keys()):
                 if key not in allowed_fields:
@@ -268,20 +620,27 @@ class TaxCodeService:
             if rate < 0 or rate > 1:
                 raise ValidationError("GST rate must be between 0 and 1.")
         
-        # Update fields
-        for key, value in updates.items():
-            if hasattr(tax_code, key):
-                setattr(tax_code, key, value)
+        # Update only the named columns in a single UPDATE (bypasses post_save)
+        fields = {
+            key: value for key, value in updates.items()
+            if key in _UPDATABLE_FIELDS
+        }
+        if fields:
+            TaxCode.objects.filter(id=tax_code_id, org_id=org_id).update(
+                updated_at=timezone.now(), **fields
+            )
+            invalidate_tax_code_map(org_id)
+            invalidate_gst_rate_cache(org_id)
+            clear_tax_code_memo()
         
-        tax_code.save()
-        return tax_code
+        return TaxCodeService.get_tax_code(org_id, tax_code_id)
     
     @staticmethod
     def deactivate_tax_code(org_id: UUID, tax_code_id: UUID) -> TaxCode:
         """
         Deactivate a custom tax code.
         
-        System tax codes cannot be deactivated.
+        System tax codes (IRAS-reserved codes) cannot be deactivated.
         
         Args:
             org_id: Organisation ID
@@ -290,15 +649,19 @@ class TaxCodeService:
         Returns:
             Deactivated TaxCode instance
         """
-        tax_code = TaxCodeService.get_tax_code(org_id, tax_code_id)
-        
-        if tax_code.is_system:
-            raise ValidationError("System tax codes cannot be deactivated.")
+        updated = TaxCode.objects.filter(
+            id=tax_code_id, org_id=org_id
+        ).exclude(code__in=_RESERVED_CODES).update(is_active=False, updated_at=timezone.now())
         
-        tax_code.is_active = False
-        tax_code.save()
+        if not updated:
+            if TaxCode.objects.filter(id=tax_code_id, org_id=org_id).exists():
+                raise ValidationError("System tax codes cannot be deactivated.")
+            raise ResourceNotFound(f"Tax code {tax_code_id} not found")
         
-        return tax_code
+        invalidate_tax_code_map(org_id)
+        invalidate_gst_rate_cache(org_id)
+        clear_tax_code_memo()
+        return TaxCodeService.get_tax_code(org_id, tax_code_id)
     
     @staticmethod
     def validate_tax_code_for_invoice(
@@ -319,39 +682,101 @@ class TaxCodeService:
         Returns:
             Validation result with calculated GST
         """
-        tax_code = TaxCodeService.get_tax_code(org_id, tax_code_id)
+        return TaxCodeService.validate_tax_codes_for_invoice_batch(
+            org_id,
+            [{
+                "tax_code_id": tax_code_id,
+                "amount": amount,
+                "is_bcrs_deposit": is_bcrs_deposit,
+            }],
+        )[0]
+    
+    @staticmethod
+    def validate_tax_codes_for_invoice_batch(
+        org_id: UUID,
+        items: Iterable[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Validate tax codes for many invoice lines with a single query.
         
-        if not tax_code.is_active:
-            raise ValidationError(f"Tax code '{tax_code.code}' is not active.")
+        Args:
+            org_id: Organisation ID
+            items: Line dicts with tax_code_id, amount and optional
+                is_bcrs_deposit
+            
+        Returns:
+            Validation results in item order (see validate_tax_code_for_invoice)
+            
+        Raises:
+            ResourceNotFound: If any tax code doesn't exist
+            ValidationError: If any tax code is inactive
+        """
+        items = list(items)
+        ids = {UUID(str(item["tax_code_id"])) for item in items}
+        tax_codes = TaxCode.objects.using(read_db()).filter(org_id=org_id).in_bulk(ids)
+        
+        missing = ids.difference(tax_codes)
+        if missing:
+            raise ResourceNotFound(f"Tax code {next(iter(missing))} not found")
+        
+        # Integer (rate_int, scale) per code; (0, 0) means no GST charged
+        rates = {
+            tax_code_id: (
+                scaled_rate(tax_code.rate)
+                if tax_code.rate is not None and tax_code.is_gst_charged
+                else (0, 0)
+            )
+            for tax_code_id, tax_code in tax_codes.items()
+        }
         
-        # BCRS deposits are always GST exempt
-        if is_bcrs_deposit or getattr(tax_code, 'is_bcrs_exempt', False):
-            return {
+        results = []
+        # Lines that carry GST: result index, net units, rate_int, rate_scale
+        charged = ([], [], [], [])
+        for item in items:
+            tax_code_id = UUID(str(item["tax_code_id"]))
+            tax_code = tax_codes[tax_code_id]
+            amount = item["amount"]
+            
+            if not tax_code.is_active:
+                raise ValidationError(f"Tax code '{tax_code.code}' is not active.")
+            
+            # BCRS deposits are always GST exempt
+            if item.get("is_bcrs_deposit", False) or getattr(tax_code, 'is_bcrs_exempt', False):
+                results.append({
+                    "valid": True,
+                    "tax_code": tax_code.code,
+                    "rate": Decimal("0.00"),
+                    "gst_amount": Decimal("0.00"),
+                    "total_amount": amount,
+                    "is_bcrs_exempt": True,
+                })
+                continue
+            
+            rate_int, rate_scale = rates[tax_code_id]
+            if rate_int:
+                charged[0].append(len(results))
+                charged[1].append(to_units(money(amount)))
+                charged[2].append(rate_int)
+                charged[3].append(rate_scale)
+            
+            results.append({
                 "valid": True,
                 "tax_code": tax_code.code,
-                "rate": Decimal("0.00"),
+                "rate": tax_code.rate,
                 "gst_amount": Decimal("0.00"),
                 "total_amount": amount,
-                "is_bcrs_exempt": True,
-            }
-        
-        # Calculate GST
-        if tax_code.rate is not None and tax_code.is_gst_charged:
-            gst_amount = (amount * tax_code.rate).quantize(Decimal("0.01"))
-            total_amount = amount + gst_amount
-        else:
-            gst_amount = Decimal("0.00")
-            total_amount = amount
-        
-        return {
-            "valid": True,
-            "tax_code": tax_code.code,
-            "rate": tax_code.rate,
-            "gst_amount": gst_amount,
-            "total_amount": total_amount,
-            "is_bcrs_exempt": False,
-            "box_mapping": tax_code.box_mapping,
-        }
+                "is_bcrs_exempt": False,
+                "box_mapping": _box_mapping(tax_code),
+            })
+        
+        # Calculate GST in integer cents for all charged lines at once
+        indexes, net_units, rate_ints, rate_scales = charged
+        for index, gst_cents in zip(indexes, gst_cents_batch(net_units, rate_ints, rate_scales)):
+            result = results[index]
+            result["gst_amount"] = from_cents(gst_cents)
+            result["total_amount"] = result["total_amount"] + result["gst_amount"]
+        
+        return results
     
     @staticmethod
     def get_current_gst_rate(org_id: UUID, as_of_date: Optional[date] = None) -> Decimal:
@@ -370,13 +795,24 @@ class TaxCodeService:
         if as_of_date is None:
             as_of_date = date.today()
         
+        version = cache.get(_gst_rate_version_key(org_id), 0)
+        key = f"gst:sr:{org_id}:{as_of_date.isoformat()}:{version}"
+        rate = cache.get(key)
+        if rate is not None:
+            return rate
+        
         # Get standard-rated tax code
-        sr_code = TaxCodeService.get_tax_code_by_code(org_id, "SR")
-        if sr_code and sr_code.rate is not None:
-            return sr_code.rate
+        sr_rate = TaxCode.objects.using(read_db()).filter(
+            org_id=org_id, code="SR"
+        ).values_list("rate", flat=True).first()
+        if sr_rate is not None:
+            rate = sr_rate
+        else:
+            # Default to current Singapore rate
+            rate = Decimal("0.09")
         
-        # Default to current Singapore rate
-        return Decimal("0.09")
+        cache.set(key, rate, GST_RATE_CACHE_TIMEOUT)
+        return rate
     
     @staticmethod
     def seed_default_tax_codes(org_id: UUID) -> List[TaxCode]:
@@ -391,44 +827,34 @@ class TaxCodeService:
         Returns:
             List of created TaxCode instances
         """
-        created = []
+        existing = set(
+            TaxCode.objects.filter(
+                org_id=org_id, code__in=list(IRAS_TAX_CODES)
+            ).values_list("code", flat=True)
+        )
         
-        for code, config in IRAS_TAX_CODES.items():
-            # Check if already exists
-            if TaxCode.objects.filter(org_id=org_id, code=code).exists():
-                continue
-            
-            tax_code = TaxCode.objects.create(
-                org_id=org_id,
-                code=code,
-                name=config["name"],
-                rate=config["rate"],
-                is_gst_charged=config["is_gst_charged"],
-                description=config["description"],
-                box_mapping=config.get("box_mapping"),
-                is_system=True,
-                is_active=True,
-                effective_from=date(2024, 1, 1),  # 9% effective from 2024
-            )
-            created.append(tax_code)
+        created = [
+            TaxCode(org_id=org_id, **kwargs)
+            for kwargs in _SEED_KWARGS
+            if kwargs["code"] not in existing
+        ]
+        
+        if created:
+            with transaction.atomic():
+                TaxCode.objects.bulk_create(created, batch_size=500)
+            # bulk_create bypasses post_save, so invalidate explicitly
+            invalidate_tax_code_map(org_id)
+            invalidate_gst_rate_cache(org_id)
+            clear_tax_code_memo()
         
         return created
     
     @staticmethod
-    def get_iras_tax_codes_info() -> Dict[str, Any]:
+    def get_iras_tax_codes_info() -> Mapping[str, Mapping[str, Any]]:
         """
         Get information about IRAS-defined tax codes.
         
         Returns:
-            Dictionary of tax code information
-        """
-        return {
-            code: {
-                "name": config["name"],
-                "rate": str(config["rate"]) if config["rate"] else None,
-                "is_gst_charged": config["is_gst_charged"],
-                "description": config["description"],
-                "box_mapping": config.get("box_mapping"),
-            }
-            for code, config in IRAS_TAX_CODES.items()
-        }
+            Read-only mapping of tax code information
+        """
+        return _IRAS_TAX_CODES_INFO
@@ -0,0 +1,41 @@
+"""
+Signal handlers for GST module.
+
+Keeps cached GST data consistent with the invoicing and tax code tables
+it is derived from.
+"""
+
+from django.db.models.signals import post_save, post_delete
+
+from apps.core.models import InvoiceDocument, InvoiceLine, TaxCode
+from apps.gst.services.calculation_service import (
+    invalidate_f5_cache,
+    invalidate_tax_code_map,
+)
+from apps.gst.services.tax_code_service import (
+    clear_tax_code_memo,
+    invalidate_gst_rate_cache,
+)
+
+
+def invalidate_f5_on_document_change(sender, instance, **kwargs):
+    """Drop cached F5 box amounts when a document or line changes."""
+    invalidate_f5_cache(instance.org_id)
+
+
+def invalidate_tax_codes_on_change(sender, instance, **kwargs):
+    """Drop cached F5 groups, F5 boxes and standard rates when a tax code changes."""
+    # Also invalidates the org's F5 boxes (or all orgs' for a global code)
+    invalidate_tax_code_map(instance.org_id)
+    invalidate_gst_rate_cache(instance.org_id)
+    clear_tax_code_memo()
+
+
+def connect():
+    """Connect GST signal handlers."""
+    for model in (InvoiceDocument, InvoiceLine):
+        post_save.connect(invalidate_f5_on_document_change, sender=model)
+        post_delete.connect(invalidate_f5_on_document_change, sender=model)
+    
+    post_save.connect(invalidate_tax_codes_on_change, sender=TaxCode)
+    post_delete.connect(invalidate_tax_codes_on_change, sender=TaxCode)
@@ -9,7 +9,6 @@ from django.urls import path
 from .views import (
     TaxCodeListCreateView,
     TaxCodeDetailView,
-    TaxCodeIrasInfoView,
     GSTCalculateView,
     GSTCalculateDocumentView,
     GSTReturnListCreateView,
@@ -18,25 +17,28 @@ from .views import (
     GSTReturnAmendView,
     GSTReturnPayView,
     GSTReturnDeadlinesView,
+    tax_code_iras_info,
 )
 
 app_name = "gst"
 
+# Ordered by expected traffic (the resolver tries patterns in order);
+# literal paths stay ahead of the <uuid:...> converters beside them.
 urlpatterns = [
-    # Tax codes
-    path("tax-codes/", TaxCodeListCreateView.as_view(), name="tax-code-list-create"),
-    path("tax-codes/iras-info/", TaxCodeIrasInfoView.as_view(), name="tax-code-iras-info"),
-    path("tax-codes/<str:tax_code_id>/", TaxCodeDetailView.as_view(), name="tax-code-detail"),
-    
     # GST calculations
     path("calculate/", GSTCalculateView.as_view(), name="gst-calculate"),
     path("calculate/document/", GSTCalculateDocumentView.as_view(), name="gst-calculate-document"),
     
+    # Tax codes
+    path("tax-codes/", TaxCodeListCreateView.as_view(), name="tax-code-list-create"),
+    path("tax-codes/iras-info/", tax_code_iras_info, name="tax-code-iras-info"),
+    path("tax-codes/<uuid:tax_code_id>/", TaxCodeDetailView.as_view(), name="tax-code-detail"),
+    
     # GST returns
     path("returns/", GSTReturnListCreateView.as_view(), name="gst-return-list-create"),
     path("returns/deadlines/", GSTReturnDeadlinesView.as_view(), name="gst-return-deadlines"),
-    path("returns/<str:return_id>/", GSTReturnDetailView.as_view(), name="gst-return-detail"),
-    path("returns/<str:return_id>/file/", GSTReturnFileView.as_view(), name="gst-return-file"),
-    path("returns/<str:return_id>/amend/", GSTReturnAmendView.as_view(), name="gst-return-amend"),
-    path("returns/<str:return_id>/pay/", GSTReturnPayView.as_view(), name="gst-return-pay"),
+    path("returns/<uuid:return_id>/", GSTReturnDetailView.as_view(), name="gst-return-detail"),
+    path("returns/<uuid:return_id>/file/", GSTReturnFileView.as_view(), name="gst-return-file"),
+    path("returns/<uuid:return_id>/amend/", GSTReturnAmendView.as_view(), name="gst-return-amend"),
+    path("returns/<uuid:return_id>/pay/", GSTReturnPayView.as_view(), name="gst-return-pay"),
 ]
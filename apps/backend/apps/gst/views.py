@@ -4,43 +4,59 @@ GST views for LedgerSG.
 Tax code management, GST calculation, and GST return filing.
 """
 
+import hashlib
+import json
+from datetime import date
+from decimal import Decimal
 from typing import Optional
+from uuid import UUID
 
+from django.http import HttpResponse, HttpResponseNotModified, JsonResponse, StreamingHttpResponse
+from django.views.decorators.http import require_GET
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
+from rest_framework.exceptions import AuthenticationFailed, NotAuthenticated
 from rest_framework.permissions import IsAuthenticated
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
 from apps.core.permissions import IsOrgMember, CanManageCoA, CanFileGST, CanViewReports
 from apps.core.models import TaxCode, GSTReturn
 from common.exceptions import ValidationError, ResourceNotFound
-from common.views import wrap_response
+from common.views import wrap_response, stream_list_response, query_bool, etag_matches
 from common.decimal_utils import money
+from common.renderers import DecimalSafeJSONEncoder
 
+from apps.gst._perm import require_perm
 from apps.gst.services import (
     TaxCodeService,
     GSTCalculationService,
     GSTReturnService,
 )
+from apps.gst.schemas import (
+    GSTCalcRequest,
+    DocumentGSTCalcRequest,
+    GSTReturnFileRequest,
+)
 from apps.gst.serializers import (
     TaxCodeListSerializer,
     TaxCodeDetailSerializer,
     TaxCodeCreateSerializer,
     TaxCodeUpdateSerializer,
-    GSTCalculationRequestSerializer,
     GSTCalculationResponseSerializer,
-    DocumentGSTCalculationSerializer,
     DocumentGSTSummarySerializer,
     GSTReturnListSerializer,
     GSTReturnDetailSerializer,
     GSTReturnCreateSerializer,
-    GSTReturnFileSerializer,
     GSTReturnAmendSerializer,
     GSTReturnPaymentSerializer,
 )
 
 
+# Tax code lists are cacheable but must be revalidated (ETag) on each use
+_TAX_CODE_LIST_CACHE_CONTROL = "private, no-cache"
+
+
 class TaxCodeListCreateView(APIView):
     """
     GET: List tax codes
@@ -50,50 +66,45 @@ class TaxCodeListCreateView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember]
     
     @wrap_response
-    def get(self, request, org_id: str) -> Response:
+    def get(self, request, org_id: UUID) -> Response:
         """List tax codes."""
-        is_active = request.query_params.get("is_active")
-        is_gst_charged = request.query_params.get("is_gst_charged")
-        include_system = request.query_params.get("include_system", "true").lower() == "true"
-        
-        if is_active is not None:
-            is_active = is_active.lower() == "true"
-        if is_gst_charged is not None:
-            is_gst_charged = is_gst_charged.lower() == "true"
-        
-        from uuid import UUID
-        tax_codes = TaxCodeService.list_tax_codes(
-            org_id=UUID(org_id),
-            is_active=is_active,
-            is_gst_charged=is_gst_charged,
-            include_system=include_system
+        # Revalidate against the org's tax code table state before any
+        # list query or serialization
+        etag = TaxCodeService.get_tax_code_list_etag(org_id)
+        headers = {"ETag": etag, "Cache-Control": _TAX_CODE_LIST_CACHE_CONTROL}
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        
+        params = request.query_params
+        
+        tax_codes = TaxCodeService.list_tax_codes_fast(
+            org_id=org_id,
+            is_active=query_bool(params, "is_active"),
+            is_gst_charged=query_bool(params, "is_gst_charged"),
+            include_system=query_bool(params, "include_system", True)
         )
         
-        serializer = TaxCodeListSerializer(tax_codes, many=True)
         return Response({
-            "data": serializer.data,
-            "count": len(serializer.data)
-        })
+            "data": TaxCodeListSerializer(tax_codes, many=True).data,
+            "count": len(tax_codes)
+        }, headers=headers)
     
     @wrap_response
-    def post(self, request, org_id: str) -> Response:
+    def post(self, request, org_id: UUID) -> Response:
         """Create custom tax code."""
         # Check permission
-        self._check_permission(request, "can_manage_coa")
+        require_perm(request, "can_manage_coa")
         
         serializer = TaxCodeCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
-        from uuid import UUID
-        from decimal import Decimal
-        
         data = serializer.validated_data
         rate = data.get("rate")
         if rate is not None:
             rate = Decimal(str(rate))
         
         tax_code = TaxCodeService.create_tax_code(
-            org_id=UUID(org_id),
+            org_id=org_id,
             code=data["code"],
             name=data["name"],
             rate=rate,
@@ -106,14 +117,6 @@ class TaxCodeListCreateView(APIView):
             TaxCodeDetailSerializer(tax_code).data,
             status=status.HTTP_201_CREATED
         )
-    
-    def _check_permission(self, request, permission: str) -> bool:
-        """Check if user has specific permission."""
-        org_role = getattr(request, "org_role", {})
-        if org_role.get(permission) or getattr(request.user, "is_superadmin", False):
-            return True
-        from common.exceptions import UnauthorizedOrgAccess
-        raise UnauthorizedOrgAccess("Insufficient permissions")
 
 
 class TaxCodeDetailView(APIView):
@@ -126,66 +129,86 @@ class TaxCodeDetailView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember]
     
     @wrap_response
-    def get(self, request, org_id: str, tax_code_id: str) -> Response:
+    def get(self, request, org_id: UUID, tax_code_id: UUID) -> Response:
         """Get tax code details."""
-        from uuid import UUID
-        tax_code = TaxCodeService.get_tax_code(UUID(org_id), UUID(tax_code_id))
+        tax_code = TaxCodeService.get_tax_code(org_id, tax_code_id)
         return Response(TaxCodeDetailSerializer(tax_code).data)
     
     @wrap_response
-    def patch(self, request, org_id: str, tax_code_id: str) -> Response:
+    def patch(self, request, org_id: UUID, tax_code_id: UUID) -> Response:
         """Update tax code."""
-        self._check_permission(request, "can_manage_coa")
+        require_perm(request, "can_manage_coa")
         
-        from uuid import UUID
         serializer = TaxCodeUpdateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
         tax_code = TaxCodeService.update_tax_code(
-            UUID(org_id),
-            UUID(tax_code_id),
+            org_id,
+            tax_code_id,
             **serializer.validated_data
         )
         
         return Response(TaxCodeDetailSerializer(tax_code).data)
     
     @wrap_response
-    def delete(self, request, org_id: str, tax_code_id: str) -> Response:
+    def delete(self, request, org_id: UUID, tax_code_id: UUID) -> Response:
         """Deactivate tax code."""
-        self._check_permission(request, "can_manage_coa")
+        require_perm(request, "can_manage_coa")
         
-        from uuid import UUID
-        tax_code = TaxCodeService.deactivate_tax_code(UUID(org_id), UUID(tax_code_id))
+        tax_code = TaxCodeService.deactivate_tax_code(org_id, tax_code_id)
         
         return Response({
             "message": "Tax code deactivated",
             "tax_code": TaxCodeDetailSerializer(tax_code).data
         })
-    
-    def _check_permission(self, request, permission: str) -> bool:
-        """Check if user has specific permission."""
-        org_role = getattr(request, "org_role", {})
-        if org_role.get(permission) or getattr(request.user, "is_superadmin", False):
-            return True
-        from common.exceptions import UnauthorizedOrgAccess
-        raise UnauthorizedOrgAccess("Insufficient permissions")
 
 
-class TaxCodeIrasInfoView(APIView):
+# The IRAS info payload is static, so it is encoded once per process
+_IRAS_INFO = TaxCodeService.get_iras_tax_codes_info()
+_IRAS_INFO_JSON = json.dumps(
+    {"data": _IRAS_INFO, "count": len(_IRAS_INFO)},
+    cls=DecimalSafeJSONEncoder,
+    ensure_ascii=False,
+    separators=(",", ":"),
+).encode("utf-8")
+_IRAS_INFO_ETAG = f'"{hashlib.md5(_IRAS_INFO_JSON, usedforsecurity=False).hexdigest()}"'
+_IRAS_INFO_CACHE_CONTROL = "private, max-age=86400"
+
+
+_jwt_authentication = JWTAuthentication()
+
+
+@require_GET
+def tax_code_iras_info(request, org_id: UUID) -> HttpResponse:
     """
-    GET: Get IRAS-defined tax code information
+    GET: Get IRAS-defined tax code information.
+    
+    A plain Django view: the payload is static, so DRF's negotiation,
+    parsing and Response rendering are skipped. JWT authentication is
+    still required and answered in DRF's 401 format.
     """
-    authentication_classes = [JWTAuthentication]
-    permission_classes = [IsAuthenticated]
+    try:
+        authenticated = _jwt_authentication.authenticate(request)
+    except AuthenticationFailed as exc:
+        # simplejwt's InvalidToken carries a dict detail (detail/code/messages)
+        return JsonResponse(
+            exc.detail if isinstance(exc.detail, dict) else {"detail": exc.detail},
+            status=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": _jwt_authentication.authenticate_header(request)},
+        )
+    if authenticated is None:
+        return JsonResponse(
+            {"detail": str(NotAuthenticated.default_detail)},
+            status=status.HTTP_401_UNAUTHORIZED,
+            headers={"WWW-Authenticate": _jwt_authentication.authenticate_header(request)},
+        )
     
-    @wrap_response
-    def get(self, request) -> Response:
-        """Get IRAS tax code definitions."""
-        info = TaxCodeService.get_iras_tax_codes_info()
-        return Response({
-            "data": info,
-            "count": len(info)
-        })
+    headers = {"ETag": _IRAS_INFO_ETAG, "Cache-Control": _IRAS_INFO_CACHE_CONTROL}
+    
+    if etag_matches(request, _IRAS_INFO_ETAG):
+        return HttpResponseNotModified(headers=headers)
+    
+    return HttpResponse(_IRAS_INFO_JSON, content_type="application/json", headers=headers)
 
 
 class GSTCalculateView(APIView):
@@ -193,29 +216,21 @@ class GSTCalculateView(APIView):
     POST: Calculate GST for a line item
     """
     authentication_classes = [JWTAuthentication]
-    permission_classes = [IsAuthenticated]
+    permission_classes = [IsAuthenticated, IsOrgMember]
     
     @wrap_response
-    def post(self, request) -> Response:
+    def post(self, request, org_id: UUID) -> Response:
         """Calculate GST for a line."""
-        serializer = GSTCalculationRequestSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        
-        data = serializer.validated_data
-        amount = money(data["amount"])
-        is_bcrs = data.get("is_bcrs_deposit", False)
-        
-        # Get rate from tax code or use provided rate
-        if data.get("tax_code_id"):
-            from uuid import UUID
-            tax_code = TaxCodeService.get_tax_code_by_code(
-                UUID(request.data.get("org_id", "00000000-0000-0000-0000-000000000000")),
-                str(data["tax_code_id"])  # Actually expects code, not ID
-            )
-            rate = tax_code.rate if tax_code else Decimal("0.09")
+        data = GSTCalcRequest.model_validate(request.data)
+        amount = money(data.amount)
+        is_bcrs = data.is_bcrs_deposit
+        
+        # Get rate from tax code or use provided rate (the schema requires one)
+        if data.tax_code_id:
+            tax_code = TaxCodeService.get_tax_code_snapshot_by_id(org_id, data.tax_code_id)
+            rate = tax_code["rate"] if tax_code["is_gst_charged"] else Decimal("0")
         else:
-            from decimal import Decimal
-            rate = Decimal(str(data.get("rate", "0.09")))
+            rate = data.rate
         
         result = GSTCalculationService.calculate_line_gst(
             amount=amount,
@@ -240,18 +255,13 @@ class GSTCalculateDocumentView(APIView):
     permission_classes = [IsAuthenticated]
     
     @wrap_response
-    def post(self, request) -> Response:
+    def post(self, request, org_id: UUID) -> Response:
         """Calculate GST for a document."""
-        serializer = DocumentGSTCalculationSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        
-        data = serializer.validated_data
-        from decimal import Decimal
-        default_rate = Decimal(str(data.get("default_rate", "0.09")))
+        data = DocumentGSTCalcRequest.model_validate(request.data)
         
         result = GSTCalculationService.calculate_document_gst(
-            lines=data["lines"],
-            default_rate=default_rate
+            lines=[line.model_dump(exclude_none=True) for line in data.lines],
+            default_rate=data.default_rate
         )
         
         return Response(result)
@@ -266,7 +276,7 @@ class GSTReturnListCreateView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanFileGST]
     
     @wrap_response
-    def get(self, request, org_id: str) -> Response:
+    def get(self, request, org_id: UUID) -> StreamingHttpResponse:
         """List GST returns."""
         status_filter = request.query_params.get("status")
         year = request.query_params.get("year")
@@ -274,39 +284,34 @@ class GSTReturnListCreateView(APIView):
         if year:
             year = int(year)
         
-        from uuid import UUID
         returns = GSTReturnService.list_returns(
-            org_id=UUID(org_id),
+            org_id=org_id,
             status=status_filter,
             year=year
         )
         
-        serializer = GSTReturnListSerializer(returns, many=True)
-        return Response({
-            "data": serializer.data,
-            "count": len(serializer.data)
-        })
+        serializer = GSTReturnListSerializer(context={"today": date.today()})
+        return stream_list_response(returns, serializer.to_representation)
     
     @wrap_response
-    def post(self, request, org_id: str) -> Response:
+    def post(self, request, org_id: UUID) -> Response:
         """Create GST return periods."""
-        from datetime import date
-        from uuid import UUID
-        
         serializer = GSTReturnCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
         data = serializer.validated_data
         created = GSTReturnService.create_return_periods(
-            org_id=UUID(org_id),
+            org_id=org_id,
             filing_frequency=data["filing_frequency"],
             start_date=data["start_date"],
             periods=data["periods"]
         )
         
+        count = len(created)
         return Response({
-            "message": f"Created {len(created)} return periods",
-            "data": GSTReturnListSerializer(created, many=True).data
+            "message": f"Created {count} return periods",
+            "data": GSTReturnListSerializer(created, many=True, context={"today": date.today()}).data,
+            "count": count
         }, status=status.HTTP_201_CREATED)
 
 
@@ -319,21 +324,19 @@ class GSTReturnDetailView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanFileGST]
     
     @wrap_response
-    def get(self, request, org_id: str, return_id: str) -> Response:
+    def get(self, request, org_id: UUID, return_id: UUID) -> Response:
         """Get GST return with F5 data."""
-        from uuid import UUID
-        gst_return = GSTReturnService.get_return(UUID(org_id), UUID(return_id))
+        gst_return = GSTReturnService.get_return(org_id, return_id)
         return Response(GSTReturnDetailSerializer(gst_return).data)
     
     @wrap_response
-    def post(self, request, org_id: str, return_id: str) -> Response:
+    def post(self, request, org_id: UUID, return_id: UUID) -> Response:
         """Generate/regenerate F5 data."""
-        from uuid import UUID
-        force = request.query_params.get("force", "false").lower() == "true"
+        force = query_bool(request.query_params, "force", False)
         
         gst_return = GSTReturnService.generate_f5(
-            org_id=UUID(org_id),
-            return_id=UUID(return_id),
+            org_id=org_id,
+            return_id=return_id,
             force_recalculate=force
         )
         
@@ -348,26 +351,17 @@ class GSTReturnFileView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanFileGST]
     
     @wrap_response
-    def post(self, request, org_id: str, return_id: str) -> Response:
+    def post(self, request, org_id: UUID, return_id: UUID) -> Response:
         """File GST return."""
-        from uuid import UUID
-        from decimal import Decimal
-        
-        serializer = GSTReturnFileSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-        
-        data = serializer.validated_data
-        boxes = data.get("boxes")
-        if boxes:
-            boxes = {
-                k: Decimal(str(v)) for k, v in boxes.items()
-            }
+        data = GSTReturnFileRequest.model_validate(request.data)
+        # Box amounts are already Decimals, parsed with the request schema
+        boxes = data.boxes.model_dump(exclude_unset=True) if data.boxes else None
         
         gst_return = GSTReturnService.file_return(
-            org_id=UUID(org_id),
-            return_id=UUID(return_id),
+            org_id=org_id,
+            return_id=return_id,
             filed_by_id=request.user.id,
-            filing_reference=data.get("filing_reference"),
+            filing_reference=data.filing_reference,
             boxes=boxes
         )
         
@@ -385,16 +379,14 @@ class GSTReturnAmendView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanFileGST]
     
     @wrap_response
-    def post(self, request, org_id: str, return_id: str) -> Response:
+    def post(self, request, org_id: UUID, return_id: UUID) -> Response:
         """Amend GST return."""
-        from uuid import UUID
-        
         serializer = GSTReturnAmendSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
         gst_return = GSTReturnService.amend_return(
-            org_id=UUID(org_id),
-            return_id=UUID(return_id),
+            org_id=org_id,
+            return_id=return_id,
             reason=serializer.validated_data["reason"]
         )
         
@@ -412,19 +404,16 @@ class GSTReturnPayView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanFileGST]
     
     @wrap_response
-    def post(self, request, org_id: str, return_id: str) -> Response:
+    def post(self, request, org_id: UUID, return_id: UUID) -> Response:
         """Record GST payment."""
-        from uuid import UUID
-        from decimal import Decimal
-        
         serializer = GSTReturnPaymentSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         
         data = serializer.validated_data
         
         gst_return = GSTReturnService.pay_return(
-            org_id=UUID(org_id),
-            return_id=UUID(return_id),
+            org_id=org_id,
+            return_id=return_id,
             payment_date=data["payment_date"],
             payment_amount=Decimal(str(data["payment_amount"])),
             payment_reference=data["payment_reference"]
@@ -444,18 +433,16 @@ class GSTReturnDeadlinesView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember]
     
     @wrap_response
-    def get(self, request, org_id: str) -> Response:
+    def get(self, request, org_id: UUID) -> Response:
         """Get upcoming deadlines."""
-        from uuid import UUID
-        
         days = int(request.query_params.get("days", 30))
         
         deadlines = GSTReturnService.get_upcoming_deadlines(
-            org_id=UUID(org_id),
+            org_id=org_id,
             days=days
         )
         
         return Response({
-            "data": GSTReturnListSerializer(deadlines, many=True).data,
+            "data": GSTReturnListSerializer(deadlines, many=True, context={"today": date.today()}).data,
             "count": len(deadlines)
         })
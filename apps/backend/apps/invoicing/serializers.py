@@ -8,9 +8,10 @@ from rest_framework import serializers
 from decimal import Decimal
 
 from apps.core.models import Contact, InvoiceDocument, InvoiceLine
+from common.serializers import CachedFieldsSerializerMixin
 
 
-class ContactListSerializer(serializers.ModelSerializer):
+class ContactListSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Lightweight serializer for contact list views."""
     
     class Meta:
@@ -21,7 +22,7 @@ class ContactListSerializer(serializers.ModelSerializer):
         ]
 
 
-class ContactDetailSerializer(serializers.ModelSerializer):
+class ContactDetailSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Detailed serializer for contact views."""
     
     full_address = serializers.SerializerMethodField()
@@ -51,6 +52,16 @@ class ContactDetailSerializer(serializers.ModelSerializer):
         return ", ".join(filter(None, parts))
 
 
+class ContactListQuerySerializer(CachedFieldsSerializerMixin, serializers.Serializer):
+    """Query parameters for the contact list."""
+    
+    is_customer = serializers.BooleanField(required=False)
+    is_supplier = serializers.BooleanField(required=False)
+    is_active = serializers.BooleanField(default=True)
+    search = serializers.CharField(required=False, allow_blank=True)
+    export = serializers.ChoiceField(choices=["ndjson"], required=False)
+
+
 class ContactCreateSerializer(serializers.Serializer):
     """Serializer for creating a contact."""
     
@@ -98,7 +109,7 @@ class ContactUpdateSerializer(serializers.Serializer):
     is_active = serializers.BooleanField(required=False)
 
 
-class InvoiceLineSerializer(serializers.ModelSerializer):
+class InvoiceLineSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Serializer for invoice lines."""
     
     account_code = serializers.CharField(source="account.code", read_only=True)
@@ -134,7 +145,18 @@ class InvoiceLineCreateSerializer(serializers.Serializer):
     is_bcrs_deposit = serializers.BooleanField(default=False)
 
 
-class InvoiceDocumentListSerializer(serializers.ModelSerializer):
+class InvoiceDocumentListQuerySerializer(CachedFieldsSerializerMixin, serializers.Serializer):
+    """Query parameters for the document list."""
+    
+    type = serializers.CharField(required=False, allow_blank=True)
+    status = serializers.CharField(required=False, allow_blank=True)
+    contact_id = serializers.UUIDField(required=False)
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    search = serializers.CharField(required=False, allow_blank=True)
+
+
+class InvoiceDocumentListSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Lightweight serializer for document list views."""
     
     contact_name = serializers.CharField(source="contact.name", read_only=True)
@@ -154,7 +176,7 @@ class InvoiceDocumentListSerializer(serializers.ModelSerializer):
         return obj.status.replace("_", " ").title()
 
 
-class InvoiceDocumentDetailSerializer(serializers.ModelSerializer):
+class InvoiceDocumentDetailSerializer(CachedFieldsSerializerMixin, serializers.ModelSerializer):
     """Detailed serializer for document views."""
     
     contact = ContactListSerializer(read_only=True)
@@ -8,12 +8,46 @@ Manages customers and suppliers including:
 - Customer/Supplier categorization
 """
 
-from typing import Optional, List
+from typing import Any, Dict, Iterator, Optional, List, Tuple
 from uuid import UUID
 from datetime import date, timedelta
 
 from apps.core.models import Contact
 from common.exceptions import ValidationError, DuplicateResource, ResourceNotFound
+from common.middleware.request_memo import request_memo
+from common.pagination import keyset_page
+
+
+# Request memo slot for get_contact_memoised results
+_CONTACT_MEMO_KEY = "invoicing:contact"
+
+
+def clear_contact_memo() -> None:
+    """Forget contacts memoised for the current request after a write."""
+    memo = request_memo()
+    if memo is not None:
+        memo.pop(_CONTACT_MEMO_KEY, None)
+
+
+# Columns loaded for contact lists (see ContactListSerializer)
+_CONTACT_LIST_FIELDS = (
+    "id",
+    "org_id",
+    "name",
+    "company_name",
+    "email",
+    "phone",
+    "uen",
+    "is_customer",
+    "is_supplier",
+    "is_active",
+)
+
+# Columns written by contact exports (see ContactListSerializer)
+_CONTACT_EXPORT_FIELDS = tuple(field for field in _CONTACT_LIST_FIELDS if field != "org_id")
+
+# Rows fetched per server-side cursor round trip during exports
+_EXPORT_CHUNK_SIZE = 2000
 
 
 class ContactService:
@@ -40,6 +74,78 @@ class ContactService:
         Returns:
             List of Contact instances
         """
+        queryset = ContactService._filter_contacts(
+            org_id, is_customer, is_supplier, is_active, search
+        )
+        return list(queryset.order_by("name"))
+    
+    @staticmethod
+    def list_contacts_page(
+        org_id: UUID,
+        is_customer: Optional[bool] = None,
+        is_supplier: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 50,
+    ) -> Tuple[List[Contact], Optional[str]]:
+        """
+        List one page of contacts, ordered by name.
+        
+        Takes the same filters as list_contacts(). Only the list columns
+        (_CONTACT_LIST_FIELDS) are loaded.
+        
+        Args:
+            cursor: next_cursor from the previous page, or None
+            page_size: Contacts per page
+            
+        Returns:
+            Tuple of (contacts, next_cursor); next_cursor is None on the last page
+        """
+        queryset = ContactService._filter_contacts(
+            org_id, is_customer, is_supplier, is_active, search
+        ).only(*_CONTACT_LIST_FIELDS)
+        return keyset_page(queryset, ("name", "id"), cursor, page_size)
+    
+    @staticmethod
+    def iter_contacts(
+        org_id: UUID,
+        is_customer: Optional[bool] = None,
+        is_supplier: Optional[bool] = None,
+        is_active: Optional[bool] = None,
+        search: Optional[str] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over every matching contact, ordered by name, for exports.
+        
+        Takes the same filters as list_contacts(). Rows are plain dicts of
+        _CONTACT_EXPORT_FIELDS read through a server-side cursor, so no
+        Contact instances are built and only one chunk is held at a time.
+        The query runs on first iteration, so the iterator must be consumed
+        inside a transaction with the RLS context set (ndjson_response
+        opens one while streaming).
+        
+        Returns:
+            Iterator of contact dicts
+        """
+        queryset = ContactService._filter_contacts(
+            org_id, is_customer, is_supplier, is_active, search
+        )
+        return (
+            queryset.order_by("name", "id")
+            .values(*_CONTACT_EXPORT_FIELDS)
+            .iterator(chunk_size=_EXPORT_CHUNK_SIZE)
+        )
+    
+    @staticmethod
+    def _filter_contacts(
+        org_id: UUID,
+        is_customer: Optional[bool],
+        is_supplier: Optional[bool],
+        is_active: Optional[bool],
+        search: Optional[str],
+    ):
+        """Build the filtered contact queryset shared by the list methods."""
         queryset = Contact.objects.filter(org_id=org_id)
         
         if is_customer is not None:
@@ -59,7 +165,7 @@ class ContactService:
                 models.Q(company_name__icontains=search)
             )
         
-        return list(queryset.order_by("name"))
+        return queryset
     
     @staticmethod
     def get_contact(org_id: UUID, contact_id: UUID) -> Contact:
@@ -78,6 +184,54 @@ class ContactService:
         except Contact.DoesNotExist:
             raise ResourceNotFound(f"Contact {contact_id} not found")
     
+    @staticmethod
+    def get_contact_etag(org_id: UUID, contact_id: UUID) -> str:
+        """
+        Get an entity tag for a contact's detail representation.
+        
+        Args:
+            org_id: Organisation ID
+            contact_id: Contact ID
+            
+        Returns:
+            Quoted ETag value derived from updated_at
+        """
+        try:
+            updated_at = Contact.objects.values_list("updated_at", flat=True).get(
+                id=contact_id, org_id=org_id
+            )
+        except Contact.DoesNotExist:
+            raise ResourceNotFound(f"Contact {contact_id} not found")
+        
+        return f'"contact-{int(updated_at.timestamp() * 1_000_000):x}"'
+    
+    @staticmethod
+    def get_contact_memoised(org_id: UUID, contact_id: UUID) -> Contact:
+        """
+        Get contact by ID, reusing the instance within the current request.
+        
+        For callers creating several documents for the same contact (e.g.
+        imports), so the contact and its snapshot are loaded once.
+        
+        Args:
+            org_id: Organisation ID
+            contact_id: Contact ID
+            
+        Returns:
+            Contact instance
+        """
+        memo = request_memo()
+        if memo is not None:
+            contacts = memo.setdefault(_CONTACT_MEMO_KEY, {})
+            if (org_id, contact_id) in contacts:
+                return contacts[(org_id, contact_id)]
+        
+        contact = ContactService.get_contact(org_id, contact_id)
+        
+        if memo is not None:
+            contacts[(org_id, contact_id)] = contact
+        return contact
+    
     @staticmethod
     def create_contact(
         org_id: UUID,
@@ -208,6 +362,7 @@ class ContactService:
                 setattr(contact, key, value)
         
         contact.save()
+        clear_contact_memo()
         return contact
     
     @staticmethod
@@ -238,6 +393,7 @@ class ContactService:
         
         contact.is_active = False
         contact.save()
+        clear_contact_memo()
         
         return contact
     
@@ -19,12 +19,17 @@ from django.db import connection, transaction
 from django.template.loader import render_to_string
 from django.utils import timezone
 from django.db import models
+from django.db.models import Prefetch, Sum
+from django.db.models.expressions import RawSQL
 
 from weasyprint import HTML
-from apps.core.models import InvoiceDocument, InvoiceLine, Contact, Account
+from apps.core.models import InvoiceDocument, InvoiceLine, Account
 from apps.gst.services import TaxCodeService, GSTCalculationService
+from apps.gst.services.calculation_service import invalidate_f5_cache
+from apps.invoicing.services.contact_service import ContactService
 from common.exceptions import ValidationError, DuplicateResource, ResourceNotFound
-from common.decimal_utils import money, sum_money
+from common.decimal_utils import money
+from common.pagination import keyset_page
 
 
 # Document type definitions - matches SQL ENUM invoicing.doc_type
@@ -50,6 +55,84 @@ STATUS_TRANSITIONS = {
     "OVERDUE": ["PAID", "VOID"],
 }
 
+# Set form of STATUS_TRANSITIONS for membership checks, and the error
+# message text per status; STATUS_TRANSITIONS stays ordered lists for the API
+_ALLOWED_TRANSITIONS = {
+    status: frozenset(targets) for status, targets in STATUS_TRANSITIONS.items()
+}
+_TRANSITIONS_TEXT = {
+    status: ", ".join(targets) or "none" for status, targets in STATUS_TRANSITIONS.items()
+}
+_INVALID_DOCUMENT_TYPE_MESSAGE = f"Invalid document type. Valid: {', '.join(DOCUMENT_TYPES)}"
+
+# Columns loaded for document lists (see InvoiceDocumentListSerializer)
+_DOCUMENT_LIST_FIELDS = (
+    "id",
+    "org_id",
+    "document_type",
+    "document_number",
+    "contact_id",
+    "issue_date",
+    "due_date",
+    "status",
+    "currency",
+    "reference",
+    "total_excl",
+    "gst_total",
+    "total_incl",
+)
+
+# Document total columns maintained from the lines by trg_document_line_totals_*
+_DOCUMENT_TOTAL_FIELDS = ("total_excl", "gst_total", "total_incl", "updated_at")
+
+# Copies every line of one document (second param) onto another (first),
+# keeping the quoted prices, tax rate snapshots and computed amounts
+_COPY_LINES_SQL = """
+    INSERT INTO invoicing.document_line (
+        document_id, org_id, line_number, description, account_id,
+        quantity, unit_of_measure, unit_price, discount_pct, discount_amount,
+        tax_code_id, tax_rate, is_tax_inclusive,
+        line_amount, gst_amount, total_amount,
+        base_line_amount, base_gst_amount, base_total_amount,
+        is_bcrs_deposit, item_id, item_code
+    )
+    SELECT
+        %s, org_id, line_number, description, account_id,
+        quantity, unit_of_measure, unit_price, discount_pct, discount_amount,
+        tax_code_id, tax_rate, is_tax_inclusive,
+        line_amount, gst_amount, total_amount,
+        base_line_amount, base_gst_amount, base_total_amount,
+        is_bcrs_deposit, item_id, item_code
+    FROM invoicing.document_line
+    WHERE document_id = %s
+    ORDER BY line_number
+"""
+
+# Re-aggregate a document's totals from its lines in one statement
+_RECALCULATE_TOTALS_SQL = """
+    UPDATE invoicing.document d
+    SET subtotal     = t.subtotal,
+        total_gst    = t.total_gst,
+        total_amount = t.subtotal + t.total_gst,
+        updated_at   = NOW()
+    FROM (
+        SELECT COALESCE(SUM(line_amount), 0) AS subtotal,
+               COALESCE(SUM(gst_amount), 0) AS total_gst
+        FROM invoicing.document_line
+        WHERE document_id = %s
+    ) t
+    WHERE d.id = %s
+    RETURNING d.subtotal, d.total_gst, d.total_amount, d.updated_at
+"""
+
+
+def _lines_prefetch() -> Prefetch:
+    """Prefetch for document lines as rendered (account and tax code joined)."""
+    return Prefetch(
+        "lines",
+        queryset=InvoiceLine.objects.select_related("account", "tax_code").order_by("line_number"),
+    )
+
 
 class DocumentService:
     """Service class for invoice document operations."""
@@ -63,6 +146,7 @@ class DocumentService:
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
         search: Optional[str] = None,
+        include_snapshot: bool = False,
     ) -> List[InvoiceDocument]:
         """
         List invoice documents.
@@ -75,10 +159,93 @@ class DocumentService:
             date_from: Filter from date
             date_to: Filter to date
             search: Search document number
+            include_snapshot: Load full rows (contact_snapshot, notes, ...)
+                instead of only the list columns
 
         Returns:
             List of InvoiceDocument instances
         """
+        queryset = DocumentService._filter_documents(
+            org_id, document_type, status, contact_id, date_from, date_to, search
+        )
+
+        # List serializers show the contact name; join it instead of N+1
+        queryset = queryset.select_related("contact")
+        if not include_snapshot:
+            queryset = queryset.only(*_DOCUMENT_LIST_FIELDS, "contact__name")
+
+        return list(queryset.order_by("-issue_date", "-document_number"))
+
+    @staticmethod
+    def list_documents_page(
+        org_id: UUID,
+        document_type: Optional[str] = None,
+        status: Optional[str] = None,
+        contact_id: Optional[UUID] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        search: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 50,
+    ) -> Tuple[List[InvoiceDocument], Optional[str]]:
+        """
+        List one page of invoice documents, newest first.
+
+        Takes the same filters as list_documents(). Pages follow the
+        (issue_date, document_number) ordering served by
+        idx_document_org_date_number.
+
+        Args:
+            cursor: next_cursor from the previous page, or None
+            page_size: Documents per page
+
+        Returns:
+            Tuple of (documents, next_cursor); next_cursor is None on the last page
+        """
+        queryset = DocumentService._filter_documents(
+            org_id, document_type, status, contact_id, date_from, date_to, search
+        )
+        queryset = queryset.select_related("contact").only(*_DOCUMENT_LIST_FIELDS, "contact__name")
+
+        return keyset_page(queryset, ("-issue_date", "-document_number"), cursor, page_size)
+
+    @staticmethod
+    def list_documents_values(
+        org_id: UUID,
+        document_type: Optional[str] = None,
+        status: Optional[str] = None,
+        contact_id: Optional[UUID] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        search: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        List invoice documents as plain dicts of the list columns.
+
+        For grid and summary callers that need no model instances; takes
+        the same filters as list_documents().
+
+        Returns:
+            List of dicts keyed by _DOCUMENT_LIST_FIELDS
+        """
+        queryset = DocumentService._filter_documents(
+            org_id, document_type, status, contact_id, date_from, date_to, search
+        )
+        return list(
+            queryset.order_by("-issue_date", "-document_number").values(*_DOCUMENT_LIST_FIELDS)
+        )
+
+    @staticmethod
+    def _filter_documents(
+        org_id: UUID,
+        document_type: Optional[str],
+        status: Optional[str],
+        contact_id: Optional[UUID],
+        date_from: Optional[date],
+        date_to: Optional[date],
+        search: Optional[str],
+    ):
+        """Build the filtered document queryset shared by the list methods."""
         queryset = InvoiceDocument.objects.filter(org_id=org_id)
 
         if document_type:
@@ -97,24 +264,61 @@ class DocumentService:
             queryset = queryset.filter(issue_date__lte=date_to)
 
         if search:
+            # ILIKE '%...%' is served by the idx_document_number_search trigram index
             queryset = queryset.filter(document_number__icontains=search)
 
-        return list(queryset.order_by("-issue_date", "-document_number"))
+        return queryset
+
+    @staticmethod
+    def get_document_etag(org_id: UUID, document_id: UUID) -> str:
+        """
+        Get an entity tag for a document's detail representation.
+
+        Built from the document's and its contact's updated_at in one
+        indexed row fetch. Line changes move the document's totals (via
+        the trg_document_line_totals_* triggers), which bumps its updated_at.
+
+        Args:
+            org_id: Organisation ID
+            document_id: Document ID
+
+        Returns:
+            Quoted ETag value
+        """
+        try:
+            updated_at, contact_updated_at = InvoiceDocument.objects.values_list(
+                "updated_at", "contact__updated_at"
+            ).get(id=document_id, org_id=org_id)
+        except InvoiceDocument.DoesNotExist:
+            raise ResourceNotFound(f"Document {document_id} not found")
+
+        stamp = int(updated_at.timestamp() * 1_000_000)
+        contact_stamp = int(contact_updated_at.timestamp() * 1_000_000)
+        return f'"doc-{stamp:x}-{contact_stamp:x}"'
 
     @staticmethod
-    def get_document(org_id: UUID, document_id: UUID) -> InvoiceDocument:
+    def get_document(
+        org_id: UUID, document_id: UUID, with_lines: bool = False
+    ) -> InvoiceDocument:
         """
         Get document by ID.
 
         Args:
             org_id: Organisation ID
             document_id: Document ID
+            with_lines: Prefetch lines (with account and tax code) for
+                read paths that render them; leave off before mutating
+                lines, as the prefetched list would go stale
 
         Returns:
             InvoiceDocument instance
         """
+        queryset = InvoiceDocument.objects.select_related("contact")
+        if with_lines:
+            queryset = queryset.prefetch_related(_lines_prefetch())
+
         try:
-            return InvoiceDocument.objects.get(id=document_id, org_id=org_id)
+            return queryset.get(id=document_id, org_id=org_id)
         except InvoiceDocument.DoesNotExist:
             raise ResourceNotFound(f"Document {document_id} not found")
 
@@ -148,44 +352,23 @@ class DocumentService:
             Created InvoiceDocument instance
         """
         if document_type not in DOCUMENT_TYPES:
-            valid_types = ", ".join(DOCUMENT_TYPES.keys())
-            raise ValidationError(f"Invalid document type. Valid: {valid_types}")
+            raise ValidationError(_INVALID_DOCUMENT_TYPE_MESSAGE)
 
-        # Get contact
-        try:
-            contact = Contact.objects.get(id=contact_id, org_id=org_id)
-        except Contact.DoesNotExist:
-            raise ResourceNotFound(f"Contact {contact_id} not found")
+        contact = ContactService.get_contact_memoised(org_id, contact_id)
 
         # Calculate due date if not provided
         if due_date is None:
             due_date = issue_date + timedelta(days=contact.payment_terms_days)
 
-        # Get next document number
-        document_number = DocumentService._get_next_document_number(org_id, document_type)
-
         with transaction.atomic():
-            # Create document
+            # Create document; the number is drawn from the sequence inside
+            # the INSERT itself and read back via RETURNING
             document = InvoiceDocument.objects.create(
                 org_id=org_id,
                 document_type=document_type,
-                document_number=document_number,
+                document_number=DocumentService._next_document_number_sql(org_id, document_type),
                 contact=contact,
-                contact_snapshot={
-                    "name": contact.name,
-                    "company_name": contact.company_name,
-                    "email": contact.email,
-                    "phone": contact.phone,
-                    "address": {
-                        "line1": contact.address_line_1,
-                        "line2": contact.address_line_2,
-                        "city": contact.city,
-                        "postal_code": contact.postal_code,
-                        "country": contact.country,
-                    },
-                    "uen": contact.uen,
-                    "peppol_id": contact.peppol_id,
-                },
+                contact_snapshot=contact.snapshot,
                 issue_date=issue_date,
                 due_date=due_date,
                 reference=reference,
@@ -194,10 +377,15 @@ class DocumentService:
                 created_by_id=user_id,
             )
 
+            if not isinstance(document.document_number, str):
+                # Backend without RETURNING for expression values
+                document.refresh_from_db(fields=["document_number"])
+
             # Add lines
             if lines:
                 DocumentService._add_lines(org_id, document, lines)
-                DocumentService._recalculate_totals(document)
+                # Totals were maintained by the line totals triggers
+                document.refresh_from_db(fields=_DOCUMENT_TOTAL_FIELDS)
 
         return document
 
@@ -222,12 +410,15 @@ class DocumentService:
             )
 
         allowed_fields = ["due_date", "reference", "notes"]
+        update_fields = []
 
         for key, value in updates.items():
             if key in allowed_fields and hasattr(document, key):
                 setattr(document, key, value)
+                update_fields.append(key)
 
-        document.save()
+        if update_fields:
+            document.save(update_fields=update_fields + ["updated_at"])
         return document
 
     @staticmethod
@@ -274,44 +465,55 @@ class DocumentService:
         last_line = document.lines.order_by('-line_number').first()
         line_number = (last_line.line_number + 1) if last_line else 1
 
-        # Calculate line totals
-        quantity = Decimal(str(quantity))
-        unit_price = money(unit_price)
-        amount = (quantity * unit_price).quantize(Decimal("0.01"))
-
-        # Get tax code and calculate GST
+        # Get tax code and build the line with its GST
         tax_code = TaxCodeService.get_tax_code(org_id, tax_code_id)
-        gst_result = GSTCalculationService.calculate_line_gst(
-            amount=amount, rate=tax_code.rate or Decimal("0.00"), is_bcrs_deposit=is_bcrs_deposit
-        )
-
-        # Calculate line amounts
-        line_amount = quantity * unit_price
-        gst_amount = gst_result["gst_amount"]
-        total_amount = line_amount + gst_amount
-        
-        line = InvoiceLine.objects.create(
+        line = DocumentService._build_line(
             org_id=org_id,
             document=document,
             line_number=line_number,
             account=account,
-            description=description.strip(),
+            tax_code=tax_code,
+            description=description,
             quantity=quantity,
             unit_price=unit_price,
-            line_amount=line_amount,
-            gst_amount=gst_amount,
-            total_amount=total_amount,
-            tax_code=tax_code,
-            tax_rate=tax_code.rate or Decimal("0.00"),
             is_bcrs_deposit=is_bcrs_deposit,
             **kwargs,
         )
-
-        # Recalculate document totals
-        DocumentService._recalculate_totals(document)
+        # Document totals are updated by trg_document_line_totals_insert
+        line.save(force_insert=True)
 
         return line
 
+    @staticmethod
+    def add_lines(
+        org_id: UUID, document_id: UUID, lines: List[Dict[str, Any]]
+    ) -> List[InvoiceLine]:
+        """
+        Add several lines to a document in one transaction.
+
+        Lines are inserted with a single bulk_create; the document totals
+        are maintained by trg_document_line_totals_insert,
+        once for the whole statement.
+
+        Args:
+            org_id: Organisation ID
+            document_id: Document ID
+            lines: List of line dictionaries
+
+        Returns:
+            Created InvoiceLine instances
+        """
+        if not lines:
+            raise ValidationError("At least one line is required.")
+
+        with transaction.atomic():
+            document = DocumentService.get_document(org_id, document_id)
+
+            if document.status != "DRAFT":
+                raise ValidationError("Can only add lines to DRAFT documents.")
+
+            return DocumentService._add_lines(org_id, document, lines)
+
     @staticmethod
     def remove_line(org_id: UUID, document_id: UUID, line_id: UUID) -> None:
         """
@@ -333,9 +535,6 @@ class DocumentService:
         except InvoiceLine.DoesNotExist:
             raise ResourceNotFound(f"Line {line_id} not found")
 
-        # Recalculate totals
-        DocumentService._recalculate_totals(document)
-
     @staticmethod
     def transition_status(
         org_id: UUID, document_id: UUID, new_status: str, user_id: Optional[UUID] = None
@@ -352,40 +551,138 @@ class DocumentService:
         Returns:
             Updated InvoiceDocument instance
         """
-        document = DocumentService.get_document(org_id, document_id)
+        with transaction.atomic():
+            # Lock the row so concurrent transitions (e.g. two approvals)
+            # serialise and the second sees the first one's status
+            try:
+                document = InvoiceDocument.objects.select_for_update().get(
+                    id=document_id, org_id=org_id
+                )
+            except InvoiceDocument.DoesNotExist:
+                raise ResourceNotFound(f"Document {document_id} not found")
+
+            update_fields = DocumentService._apply_transition(
+                org_id, document, new_status, user_id
+            )
+            document.save(update_fields=update_fields)
+
+        return document
 
-        # Validate transition
-        valid_transitions = STATUS_TRANSITIONS.get(document.status, [])
-        if new_status not in valid_transitions:
+    @staticmethod
+    def bulk_transition_status(
+        org_id: UUID,
+        document_ids: List[UUID],
+        new_status: str,
+        user_id: Optional[UUID] = None,
+        skip_locked: bool = False,
+        skip_current: bool = False,
+    ) -> List[InvoiceDocument]:
+        """
+        Transition several documents to the same status.
+
+        Documents are locked and fetched in one query and written with
+        bulk_update. Every transition is validated before anything is
+        written, so an invalid document leaves the whole batch unchanged.
+
+        Args:
+            org_id: Organisation ID
+            document_ids: Document IDs
+            new_status: Target status
+            user_id: User making the transition
+            skip_locked: Skip documents another transaction has locked
+                instead of waiting for them (for parallel batch workers);
+                skipped IDs are left out of the result, not reported missing
+            skip_current: Leave documents already in new_status untouched
+                and out of the result, so re-running a batch is a no-op for them
+
+        Returns:
+            Updated InvoiceDocument instances
+        """
+        with transaction.atomic():
+            documents = (
+                InvoiceDocument.objects.filter(org_id=org_id)
+                .select_for_update(skip_locked=skip_locked)
+                .in_bulk(document_ids)
+            )
+            if not skip_locked:
+                for document_id in document_ids:
+                    if document_id not in documents:
+                        raise ResourceNotFound(f"Document {document_id} not found")
+            if skip_current:
+                documents = {
+                    document_id: document
+                    for document_id, document in documents.items()
+                    if document.status != new_status
+                }
+
+            for document in documents.values():
+                DocumentService._check_transition(document, new_status)
+
+            update_fields = set()
+            for document in documents.values():
+                update_fields.update(
+                    DocumentService._apply_transition(org_id, document, new_status, user_id)
+                )
+                # bulk_update bypasses auto_now
+                document.updated_at = timezone.now()
+
+            if documents:
+                InvoiceDocument.objects.bulk_update(
+                    list(documents.values()), sorted(update_fields), batch_size=500
+                )
+                # bulk_update sends no post_save, so drop cached F5 boxes here
+                invalidate_f5_cache(org_id)
+
+        return list(documents.values())
+
+    @staticmethod
+    def _check_transition(document: InvoiceDocument, new_status: str) -> None:
+        """Raise ValidationError unless document may move to new_status."""
+        if new_status not in _ALLOWED_TRANSITIONS.get(document.status, ()):
             raise ValidationError(
                 f"Cannot transition from '{document.status}' to '{new_status}'. "
-                f"Valid transitions: {', '.join(valid_transitions) or 'none'}"
+                f"Valid transitions: {_TRANSITIONS_TEXT.get(document.status, 'none')}"
             )
 
-        with transaction.atomic():
-            old_status = document.status
-            document.status = new_status
+    @staticmethod
+    def _apply_transition(
+        org_id: UUID, document: InvoiceDocument, new_status: str, user_id: Optional[UUID]
+    ) -> List[str]:
+        """
+        Validate and apply a status transition in memory.
 
-            # Status-specific actions
-            if new_status == "APPROVED":
-                document.approved_at = timezone.now()
-                document.approved_by_id = user_id
+        Runs the status-specific journal actions; the caller saves.
+
+        Returns:
+            Names of the fields to save
+        """
+        DocumentService._check_transition(document, new_status)
 
-                # Post journal entry (for invoices/credit notes)
-                if document.document_type in ["SALES_INVOICE", "SALES_CREDIT_NOTE", "SALES_DEBIT_NOTE", "PURCHASE_INVOICE", "PURCHASE_CREDIT_NOTE", "PURCHASE_DEBIT_NOTE"]:
-                    DocumentService._post_journal_entry(org_id, document)
+        document.status = new_status
+        update_fields = ["status", "updated_at"]
 
-            elif new_status == "VOID":
-                document.voided_at = timezone.now()
-                document.voided_by_id = user_id
+        # Status-specific actions
+        if new_status == "APPROVED":
+            document.approved_at = timezone.now()
+            document.approved_by_id = user_id
+            update_fields += ["approved_at", "approved_by"]
 
-                # Reverse journal entry if posted
-                if document.journal_entry_id:
-                    DocumentService._reverse_journal_entry(org_id, document)
+            # Post journal entry (for invoices/credit notes)
+            if document.document_type in ["SALES_INVOICE", "SALES_CREDIT_NOTE", "SALES_DEBIT_NOTE", "PURCHASE_INVOICE", "PURCHASE_CREDIT_NOTE", "PURCHASE_DEBIT_NOTE"]:
+                DocumentService._post_journal_entry(org_id, document)
+                update_fields.append("journal_entry")
 
-            document.save()
+        elif new_status == "VOID":
+            document.voided_at = timezone.now()
+            document.voided_by_id = user_id
+            update_fields += ["voided_at", "voided_by"]
 
-        return document
+            # Reverse journal entry if posted
+            if document.journal_entry_id:
+                DocumentService._reverse_journal_entry(org_id, document)
+                update_fields.append("journal_entry")
+
+        return update_fields
 
     @staticmethod
     def convert_quote_to_invoice(
@@ -411,21 +708,7 @@ class DocumentService:
             raise ValidationError(f"Cannot convert quote in status '{quote.status}'.")
 
         with transaction.atomic():
-            # Get lines from quote
-            lines = []
-            for line in quote.lines.all():
-                lines.append(
-                    {
-                        "account_id": line.account_id,
-                        "description": line.description,
-                        "quantity": line.quantity,
-                        "unit_price": line.unit_price,
-                        "tax_code_id": line.tax_code_id,
-                        "is_bcrs_deposit": line.is_bcrs_deposit,
-                    }
-                )
-
-            # Create invoice
+            # Create the invoice shell; lines are copied below
             invoice = DocumentService.create_document(
                 org_id=org_id,
                 document_type="SALES_INVOICE",
@@ -434,17 +717,45 @@ class DocumentService:
                 due_date=date.today() + timedelta(days=quote.contact.payment_terms_days),
                 reference=f"Quote {quote.document_number}",
                 notes=quote.notes,
-                lines=lines,
+                lines=None,
                 user_id=user_id,
             )
 
+            # Copy the quote's lines server-side in one statement; totals
+            # follow via trg_document_line_totals_insert
+            with connection.cursor() as cursor:
+                cursor.execute(_COPY_LINES_SQL, [str(invoice.id), str(quote.id)])
+            invoice.refresh_from_db(fields=_DOCUMENT_TOTAL_FIELDS)
+
             # Mark quote as approved (converted) - use valid status from SQL enum
             quote.status = "APPROVED"
             quote.converted_to_id = invoice.id
-            quote.save()
+            quote.save(update_fields=["status", "updated_at"])
 
         return invoice
 
+    @staticmethod
+    def _next_document_number_sql(org_id: UUID, document_type: str) -> RawSQL:
+        """
+        Build the next document number as a SQL expression.
+
+        Assigned to document_number on create, so the sequence call runs
+        inside the INSERT instead of as a separate round trip. Formats
+        like _get_next_document_number() (zero-padded to at least 5).
+
+        Args:
+            org_id: Organisation ID
+            document_type: Document type
+
+        Returns:
+            RawSQL expression evaluating to e.g. "INV-00042"
+        """
+        return RawSQL(
+            "(SELECT %s || '-' || CASE WHEN n < 100000 THEN lpad(n::text, 5, '0') ELSE n::text END"
+            " FROM core.get_next_document_number(%s, %s) AS n)",
+            (DOCUMENT_TYPES[document_type]["prefix"], str(org_id), document_type),
+        )
+
     @staticmethod
     def _get_next_document_number(org_id: UUID, document_type: str) -> str:
         """
@@ -468,49 +779,180 @@ class DocumentService:
         return f"{prefix}-{next_num:05d}"
 
     @staticmethod
-    def _add_lines(org_id: UUID, document: InvoiceDocument, lines: List[Dict[str, Any]]) -> None:
+    def _build_line(
+        org_id: UUID,
+        document: InvoiceDocument,
+        line_number: int,
+        account: Account,
+        tax_code,
+        description: str,
+        quantity: Decimal,
+        unit_price: Decimal,
+        is_bcrs_deposit: bool = False,
+        gst_amount: Optional[Decimal] = None,
+        **kwargs,
+    ) -> InvoiceLine:
+        """
+        Build an unsaved line with its amounts and GST calculated.
+
+        Args:
+            org_id: Organisation ID
+            document: InvoiceDocument instance
+            line_number: Line number within the document
+            account: Revenue account
+            tax_code: TaxCode instance
+            description: Line description
+            quantity: Quantity
+            unit_price: Unit price
+            is_bcrs_deposit: Whether BCRS deposit
+            gst_amount: GST already calculated by the caller (batch path)
+            **kwargs: Additional fields
+
+        Returns:
+            Unsaved InvoiceLine instance
+        """
+        quantity = Decimal(str(quantity))
+        unit_price = money(unit_price)
+        rate = tax_code.rate or Decimal("0.00")
+        line_amount = quantity * unit_price
+
+        if gst_amount is None:
+            # GST is calculated on the line amount rounded to cents
+            gst_amount = GSTCalculationService.calculate_line_gst(
+                amount=line_amount.quantize(Decimal("0.01")),
+                rate=rate,
+                is_bcrs_deposit=is_bcrs_deposit,
+            )["gst_amount"]
+
+        return InvoiceLine(
+            org_id=org_id,
+            document=document,
+            line_number=line_number,
+            account=account,
+            description=description.strip(),
+            quantity=quantity,
+            unit_price=unit_price,
+            line_amount=line_amount,
+            gst_amount=gst_amount,
+            total_amount=line_amount + gst_amount,
+            tax_code=tax_code,
+            tax_rate=rate,
+            is_bcrs_deposit=is_bcrs_deposit,
+            **kwargs,
+        )
+
+    @staticmethod
+    def _add_lines(
+        org_id: UUID, document: InvoiceDocument, lines: List[Dict[str, Any]]
+    ) -> List[InvoiceLine]:
         """
         Add multiple lines to a document.
 
+        Accounts and tax codes are fetched with one query each and the
+        lines inserted with bulk_create. Document totals are not
+        recalculated; the caller does that once afterwards.
+
         Args:
             org_id: Organisation ID
             document: InvoiceDocument instance
             lines: List of line dictionaries
+
+        Returns:
+            Created InvoiceLine instances
         """
+        parsed = []
         for line_data in lines:
             account_id = line_data.get("account_id")
             if not account_id:
                 raise ValidationError("Line must have an account_id.")
+            parsed.append((
+                UUID(str(account_id)),
+                UUID(str(line_data.get("tax_code_id"))),
+                line_data,
+            ))
+
+        account_ids = {account_id for account_id, _, _ in parsed}
+        accounts = Account.objects.filter(org_id=org_id).in_bulk(account_ids)
+        for account_id in account_ids:
+            if account_id not in accounts:
+                raise ResourceNotFound(f"Account {account_id} not found")
+
+        tax_codes = TaxCodeService.get_tax_codes_bulk(
+            org_id, (tax_code_id for _, tax_code_id, _ in parsed)
+        )
 
-            DocumentService.add_line(
-                org_id=org_id,
-                document_id=document.id,
-                account_id=UUID(str(account_id)),
-                description=line_data.get("description", ""),
-                quantity=Decimal(str(line_data.get("quantity", 1))),
-                unit_price=money(line_data.get("unit_price", 0)),
-                tax_code_id=UUID(str(line_data.get("tax_code_id"))),
-                is_bcrs_deposit=line_data.get("is_bcrs_deposit", False),
-            )
+        # GST for every line in one batch; amounts are rounded to cents
+        # exactly as _build_line() does for a single line
+        gst_amounts = GSTCalculationService.calculate_lines_gst(
+            [
+                (
+                    Decimal(str(line_data.get("quantity", 1)))
+                    * money(line_data.get("unit_price", 0))
+                ).quantize(Decimal("0.01"))
+                for _, _, line_data in parsed
+            ],
+            [tax_codes[tax_code_id].rate or Decimal("0.00") for _, tax_code_id, _ in parsed],
+            [bool(line_data.get("is_bcrs_deposit", False)) for _, _, line_data in parsed],
+        )
+
+        last_line = document.lines.order_by('-line_number').first()
+        first_number = (last_line.line_number + 1) if last_line else 1
+
+        return InvoiceLine.objects.bulk_create(
+            [
+                DocumentService._build_line(
+                    org_id=org_id,
+                    document=document,
+                    line_number=first_number + index,
+                    account=accounts[account_id],
+                    tax_code=tax_codes[tax_code_id],
+                    description=line_data.get("description", ""),
+                    quantity=line_data.get("quantity", 1),
+                    unit_price=line_data.get("unit_price", 0),
+                    is_bcrs_deposit=line_data.get("is_bcrs_deposit", False),
+                    gst_amount=gst_amount,
+                )
+                for index, ((account_id, tax_code_id, line_data), gst_amount)
+                in enumerate(zip(parsed, gst_amounts))
+            ],
+            batch_size=500,
+        )
 
     @staticmethod
     def _recalculate_totals(document: InvoiceDocument) -> None:
         """
-        Recalculate document totals from lines.
+        Recalculate document totals from lines with one UPDATE ... FROM.
+
+        Totals are kept current by the trg_document_line_totals_* triggers;
+        this is a repair utility for documents whose totals have drifted.
 
         Args:
             document: InvoiceDocument instance
         """
-        lines = document.lines.all()
+        if connection.vendor == "postgresql":
+            # Aggregate and update in one round trip
+            with connection.cursor() as cursor:
+                cursor.execute(_RECALCULATE_TOTALS_SQL, [str(document.id), str(document.id)])
+                (
+                    document.total_excl,
+                    document.gst_total,
+                    document.total_incl,
+                    document.updated_at,
+                ) = cursor.fetchone()
+            return
+
+        totals = document.lines.aggregate(
+            subtotal=Sum("line_amount", default=Decimal("0")),
+            gst_total=Sum("gst_amount", default=Decimal("0")),
+        )
 
-        subtotal = sum_money(line.line_amount for line in lines)
-        gst_total = sum_money(line.gst_amount for line in lines)
-        total = subtotal + gst_total
+        subtotal = money(totals["subtotal"])
+        gst_total = money(totals["gst_total"])
 
         document.total_excl = subtotal
         document.gst_total = gst_total
-        document.total_incl = total
-        document.save()
+        document.total_incl = subtotal + gst_total
+        document.save(update_fields=_DOCUMENT_TOTAL_FIELDS)
 
     @staticmethod
     def _post_journal_entry(org_id: UUID, document: InvoiceDocument) -> None:
@@ -576,7 +1018,7 @@ class DocumentService:
             document.status = "APPROVED"
             document.approved_by = user
             document.approved_at = timezone.now()
-            document.save()
+            document.save(update_fields=["status", "approved_by", "approved_at", "updated_at"])
 
             # Create journal entries
             DocumentService._create_journal_entry(org_id, document)
@@ -634,7 +1076,7 @@ class DocumentService:
             document.status = "VOID"
             document.voided_by = user
             document.voided_at = timezone.now()
-            document.save()
+            document.save(update_fields=["status", "voided_by", "voided_at", "updated_at"])
 
             # Reverse journal entries
             DocumentService._reverse_journal_entry(org_id, document)
@@ -656,7 +1098,35 @@ class DocumentService:
         Raises:
             ResourceNotFound: If document doesn't exist
         """
-        context = DocumentService._get_pdf_context(org_id, document_id)
+        from apps.core.models import Organisation
+        
+        document = DocumentService.get_document(org_id, document_id, with_lines=True)
+        org = Organisation.objects.get(id=org_id)
+        
+        return DocumentService.render_pdf(document, org)
+
+    @staticmethod
+    def render_pdf(document: InvoiceDocument, org) -> io.BytesIO:
+        """
+        Render the PDF for an already loaded document.
+
+        For batch callers that fetch documents (with contact and lines
+        prefetched) and the organisation once up front.
+
+        Args:
+            document: InvoiceDocument with contact and lines loaded
+            org: The document's Organisation
+
+        Returns:
+            io.BytesIO: In-memory PDF stream
+        """
+        context = {
+            "document": document,
+            "org": org,
+            "contact": document.contact,
+            "lines": document.lines.all(),
+            "generated_at": timezone.now(),
+        }
         
         # Render HTML string
         html_string = render_to_string("invoicing/invoice_pdf.html", context)
@@ -669,22 +1139,22 @@ class DocumentService:
         return output
 
     @staticmethod
-    def _get_pdf_context(org_id: UUID, document_id: UUID) -> Dict[str, Any]:
-        """Gather all data needed for PDF rendering."""
-        from apps.core.models import Organisation
-        
-        document = DocumentService.get_document(org_id, document_id)
-        org = Organisation.objects.get(id=org_id)
-        contact = document.contact
-        lines = document.lines.all().order_by("line_number")
-        
-        return {
-            "document": document,
-            "org": org,
-            "contact": contact,
-            "lines": lines,
-            "generated_at": timezone.now(),
-        }
+    def documents_for_rendering(org_id: UUID, document_ids: List[UUID]) -> List[InvoiceDocument]:
+        """
+        Fetch documents with everything render_pdf() reads prefetched.
+
+        Args:
+            org_id: Organisation ID
+            document_ids: Document IDs
+
+        Returns:
+            InvoiceDocument instances (missing IDs are skipped)
+        """
+        return list(
+            InvoiceDocument.objects.filter(org_id=org_id, id__in=document_ids)
+            .select_related("contact")
+            .prefetch_related(_lines_prefetch())
+        )
 
     @staticmethod
     def send_email(org_id: UUID, document_id: UUID, email_data: dict) -> dict:
@@ -4,56 +4,127 @@ Asynchronous tasks for Invoicing module.
 
 import logging
 from uuid import UUID
-from celery import shared_task
+from celery import chain, shared_task
 
+from django.core.files import File
+from django.core.files.storage import default_storage
+from django.core import mail
 from django.core.mail import EmailMultiAlternatives
 from django.template.loader import render_to_string
 from django.conf import settings
 
 from apps.core.models import Organisation, InvoiceDocument, Contact
 from apps.invoicing.services import DocumentService
+from common.exceptions import ValidationError
 
 logger = logging.getLogger(__name__)
 
+# Documents locked and transitioned per transaction by bulk_transition_status_task
+BULK_TRANSITION_CHUNK_SIZE = 500
 
-@shared_task(bind=True, max_retries=3)
-def send_invoice_email_task(self, org_id: str, document_id: str, recipients: list):
+# Documents loaded and rendered per chunk by send_invoice_emails_batch_task
+EMAIL_BATCH_CHUNK_SIZE = 50
+
+
+def _invoice_pdf_key(org_id: str, document_id: str) -> str:
+    """Storage key for a document's rendered PDF."""
+    return f"invoices/{org_id}/{document_id}.pdf"
+
+
+def _build_invoice_email(
+    org,
+    document,
+    recipients: list,
+    pdf_bytes: bytes = None,
+    connection=None,
+) -> EmailMultiAlternatives:
+    """
+    Build the invoice email for a document.
+    
+    Attaches pdf_bytes when given.
+    """
+    context = {
+        "org_name": org.name,
+        "contact_name": document.contact.name,
+        "document_number": document.sequence_number,
+        "total_amount": document.total_incl,
+        "currency": org.base_currency,
+        "due_date": document.due_date,
+    }
+    
+    subject = f"Invoice {document.sequence_number} from {org.name}"
+    text_content = render_to_string("invoicing/email/invoice_email.txt", context)
+    html_content = render_to_string("invoicing/email/invoice_email.html", context)
+    
+    email = EmailMultiAlternatives(
+        subject=subject,
+        body=text_content,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=recipients,
+        connection=connection,
+    )
+    email.attach_alternative(html_content, "text/html")
+    
+    # Attach PDF
+    if pdf_bytes is not None:
+        email.attach(f"{document.sequence_number}.pdf", pdf_bytes, "application/pdf")
+    
+    return email
+
+
+@shared_task
+def send_invoice_email_task(org_id: str, document_id: str, recipients: list):
     """
     Background task to generate PDF and send invoice via email.
+    
+    Queues the render and delivery as a chain, so the PDF is written to
+    storage by one worker and the email sent by the next, without the
+    PDF bytes passing through the broker.
+    """
+    chain(
+        render_invoice_pdf_task.s(org_id, document_id),
+        deliver_invoice_email_task.s(org_id, document_id, recipients),
+    ).delay()
+    
+    return {"status": "queued", "document_id": document_id}
+
+
+@shared_task(bind=True, max_retries=3, acks_late=True, task_reject_on_worker_lost=True)
+def render_invoice_pdf_task(self, org_id: str, document_id: str) -> str:
+    """
+    Render a document's PDF into default storage.
+    
+    Returns:
+        Storage key of the saved PDF
     """
     try:
-        org = Organisation.objects.get(id=org_id)
-        document = InvoiceDocument.objects.get(id=document_id, org_id=org_id)
-        contact = document.contact
-        
-        context = {
-            "org_name": org.name,
-            "contact_name": contact.name,
-            "document_number": document.sequence_number,
-            "total_amount": document.total_incl,
-            "currency": org.base_currency,
-            "due_date": document.due_date,
-        }
+        key = _invoice_pdf_key(org_id, document_id)
+        pdf_stream = DocumentService.generate_pdf(UUID(org_id), UUID(document_id))
         
-        subject = f"Invoice {document.sequence_number} from {org.name}"
-        text_content = render_to_string("invoicing/email/invoice_email.txt", context)
-        html_content = render_to_string("invoicing/email/invoice_email.html", context)
+        # Re-renders replace the previous PDF instead of piling up copies
+        if default_storage.exists(key):
+            default_storage.delete(key)
+        return default_storage.save(key, File(pdf_stream))
         
-        email = EmailMultiAlternatives(
-            subject=subject,
-            body=text_content,
-            from_email=settings.DEFAULT_FROM_EMAIL,
-            to=recipients,
-        )
-        email.attach_alternative(html_content, "text/html")
+    except Exception as exc:
+        logger.error(f"Error rendering invoice PDF {document_id}: {exc}")
+        raise self.retry(exc=exc, countdown=60)
+
+
+@shared_task(bind=True, max_retries=3, acks_late=True, task_reject_on_worker_lost=True)
+def deliver_invoice_email_task(self, pdf_key: str, org_id: str, document_id: str, recipients: list):
+    """
+    Send an invoice email for a PDF already rendered to storage.
+    
+    The PDF is always attached: storage URLs are neither signed nor
+    expiring, so linking them would expose invoices to anyone with the URL.
+    """
+    try:
+        org = Organisation.objects.get(id=org_id)
+        document = InvoiceDocument.objects.select_related("contact").get(id=document_id, org_id=org_id)
         
-        # Attach PDF
-        pdf_stream = DocumentService.generate_pdf(UUID(org_id), UUID(document_id))
-        email.attach(
-            f"{document.sequence_number}.pdf",
-            pdf_stream.getvalue(),
-            "application/pdf"
-        )
+        with default_storage.open(pdf_key, "rb") as pdf_file:
+            email = _build_invoice_email(org, document, recipients, pdf_bytes=pdf_file.read())
         
         email.send()
         logger.info(f"Successfully sent invoice {document_id} to {recipients}")
@@ -63,3 +134,125 @@ def send_invoice_email_task(self, org_id: str, document_id: str, recipients: lis
     except Exception as exc:
         logger.error(f"Error sending invoice email {document_id}: {exc}")
         raise self.retry(exc=exc, countdown=60)
+
+
+@shared_task(bind=True, max_retries=3, acks_late=True, task_reject_on_worker_lost=True)
+def send_invoice_emails_batch_task(self, org_id: str, document_ids: list, sent_ids: list = None):
+    """
+    Email several invoices of one organisation to their contacts.
+    
+    Documents (with contacts and lines) are loaded and rendered a chunk
+    at a time, so only one chunk's PDFs are held, and every message goes
+    out over a single SMTP connection. A document counts as sent once its
+    message is accepted; on failure the retry covers only the documents
+    not yet sent, with the sent IDs carried forward in sent_ids.
+    Documents whose contact has no email address are skipped.
+    """
+    sent = list(sent_ids or [])
+    handled = set(sent)
+    ids = [UUID(str(document_id)) for document_id in document_ids]
+    start = 0
+    try:
+        org = Organisation.objects.get(id=org_id)
+        
+        with mail.get_connection() as connection:
+            for start in range(0, len(ids), EMAIL_BATCH_CHUNK_SIZE):
+                documents = DocumentService.documents_for_rendering(
+                    UUID(org_id), ids[start:start + EMAIL_BATCH_CHUNK_SIZE]
+                )
+                for document in documents:
+                    if not document.contact.email:
+                        logger.warning(f"Skipping invoice {document.id}: contact has no email")
+                        handled.add(str(document.id))
+                        continue
+                    pdf_stream = DocumentService.render_pdf(document, org)
+                    connection.send_messages([_build_invoice_email(
+                        org, document, [document.contact.email],
+                        pdf_bytes=pdf_stream.getvalue(), connection=connection,
+                    )])
+                    sent.append(str(document.id))
+                    handled.add(str(document.id))
+        
+        logger.info(f"Successfully sent {len(sent)} invoices for org {org_id}")
+        
+        return {"status": "sent", "document_ids": sent}
+        
+    except Exception as exc:
+        logger.error(f"Error sending invoice email batch for org {org_id}: {exc}")
+        # Earlier chunks are fully handled; retry the rest of this one onwards
+        remaining = [
+            str(document_id) for document_id in ids[start:] if str(document_id) not in handled
+        ]
+        raise self.retry(args=(org_id, remaining), kwargs={"sent_ids": sent}, exc=exc, countdown=60)
+
+
+@shared_task(bind=True, max_retries=3, acks_late=True, task_reject_on_worker_lost=True)
+def bulk_transition_status_task(
+    self, org_id: str, document_ids: list, new_status: str, user_id: str = None
+):
+    """
+    Transition many documents (e.g. a month-end approval run).
+    
+    Each chunk is its own transaction and skips rows other workers hold
+    locked, so several workers can share one run without waiting on each
+    other. Documents already in new_status are left alone, so a retry or
+    redelivery after some chunks committed only finishes the rest. A
+    chunk with an invalid transition is rolled back and reported under
+    "failed" while the remaining chunks carry on. Skipped (locked)
+    documents are returned for the caller to requeue.
+    """
+    try:
+        org_uuid = UUID(org_id)
+        user_uuid = UUID(user_id) if user_id else None
+        ids = [UUID(str(document_id)) for document_id in document_ids]
+        transitioned = set()
+        failed = []
+        for start in range(0, len(ids), BULK_TRANSITION_CHUNK_SIZE):
+            chunk = ids[start:start + BULK_TRANSITION_CHUNK_SIZE]
+            try:
+                documents = DocumentService.bulk_transition_status(
+                    org_uuid,
+                    chunk,
+                    new_status,
+                    user_id=user_uuid,
+                    skip_locked=True,
+                    skip_current=True,
+                )
+            except ValidationError as exc:
+                # The same transition fails on every retry; report the chunk
+                logger.warning(f"Bulk transition chunk failed for org {org_id}: {exc.message}")
+                failed.append({
+                    "document_ids": [str(document_id) for document_id in chunk],
+                    "error": exc.message,
+                })
+                continue
+            transitioned.update(document.id for document in documents)
+        
+        failed_ids = {document_id for chunk in failed for document_id in chunk["document_ids"]}
+        leftover = [
+            document_id for document_id in ids
+            if document_id not in transitioned and str(document_id) not in failed_ids
+        ]
+        already = set(
+            InvoiceDocument.objects.filter(
+                org_id=org_uuid, id__in=leftover, status=new_status
+            ).values_list("id", flat=True)
+        ) if leftover else set()
+        skipped = [str(document_id) for document_id in leftover if document_id not in already]
+        logger.info(
+            f"Transitioned {len(transitioned)} documents to {new_status} for org {org_id}, "
+            f"{len(already)} already {new_status}, skipped {len(skipped)}, "
+            f"failed {len(failed_ids)}"
+        )
+        
+        return {
+            "status": new_status,
+            "transitioned": len(transitioned),
+            "already": len(already),
+            "skipped": skipped,
+            "failed": failed,
+        }
+        
+    except Exception as exc:
+        logger.error(f"Error transitioning documents for org {org_id}: {exc}")
+        raise self.retry(exc=exc, countdown=60)
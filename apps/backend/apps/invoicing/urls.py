@@ -13,6 +13,7 @@ from .views import (
     InvoiceDocumentDetailView,
     InvoiceDocumentStatusView,
     InvoiceLineAddView,
+    InvoiceLineBulkAddView,
     InvoiceLineRemoveView,
     QuoteConvertView,
     DocumentSummaryView,
@@ -31,7 +32,7 @@ app_name = "invoicing"
 urlpatterns = [
     # Contacts
     path("contacts/", ContactListCreateView.as_view(), name="contact-list-create"),
-    path("contacts/<str:contact_id>/", ContactDetailView.as_view(), name="contact-detail"),
+    path("contacts/<uuid:contact_id>/", ContactDetailView.as_view(), name="contact-detail"),
     # Documents
     path("documents/", InvoiceDocumentListCreateView.as_view(), name="document-list-create"),
     path("documents/summary/", DocumentSummaryView.as_view(), name="document-summary"),
@@ -41,37 +42,42 @@ urlpatterns = [
         name="status-transitions",
     ),
     path(
-        "documents/<str:document_id>/", InvoiceDocumentDetailView.as_view(), name="document-detail"
+        "documents/<uuid:document_id>/", InvoiceDocumentDetailView.as_view(), name="document-detail"
     ),
     path(
-        "documents/<str:document_id>/status/",
+        "documents/<uuid:document_id>/status/",
         InvoiceDocumentStatusView.as_view(),
         name="document-status",
     ),
     path(
-        "documents/<str:document_id>/lines/", InvoiceLineAddView.as_view(), name="document-line-add"
+        "documents/<uuid:document_id>/lines/", InvoiceLineAddView.as_view(), name="document-line-add"
     ),
     path(
-        "documents/<str:document_id>/lines/<str:line_id>/",
+        "documents/<uuid:document_id>/lines/bulk/",
+        InvoiceLineBulkAddView.as_view(),
+        name="document-line-bulk-add",
+    ),
+    path(
+        "documents/<uuid:document_id>/lines/<uuid:line_id>/",
         InvoiceLineRemoveView.as_view(),
         name="document-line-remove",
     ),
     # Phase 2: Document workflow operations
     path(
-        "documents/<str:document_id>/approve/",
+        "documents/<uuid:document_id>/approve/",
         InvoiceApproveView.as_view(),
         name="document-approve",
     ),
-    path("documents/<str:document_id>/void/", InvoiceVoidView.as_view(), name="document-void"),
-    path("documents/<str:document_id>/pdf/", InvoicePDFView.as_view(), name="document-pdf"),
-    path("documents/<str:document_id>/send/", InvoiceSendView.as_view(), name="document-send"),
+    path("documents/<uuid:document_id>/void/", InvoiceVoidView.as_view(), name="document-void"),
+    path("documents/<uuid:document_id>/pdf/", InvoicePDFView.as_view(), name="document-pdf"),
+    path("documents/<uuid:document_id>/send/", InvoiceSendView.as_view(), name="document-send"),
     path(
-        "documents/<str:document_id>/send-invoicenow/",
+        "documents/<uuid:document_id>/send-invoicenow/",
         InvoiceSendInvoiceNowView.as_view(),
         name="document-send-invoicenow",
     ),
     path(
-        "documents/<str:document_id>/invoicenow-status/",
+        "documents/<uuid:document_id>/invoicenow-status/",
         InvoiceInvoiceNowStatusView.as_view(),
         name="document-invoicenow-status",
     ),
@@ -5,8 +5,11 @@ Contact management and document (invoice/quote) operations.
 """
 
 from typing import Optional
+from uuid import UUID
 from datetime import date
+from decimal import Decimal
 
+from django.db.models import Count, Q, Sum
 from django.http import FileResponse
 from rest_framework.views import APIView
 from rest_framework.response import Response
@@ -20,21 +23,27 @@ from apps.core.permissions import (
     CanApproveInvoices,
     CanVoidInvoices,
     CanViewReports,
+    HasMethodOrgPermission,
+    has_org_permission,
 )
 from apps.core.models import Contact, InvoiceDocument
 from common.exceptions import ValidationError, ResourceNotFound
-from common.views import wrap_response
+from common.pagination import page_size_param
+from common.views import wrap_response, parse_query, etag_matches, ndjson_response
 
 from apps.invoicing.services import ContactService, DocumentService, STATUS_TRANSITIONS
 from apps.invoicing.serializers import (
     ContactListSerializer,
+    ContactListQuerySerializer,
     ContactDetailSerializer,
     ContactCreateSerializer,
     ContactUpdateSerializer,
     InvoiceDocumentListSerializer,
+    InvoiceDocumentListQuerySerializer,
     InvoiceDocumentDetailSerializer,
     InvoiceDocumentCreateSerializer,
     InvoiceDocumentUpdateSerializer,
+    InvoiceLineSerializer,
     InvoiceLineCreateSerializer,
     StatusTransitionSerializer,
     QuoteConversionSerializer,
@@ -42,6 +51,26 @@ from apps.invoicing.serializers import (
 )
 
 
+# Status and document type codes counted by DocumentSummaryView
+_STATUS_CODES = tuple(code for code, _ in InvoiceDocument.STATUS_CHOICES)
+_DOCUMENT_TYPE_CODES = tuple(code for code, _ in InvoiceDocument.DOCUMENT_TYPES)
+
+# Statuses counted as outstanding; must match idx_document_org_open
+_OPEN_STATUSES = ("APPROVED", "PARTIALLY_PAID")
+
+# Permission needed to move a document to these statuses
+_TRANSITION_PERMISSIONS = {
+    "APPROVED": "can_approve_invoices",
+    "VOID": "can_void_invoices",
+}
+
+# Detail responses are cacheable but must be revalidated (ETag) on each use
+_DETAIL_CACHE_CONTROL = "private, no-cache"
+
+# The transition map is the same for every user and only changes on deploy
+_TRANSITIONS_HEADERS = {"Cache-Control": "public, max-age=86400", "Vary": "Accept"}
+
+
 class ContactListCreateView(APIView):
     """
     GET: List contacts
@@ -52,42 +81,46 @@ class ContactListCreateView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember]
 
     @wrap_response
-    def get(self, request, org_id: str) -> Response:
+    def get(self, request, org_id: UUID) -> Response:
         """List contacts with filters."""
-        is_customer = request.query_params.get("is_customer")
-        is_supplier = request.query_params.get("is_supplier")
-        is_active = request.query_params.get("is_active", "true")
-        search = request.query_params.get("search")
-
-        # Parse booleans
-        if is_customer is not None:
-            is_customer = is_customer.lower() == "true"
-        if is_supplier is not None:
-            is_supplier = is_supplier.lower() == "true"
-        is_active = is_active.lower() == "true"
-
-        from uuid import UUID
-
-        contacts = ContactService.list_contacts(
-            org_id=UUID(str(org_id)),
-            is_customer=is_customer,
-            is_supplier=is_supplier,
-            is_active=is_active,
-            search=search,
+        query = parse_query(ContactListQuerySerializer, request.query_params)
+
+        if query.get("export"):
+            # Full export: every matching contact, read in chunks
+            return ndjson_response(
+                ContactService.iter_contacts(
+                    org_id=org_id,
+                    is_customer=query.get("is_customer"),
+                    is_supplier=query.get("is_supplier"),
+                    is_active=query["is_active"],
+                    search=query.get("search"),
+                ),
+                org_id,
+                request.user.id,
+            )
+
+        contacts, next_cursor = ContactService.list_contacts_page(
+            org_id=org_id,
+            is_customer=query.get("is_customer"),
+            is_supplier=query.get("is_supplier"),
+            is_active=query["is_active"],
+            search=query.get("search"),
+            cursor=request.query_params.get("cursor"),
+            page_size=page_size_param(request.query_params),
         )
 
         serializer = ContactListSerializer(contacts, many=True)
-        return Response({"data": serializer.data, "count": len(serializer.data)})
+        return Response(
+            {"data": serializer.data, "count": len(contacts), "next_cursor": next_cursor}
+        )
 
     @wrap_response
-    def post(self, request, org_id: str) -> Response:
+    def post(self, request, org_id: UUID) -> Response:
         """Create new contact."""
         serializer = ContactCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        from uuid import UUID
-
-        contact = ContactService.create_contact(org_id=UUID(str(org_id)), **serializer.validated_data)
+        contact = ContactService.create_contact(org_id=org_id, **serializer.validated_data)
 
         return Response(ContactDetailSerializer(contact).data, status=status.HTTP_201_CREATED)
 
@@ -103,33 +136,32 @@ class ContactDetailView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember]
 
     @wrap_response
-    def get(self, request, org_id: str, contact_id: str) -> Response:
+    def get(self, request, org_id: UUID, contact_id: UUID) -> Response:
         """Get contact details."""
-        from uuid import UUID
+        etag = ContactService.get_contact_etag(org_id, contact_id)
+        headers = {"ETag": etag, "Cache-Control": _DETAIL_CACHE_CONTROL}
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-        contact = ContactService.get_contact(UUID(str(org_id)), UUID(str(contact_id)))
-        return Response(ContactDetailSerializer(contact).data)
+        contact = ContactService.get_contact(org_id, contact_id)
+        return Response(ContactDetailSerializer(contact).data, headers=headers)
 
     @wrap_response
-    def patch(self, request, org_id: str, contact_id: str) -> Response:
+    def patch(self, request, org_id: UUID, contact_id: UUID) -> Response:
         """Update contact."""
-        from uuid import UUID
-
         serializer = ContactUpdateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         contact = ContactService.update_contact(
-            UUID(str(org_id)), UUID(str(contact_id)), **serializer.validated_data
+            org_id, contact_id, **serializer.validated_data
         )
 
         return Response(ContactDetailSerializer(contact).data)
 
     @wrap_response
-    def delete(self, request, org_id: str, contact_id: str) -> Response:
+    def delete(self, request, org_id: UUID, contact_id: UUID) -> Response:
         """Deactivate contact."""
-        from uuid import UUID
-
-        contact = ContactService.deactivate_contact(UUID(str(org_id)), UUID(str(contact_id)))
+        contact = ContactService.deactivate_contact(org_id, contact_id)
 
         return Response(
             {"message": "Contact deactivated", "contact": ContactDetailSerializer(contact).data}
@@ -143,51 +175,41 @@ class InvoiceDocumentListCreateView(APIView):
     """
 
     authentication_classes = [JWTAuthentication]
-    permission_classes = [IsAuthenticated, IsOrgMember]
+    permission_classes = [IsAuthenticated, IsOrgMember, HasMethodOrgPermission]
+    method_permissions = {"POST": "can_create_invoices"}
 
     @wrap_response
-    def get(self, request, org_id: str) -> Response:
+    def get(self, request, org_id: UUID) -> Response:
         """List documents with filters."""
-        doc_type = request.query_params.get("type")
-        status_filter = request.query_params.get("status")
-        contact_id = request.query_params.get("contact_id")
-        date_from = request.query_params.get("date_from")
-        date_to = request.query_params.get("date_to")
-        search = request.query_params.get("search")
-
-        from uuid import UUID
-
-        if contact_id:
-            contact_id = UUID(str(contact_id))
-
-        documents = DocumentService.list_documents(
-            org_id=UUID(str(org_id)),
-            document_type=doc_type,
-            status=status_filter,
-            contact_id=contact_id,
-            date_from=date_from,
-            date_to=date_to,
-            search=search,
+        query = parse_query(InvoiceDocumentListQuerySerializer, request.query_params)
+
+        documents, next_cursor = DocumentService.list_documents_page(
+            org_id=org_id,
+            document_type=query.get("type"),
+            status=query.get("status"),
+            contact_id=query.get("contact_id"),
+            date_from=query.get("date_from"),
+            date_to=query.get("date_to"),
+            search=query.get("search"),
+            cursor=request.query_params.get("cursor"),
+            page_size=page_size_param(request.query_params),
         )
 
         serializer = InvoiceDocumentListSerializer(documents, many=True)
-        return Response({"data": serializer.data, "count": len(serializer.data)})
+        return Response(
+            {"data": serializer.data, "count": len(documents), "next_cursor": next_cursor}
+        )
 
     @wrap_response
-    def post(self, request, org_id: str) -> Response:
+    def post(self, request, org_id: UUID) -> Response:
         """Create new document."""
-        # Check permission
-        self._check_permission(request, "can_create_invoices")
-
         serializer = InvoiceDocumentCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        from uuid import UUID
-
         data = serializer.validated_data
 
         document = DocumentService.create_document(
-            org_id=UUID(str(org_id)),
+            org_id=org_id,
             document_type=data["document_type"],
             contact_id=data["contact_id"],
             issue_date=data["issue_date"],
@@ -202,15 +224,6 @@ class InvoiceDocumentListCreateView(APIView):
             InvoiceDocumentDetailSerializer(document).data, status=status.HTTP_201_CREATED
         )
 
-    def _check_permission(self, request, permission: str) -> bool:
-        """Check if user has specific permission."""
-        org_role = getattr(request, "org_role", {})
-        if org_role.get(permission) or getattr(request.user, "is_superadmin", False):
-            return True
-        from common.exceptions import UnauthorizedOrgAccess
-
-        raise UnauthorizedOrgAccess("Insufficient permissions")
-
 
 class InvoiceDocumentDetailView(APIView):
     """
@@ -219,41 +232,32 @@ class InvoiceDocumentDetailView(APIView):
     """
 
     authentication_classes = [JWTAuthentication]
-    permission_classes = [IsAuthenticated, IsOrgMember]
+    permission_classes = [IsAuthenticated, IsOrgMember, HasMethodOrgPermission]
+    method_permissions = {"PATCH": "can_create_invoices"}
 
     @wrap_response
-    def get(self, request, org_id: str, document_id: str) -> Response:
+    def get(self, request, org_id: UUID, document_id: UUID) -> Response:
         """Get document details."""
-        from uuid import UUID
+        etag = DocumentService.get_document_etag(org_id, document_id)
+        headers = {"ETag": etag, "Cache-Control": _DETAIL_CACHE_CONTROL}
+        if etag_matches(request, etag):
+            return Response(status=status.HTTP_304_NOT_MODIFIED, headers=headers)
 
-        document = DocumentService.get_document(UUID(str(org_id)), UUID(str(document_id)))
-        return Response(InvoiceDocumentDetailSerializer(document).data)
+        document = DocumentService.get_document(org_id, document_id, with_lines=True)
+        return Response(InvoiceDocumentDetailSerializer(document).data, headers=headers)
 
     @wrap_response
-    def patch(self, request, org_id: str, document_id: str) -> Response:
+    def patch(self, request, org_id: UUID, document_id: UUID) -> Response:
         """Update document."""
-        self._check_permission(request, "can_create_invoices")
-
-        from uuid import UUID
-
         serializer = InvoiceDocumentUpdateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         document = DocumentService.update_document(
-            UUID(str(org_id)), UUID(str(document_id)), **serializer.validated_data
+            org_id, document_id, **serializer.validated_data
         )
 
         return Response(InvoiceDocumentDetailSerializer(document).data)
 
-    def _check_permission(self, request, permission: str) -> bool:
-        """Check if user has specific permission."""
-        org_role = getattr(request, "org_role", {})
-        if org_role.get(permission) or getattr(request.user, "is_superadmin", False):
-            return True
-        from common.exceptions import UnauthorizedOrgAccess
-
-        raise UnauthorizedOrgAccess("Insufficient permissions")
-
 
 class InvoiceDocumentStatusView(APIView):
     """
@@ -263,24 +267,26 @@ class InvoiceDocumentStatusView(APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated, IsOrgMember]
 
+    def check_permissions(self, request) -> None:
+        """Also require the permission for the target status, if it has one."""
+        super().check_permissions(request)
+        # Malformed bodies only need the view's permissions; post() rejects them with a 400
+        target = request.data.get("status") if isinstance(request.data, dict) else None
+        permission_field = _TRANSITION_PERMISSIONS.get(target) if isinstance(target, str) else None
+        if permission_field and not has_org_permission(request, permission_field):
+            self.permission_denied(request, message="Insufficient permissions")
+
     @wrap_response
-    def post(self, request, org_id: str, document_id: str) -> Response:
+    def post(self, request, org_id: UUID, document_id: UUID) -> Response:
         """Transition document status."""
-        from uuid import UUID
-
         serializer = StatusTransitionSerializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
+        if not serializer.is_valid():
+            raise ValidationError("Invalid status transition.", details={"errors": serializer.errors})
 
         new_status = serializer.validated_data["status"]
 
-        # Check permission based on target status
-        if new_status == "APPROVED":
-            self._check_permission(request, "can_approve_invoices")
-        elif new_status == "VOIDED":
-            self._check_permission(request, "can_void_invoices")
-
         document = DocumentService.transition_status(
-            UUID(str(org_id)), UUID(str(document_id)), new_status, user_id=request.user.id
+            org_id, document_id, new_status, user_id=request.user.id
         )
 
         return Response(
@@ -290,15 +296,6 @@ class InvoiceDocumentStatusView(APIView):
             }
         )
 
-    def _check_permission(self, request, permission: str) -> bool:
-        """Check if user has specific permission."""
-        org_role = getattr(request, "org_role", {})
-        if org_role.get(permission) or getattr(request.user, "is_superadmin", False):
-            return True
-        from common.exceptions import UnauthorizedOrgAccess
-
-        raise UnauthorizedOrgAccess("Insufficient permissions")
-
 
 class InvoiceLineAddView(APIView):
     """
@@ -309,18 +306,16 @@ class InvoiceLineAddView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanCreateInvoices]
 
     @wrap_response
-    def post(self, request, org_id: str, document_id: str) -> Response:
+    def post(self, request, org_id: UUID, document_id: UUID) -> Response:
         """Add line to document."""
-        from uuid import UUID
-
         serializer = InvoiceLineCreateSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         data = serializer.validated_data
 
         line = DocumentService.add_line(
-            org_id=UUID(str(org_id)),
-            document_id=UUID(str(document_id)),
+            org_id=org_id,
+            document_id=document_id,
             account_id=data["account_id"],
             description=data["description"],
             quantity=data.get("quantity", 1),
@@ -329,14 +324,42 @@ class InvoiceLineAddView(APIView):
             is_bcrs_deposit=data.get("is_bcrs_deposit", False),
         )
 
-        from apps.invoicing.serializers import InvoiceLineSerializer
-
         return Response(
             {"message": "Line added", "line": InvoiceLineSerializer(line).data},
             status=status.HTTP_201_CREATED,
         )
 
 
+class InvoiceLineBulkAddView(APIView):
+    """
+    POST: Add several lines to document in one request
+    """
+
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated, IsOrgMember, CanCreateInvoices]
+
+    @wrap_response
+    def post(self, request, org_id: UUID, document_id: UUID) -> Response:
+        """Add a JSON array of lines to document."""
+        serializer = InvoiceLineCreateSerializer(data=request.data, many=True)
+        if not serializer.is_valid():
+            raise ValidationError("Invalid lines.", details={"errors": serializer.errors})
+
+        lines = DocumentService.add_lines(
+            org_id=org_id,
+            document_id=document_id,
+            lines=serializer.validated_data,
+        )
+
+        return Response(
+            {
+                "message": f"{len(lines)} lines added",
+                "lines": InvoiceLineSerializer(lines, many=True).data,
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
+
 class InvoiceLineRemoveView(APIView):
     """
     DELETE: Remove line from document
@@ -346,11 +369,9 @@ class InvoiceLineRemoveView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanCreateInvoices]
 
     @wrap_response
-    def delete(self, request, org_id: str, document_id: str, line_id: str) -> Response:
+    def delete(self, request, org_id: UUID, document_id: UUID, line_id: UUID) -> Response:
         """Remove line from document."""
-        from uuid import UUID
-
-        DocumentService.remove_line(UUID(str(org_id)), UUID(str(document_id)), UUID(line_id))
+        DocumentService.remove_line(org_id, document_id, line_id)
 
         return Response({"message": "Line removed"})
 
@@ -364,15 +385,13 @@ class QuoteConvertView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanCreateInvoices]
 
     @wrap_response
-    def post(self, request, org_id: str) -> Response:
+    def post(self, request, org_id: UUID) -> Response:
         """Convert quote to invoice."""
-        from uuid import UUID
-
         serializer = QuoteConversionSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
         invoice = DocumentService.convert_quote_to_invoice(
-            UUID(str(org_id)), serializer.validated_data["quote_id"], user_id=request.user.id
+            org_id, serializer.validated_data["quote_id"], user_id=request.user.id
         )
 
         return Response(
@@ -393,43 +412,50 @@ class DocumentSummaryView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanViewReports]
 
     @wrap_response
-    def get(self, request, org_id: str) -> Response:
+    def get(self, request, org_id: UUID) -> Response:
         """Get document summary."""
-        from uuid import UUID
-        from decimal import Decimal
-
-        # Get counts by status
-        status_counts = {}
-        for status, _ in InvoiceDocument.STATUS_CHOICES:
-            count = InvoiceDocument.objects.filter(org_id=org_id, status=status).count()
-            if count > 0:
-                status_counts[status] = count
-
-        # Get counts by type
-        type_counts = {}
-        for doc_type, _ in InvoiceDocument.DOCUMENT_TYPE_CHOICES:
-            count = InvoiceDocument.objects.filter(org_id=org_id, document_type=doc_type).count()
-            if count > 0:
-                type_counts[doc_type] = count
-
-        # Get total outstanding
-        outstanding = InvoiceDocument.objects.filter(
-            org_id=org_id, status__in=["APPROVED", "PAID_PARTIAL"]
+        documents = InvoiceDocument.objects.filter(org_id=org_id)
+
+        # Every count in one conditional aggregate
+        totals = documents.aggregate(
+            total_count=Count("id"),
+            **{
+                f"status_{code}": Count("id", filter=Q(status=code))
+                for code in _STATUS_CODES
+            },
+            **{
+                f"type_{code}": Count("id", filter=Q(document_type=code))
+                for code in _DOCUMENT_TYPE_CODES
+            },
+        )
+        # Open documents only: the WHERE clause matches the predicate of
+        # idx_document_org_open, which covers due_date and total_amount, so
+        # this runs as an index-only scan instead of reading every row
+        totals.update(
+            documents.filter(status__in=_OPEN_STATUSES).aggregate(
+                total_outstanding=Sum("total_incl", default=Decimal("0")),
+                overdue_count=Count("*", filter=Q(due_date__lt=date.today())),
+            )
         )
-        total_outstanding = sum(doc.total for doc in outstanding)
 
-        # Get overdue count
-        overdue_count = InvoiceDocument.objects.filter(
-            org_id=org_id, status__in=["APPROVED", "PAID_PARTIAL"], due_date__lt=date.today()
-        ).count()
+        status_counts = {
+            code: totals[f"status_{code}"]
+            for code in _STATUS_CODES
+            if totals[f"status_{code}"]
+        }
+        type_counts = {
+            code: totals[f"type_{code}"]
+            for code in _DOCUMENT_TYPE_CODES
+            if totals[f"type_{code}"]
+        }
 
         return Response(
             {
-                "total_count": InvoiceDocument.objects.filter(org_id=org_id).count(),
+                "total_count": totals["total_count"],
                 "by_status": status_counts,
                 "by_type": type_counts,
-                "total_outstanding": str(total_outstanding.quantize(Decimal("0.01"))),
-                "overdue_count": overdue_count,
+                "total_outstanding": str(totals["total_outstanding"].quantize(Decimal("0.01"))),
+                "overdue_count": totals["overdue_count"],
             }
         )
 
@@ -451,13 +477,10 @@ class InvoiceApproveView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanApproveInvoices]
 
     @wrap_response
-    def post(self, request, org_id: str, document_id: str) -> Response:
+    def post(self, request, org_id: UUID, document_id: UUID) -> Response:
         """Approve invoice and create journal entries."""
-        from uuid import UUID
-        from apps.invoicing.services import DocumentService
-
         document = DocumentService.approve_document(
-            org_id=UUID(str(org_id)), document_id=UUID(str(document_id)), user=request.user
+            org_id=org_id, document_id=document_id, user=request.user
         )
 
         return Response(InvoiceDocumentDetailSerializer(document).data, status=status.HTTP_200_OK)
@@ -475,17 +498,14 @@ class InvoiceVoidView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanVoidInvoices]
 
     @wrap_response
-    def post(self, request, org_id: str, document_id: str) -> Response:
+    def post(self, request, org_id: UUID, document_id: UUID) -> Response:
         """Void invoice and create reversal entries."""
-        from uuid import UUID
-        from apps.invoicing.services import DocumentService
-
         reason = request.data.get("reason", "")
         if not reason:
             raise ValidationError("Void reason is required.")
 
         document = DocumentService.void_document(
-            org_id=UUID(str(org_id)), document_id=UUID(str(document_id)), user=request.user, reason=reason
+            org_id=org_id, document_id=document_id, user=request.user, reason=reason
         )
 
         return Response(InvoiceDocumentDetailSerializer(document).data, status=status.HTTP_200_OK)
@@ -501,16 +521,13 @@ class InvoicePDFView(APIView):
     authentication_classes = [JWTAuthentication]
     permission_classes = [IsAuthenticated, IsOrgMember]
 
-    def get(self, request, org_id: str, document_id: str) -> FileResponse:
+    def get(self, request, org_id: UUID, document_id: UUID) -> FileResponse:
         """Generate PDF and return file response."""
-        from uuid import UUID
-        from apps.invoicing.services import DocumentService
-
         # Get document for filename
-        document = DocumentService.get_document(UUID(str(org_id)), UUID(str(document_id)))
+        document = DocumentService.get_document(org_id, document_id)
         
         # Generate PDF stream
-        pdf_stream = DocumentService.generate_pdf(org_id=UUID(str(org_id)), document_id=UUID(str(document_id)))
+        pdf_stream = DocumentService.generate_pdf(org_id=org_id, document_id=document_id)
 
         response = FileResponse(
             pdf_stream,
@@ -532,11 +549,8 @@ class InvoiceSendView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember]
 
     @wrap_response
-    def post(self, request, org_id: str, document_id: str) -> Response:
+    def post(self, request, org_id: UUID, document_id: UUID) -> Response:
         """Send invoice email."""
-        from uuid import UUID
-        from apps.invoicing.services import DocumentService
-
         # Validate email data
         email_data = {
             "to": request.data.get("to", []),
@@ -546,7 +560,7 @@ class InvoiceSendView(APIView):
         }
 
         result = DocumentService.send_email(
-            org_id=UUID(str(org_id)), document_id=UUID(str(document_id)), email_data=email_data
+            org_id=org_id, document_id=document_id, email_data=email_data
         )
 
         return Response(result, status=status.HTTP_200_OK)
@@ -563,13 +577,10 @@ class InvoiceSendInvoiceNowView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember]
 
     @wrap_response
-    def post(self, request, org_id: str, document_id: str) -> Response:
+    def post(self, request, org_id: UUID, document_id: UUID) -> Response:
         """Queue invoice for InvoiceNow transmission."""
-        from uuid import UUID
-        from apps.invoicing.services import DocumentService
-
         result = DocumentService.send_invoicenow(
-            org_id=UUID(str(org_id)), document_id=UUID(str(document_id)), user=request.user
+            org_id=org_id, document_id=document_id, user=request.user
         )
 
         return Response(result, status=status.HTTP_200_OK)
@@ -586,13 +597,10 @@ class InvoiceInvoiceNowStatusView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember]
 
     @wrap_response
-    def get(self, request, org_id: str, document_id: str) -> Response:
+    def get(self, request, org_id: UUID, document_id: UUID) -> Response:
         """Get transmission status."""
-        from uuid import UUID
-        from apps.invoicing.services import DocumentService
-
         status_data = DocumentService.get_invoicenow_status(
-            org_id=UUID(str(org_id)), document_id=UUID(str(document_id))
+            org_id=org_id, document_id=document_id
         )
 
         return Response(status_data, status=status.HTTP_200_OK)
@@ -609,4 +617,4 @@ class ValidStatusTransitionsView(APIView):
     @wrap_response
     def get(self, request) -> Response:
         """Get valid status transitions."""
-        return Response({"transitions": STATUS_TRANSITIONS})
+        return Response({"transitions": STATUS_TRANSITIONS}, headers=_TRANSITIONS_HEADERS)
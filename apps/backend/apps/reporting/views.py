@@ -4,17 +4,106 @@ Reporting views for LedgerSG.
 Dashboard metrics and alerts API.
 """
 
+import json
+from datetime import date
+
+from django.http import HttpResponse, JsonResponse
 from rest_framework.views import APIView
-from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework import status
 
 from apps.core.permissions import IsOrgMember, CanViewReports
 from common.views import wrap_response
 from common.exceptions import ValidationError
 
 
+# The stub payloads below are static, so they are encoded once per process
+# and returned as plain HttpResponses; DRF still authenticates and checks
+# permissions but skips Response rendering.
+def _encode(payload: dict) -> bytes:
+    """Encode a stub payload as compact JSON."""
+    return json.dumps(payload, separators=(",", ":")).encode("utf-8")
+
+
+# Placeholder metrics; only the period depends on the request date
+_METRICS_PLACEHOLDER = {
+    "revenue": {
+        "current_month": "0.00",
+        "previous_month": "0.00",
+        "change": "0.00",
+        "change_pct": "0.00",
+    },
+    "expenses": {
+        "current_month": "0.00",
+        "previous_month": "0.00",
+        "change": "0.00",
+        "change_pct": "0.00",
+    },
+    "profit": {
+        "current_month": "0.00",
+        "previous_month": "0.00",
+        "change": "0.00",
+        "change_pct": "0.00",
+    },
+    "outstanding": {
+        "total": "0.00",
+        "count": 0,
+        "overdue": "0.00",
+        "overdue_count": 0,
+    },
+    "bank_balance": {
+        "total": "0.00",
+        "accounts": [],
+    },
+    "gst_summary": {
+        "registered": False,
+        "next_filing_date": None,
+        "next_filing_amount": "0.00",
+    },
+    "invoice_summary": {
+        "draft": 0,
+        "sent": 0,
+        "approved": 0,
+        "paid": 0,
+        "overdue": 0,
+        "void": 0,
+    },
+}
+
+_ALERTS_JSON = _encode(
+    {
+        "alerts": [],
+        "gst_threshold_warning": False,
+        "gst_threshold_amount": "1000000.00",
+        "overdue_invoices_count": 0,
+        "unreconciled_transactions_count": 0,
+        "unpaid_bills_count": 0,
+        "upcoming_deadlines": [],
+    }
+)
+
+_FINANCIAL_REPORT_JSON = {
+    report_type: _encode(
+        {
+            "report_type": report_type,
+            "period_start": "2024-01-01",
+            "period_end": "2024-12-31",
+            "currency": "SGD",
+            "generated_at": "2024-01-01T00:00:00Z",
+            "data": {
+                "summary": {},
+                "accounts": [],
+                "totals": {
+                    "debit": "0.00",
+                    "credit": "0.00",
+                },
+            },
+        }
+    )
+    for report_type in ("profit_loss", "balance_sheet", "trial_balance")
+}
+
+
 class DashboardMetricsView(APIView):
     """
     GET: Dashboard metrics.
@@ -26,61 +115,19 @@ class DashboardMetricsView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember]
 
     @wrap_response
-    def get(self, request, org_id: str) -> Response:
+    def get(self, request, org_id: str) -> HttpResponse:
         """Return dashboard metrics (stub implementation)."""
         # TODO: Implement actual metrics calculation
         # For now, return placeholder data
+        today = date.today()
 
-        from datetime import date
-        from uuid import UUID
-
-        return Response(
+        return JsonResponse(
             {
                 "period": {
-                    "start": str(date.today().replace(day=1)),
-                    "end": str(date.today()),
-                },
-                "revenue": {
-                    "current_month": "0.00",
-                    "previous_month": "0.00",
-                    "change": "0.00",
-                    "change_pct": "0.00",
-                },
-                "expenses": {
-                    "current_month": "0.00",
-                    "previous_month": "0.00",
-                    "change": "0.00",
-                    "change_pct": "0.00",
-                },
-                "profit": {
-                    "current_month": "0.00",
-                    "previous_month": "0.00",
-                    "change": "0.00",
-                    "change_pct": "0.00",
-                },
-                "outstanding": {
-                    "total": "0.00",
-                    "count": 0,
-                    "overdue": "0.00",
-                    "overdue_count": 0,
-                },
-                "bank_balance": {
-                    "total": "0.00",
-                    "accounts": [],
-                },
-                "gst_summary": {
-                    "registered": False,
-                    "next_filing_date": None,
-                    "next_filing_amount": "0.00",
-                },
-                "invoice_summary": {
-                    "draft": 0,
-                    "sent": 0,
-                    "approved": 0,
-                    "paid": 0,
-                    "overdue": 0,
-                    "void": 0,
+                    "start": str(today.replace(day=1)),
+                    "end": str(today),
                 },
+                **_METRICS_PLACEHOLDER,
             }
         )
 
@@ -96,23 +143,13 @@ class DashboardAlertsView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember]
 
     @wrap_response
-    def get(self, request, org_id: str) -> Response:
+    def get(self, request, org_id: str) -> HttpResponse:
         """Return dashboard alerts (stub implementation)."""
 
         # TODO: Implement actual alerts calculation
         # For now, return placeholder data
 
-        return Response(
-            {
-                "alerts": [],
-                "gst_threshold_warning": False,
-                "gst_threshold_amount": "1000000.00",
-                "overdue_invoices_count": 0,
-                "unreconciled_transactions_count": 0,
-                "unpaid_bills_count": 0,
-                "upcoming_deadlines": [],
-            }
-        )
+        return HttpResponse(_ALERTS_JSON, content_type="application/json")
 
 
 class FinancialReportView(APIView):
@@ -126,31 +163,15 @@ class FinancialReportView(APIView):
     permission_classes = [IsAuthenticated, IsOrgMember, CanViewReports]
 
     @wrap_response
-    def get(self, request, org_id: str) -> Response:
+    def get(self, request, org_id: str) -> HttpResponse:
         """Return financial reports (stub implementation)."""
 
         report_type = request.query_params.get("type", "profit_loss")
 
-        if report_type not in ["profit_loss", "balance_sheet", "trial_balance"]:
-            raise ValidationError(f"Invalid report type: {report_type}")
-
         # TODO: Implement actual report generation
         # For now, return placeholder data
+        body = _FINANCIAL_REPORT_JSON.get(report_type)
+        if body is None:
+            raise ValidationError(f"Invalid report type: {report_type}")
 
-        return Response(
-            {
-                "report_type": report_type,
-                "period_start": "2024-01-01",
-                "period_end": "2024-12-31",
-                "currency": "SGD",
-                "generated_at": "2024-01-01T00:00:00Z",
-                "data": {
-                    "summary": {},
-                    "accounts": [],
-                    "totals": {
-                        "debit": "0.00",
-                        "credit": "0.00",
-                    },
-                },
-            }
-        )
+        return HttpResponse(body, content_type="application/json")
@@ -5,6 +5,25 @@ Routes reads to replica (future) and writes to primary.
 Currently routes all operations to the default database.
 """
 
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+
+# Optional read replica; configure DATABASES["replica"] to enable
+REPLICA_DB_ALIAS = "replica"
+
+
+def read_db() -> str:
+    """
+    Return the database alias for explicitly read-only queries.
+    
+    Callers opt in per query with .using(read_db()) where replica lag is
+    acceptable. Returns 'default' when no replica is configured.
+    """
+    if REPLICA_DB_ALIAS in settings.DATABASES:
+        return REPLICA_DB_ALIAS
+    return DEFAULT_DB_ALIAS
+
 
 class DatabaseRouter:
     """
@@ -12,25 +31,31 @@ class DatabaseRouter:
     
     Currently routes all operations to the default database.
     Future enhancement: route reads to replicas for scaling.
+    
+    Django calls these on every ORM operation; they are static methods so
+    no bound method is created per call.
     """
     
-    def db_for_read(self, model, **hints):
+    @staticmethod
+    def db_for_read(model, **hints):
         """
         Return database for read operations.
         
         Currently returns 'default'. Future: return replica for read-heavy models.
         """
-        return "default"
+        return DEFAULT_DB_ALIAS
     
-    def db_for_write(self, model, **hints):
+    @staticmethod
+    def db_for_write(model, **hints):
         """
         Return database for write operations.
         
         Always returns 'default' (primary).
         """
-        return "default"
+        return DEFAULT_DB_ALIAS
     
-    def allow_relation(self, obj1, obj2, **hints):
+    @staticmethod
+    def allow_relation(obj1, obj2, **hints):
         """
         Allow relations between objects from the same database.
         
@@ -38,10 +63,11 @@ class DatabaseRouter:
         """
         return True
     
-    def allow_migrate(self, db, app_label, model_name=None, **hints):
+    @staticmethod
+    def allow_migrate(db, app_label, model_name=None, **hints):
         """
         Allow migrations on the default database only.
         
         Since we use unmanaged models, this is mostly a no-op.
         """
-        return db == "default"
+        return db == DEFAULT_DB_ALIAS
@@ -0,0 +1,42 @@
+"""
+Request Memo Middleware
+
+Provides a per-request dict that services can use to memoise lookups
+repeated within a single request (e.g. the same tax code fetched once per
+invoice line). The memo is discarded when the response is returned.
+"""
+
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from django.http import HttpRequest, HttpResponse
+
+
+_request_memo: ContextVar[Optional[Dict[str, Any]]] = ContextVar("request_memo", default=None)
+
+
+def request_memo() -> Optional[Dict[str, Any]]:
+    """
+    Get the memo dict for the current request.
+
+    Returns:
+        The request's memo dict, or None outside a request (e.g. Celery
+        tasks, management commands), where callers should not memoise.
+    """
+    return _request_memo.get()
+
+
+class RequestMemoMiddleware:
+    """
+    Middleware that scopes a fresh memo dict to each request.
+    """
+    
+    def __init__(self, get_response):
+        self.get_response = get_response
+    
+    def __call__(self, request: HttpRequest) -> HttpResponse:
+        token = _request_memo.set({})
+        try:
+            return self.get_response(request)
+        finally:
+            _request_memo.reset(token)
@@ -47,6 +47,57 @@ def get_current_user_id() -> Optional[uuid.UUID]:
     return _current_user_id.get()
 
 
+def set_rls_context(org_id, user_id) -> None:
+    """
+    Set the RLS session variables for the current transaction.
+    
+    SET LOCAL lasts until the enclosing transaction ends, so this must be
+    called inside one.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL app.current_org_id = %s", [str(org_id)])
+        cursor.execute("SET LOCAL app.current_user_id = %s", [str(user_id)])
+
+
+# Role dict keys and the UserOrganisation lookups they are read from
+_ROLE_KEYS = (
+    'id',
+    'name',
+    'can_manage_org',
+    'can_manage_users',
+    'can_manage_coa',
+    'can_create_invoices',
+    'can_approve_invoices',
+    'can_void_invoices',
+    'can_create_journals',
+    'can_manage_banking',
+    'can_file_gst',
+    'can_view_reports',
+    'can_export_data',
+)
+_ROLE_LOOKUPS = tuple(f'role__{key}' for key in _ROLE_KEYS)
+
+# Sentinel distinguishing a cache miss from a cached non-member (None)
+_NOT_CACHED = object()
+
+# Seconds a user's role for an org stays cached; writes invalidate it sooner
+_ORG_ROLE_CACHE_TIMEOUT = 300
+
+
+def _org_role_cache_key(user_id, org_id) -> str:
+    return f"user_org_role:{user_id}:{org_id}"
+
+
+def invalidate_org_role(user_id, org_id) -> None:
+    """
+    Drop the cached role of a user in an org.
+    
+    Called when a membership or its role changes so revoked access takes
+    effect on the next request.
+    """
+    cache.delete(_org_role_cache_key(user_id, org_id))
+
+
 class TenantContextMiddleware:
     """
     Middleware that extracts org_id from URL and sets RLS session variables.
@@ -80,8 +131,11 @@ class TenantContextMiddleware:
                 # No org_id in URL, let view handle it
                 return self.get_response(request)
             
-            # Verify user belongs to this org
-            if not self._verify_org_membership(user, org_id):
+            # One (cached) lookup yields both membership and role flags
+            org_role = self._get_org_role(user, org_id)
+            
+            # Verify user belongs to this org (superadmins can access any org)
+            if org_role is None and not getattr(user, 'is_superadmin', False):
                 return JsonResponse(
                     {
                         "error": {
@@ -92,19 +146,8 @@ class TenantContextMiddleware:
                     status=403
                 )
             
-            # Get user's role for this org
-            org_role = self._get_org_role(request.user, org_id)
-            
             # Set RLS session variables within the atomic transaction
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    "SET LOCAL app.current_org_id = %s",
-                    [str(org_id)]
-                )
-                cursor.execute(
-                    "SET LOCAL app.current_user_id = %s",
-                    [str(request.user.id)]
-                )
+            set_rls_context(org_id, request.user.id)
             
             # Set contextvars for application-level access
             _current_org_id.set(org_id)
@@ -211,67 +254,38 @@ class TenantContextMiddleware:
         
         return None
     
-    def _verify_org_membership(self, user, org_id: uuid.UUID) -> bool:
+    def _get_org_role(self, user, org_id: uuid.UUID) -> Optional[dict]:
         """
-        Verify that the user belongs to the organization.
+        Get the user's role for this organization.
         
-        Uses cache to minimize database queries.
-        """
-        # Superadmins can access any org
-        if getattr(user, 'is_superadmin', False):
-            return True
+        Membership and role flags come from a single query, cached for
+        5 minutes, so the role dict doubles as the membership check. The
+        entry is invalidated when the membership or role changes (see
+        apps.core.signals).
         
-        # Check cache first
-        cache_key = f"user_org:{user.id}:{org_id}"
-        cached = cache.get(cache_key)
-        if cached is not None:
+        Returns:
+            Role dict with permission flags, or None if the user is not an
+            (accepted) member of the organization
+        """
+        cache_key = _org_role_cache_key(user.id, org_id)
+        cached = cache.get(cache_key, _NOT_CACHED)
+        if cached is not _NOT_CACHED:
             return cached
         
-        # Query database
         try:
             from apps.core.models import UserOrganisation
-            is_member = UserOrganisation.objects.filter(
+            row = UserOrganisation.objects.filter(
                 user=user,
                 org_id=org_id,
                 accepted_at__isnull=False,  # Must have accepted invitation
-            ).exists()
-            
-            # Cache for 5 minutes
-            cache.set(cache_key, is_member, 300)
-            
-            return is_member
+            ).values(*_ROLE_LOOKUPS).first()
         except Exception:
             # If we can't verify, deny access (fail secure)
-            return False
-    
-    def _get_org_role(self, user, org_id: uuid.UUID) -> Optional[dict]:
-        """
-        Get the user's role for this organization.
-        
-        Returns role dict with permission flags.
-        """
-        try:
-            from apps.core.models import UserOrganisation
-            user_org = UserOrganisation.objects.select_related('role').get(
-                user=user,
-                org_id=org_id,
-            )
-            
-            role = user_org.role
-            return {
-                'id': role.id,
-                'name': role.name,
-                'can_manage_org': role.can_manage_org,
-                'can_manage_users': role.can_manage_users,
-                'can_manage_coa': role.can_manage_coa,
-                'can_create_invoices': role.can_create_invoices,
-                'can_approve_invoices': role.can_approve_invoices,
-                'can_void_invoices': role.can_void_invoices,
-                'can_create_journals': role.can_create_journals,
-                'can_manage_banking': role.can_manage_banking,
-                'can_file_gst': role.can_file_gst,
-                'can_view_reports': role.can_view_reports,
-                'can_export_data': role.can_export_data,
-            }
-        except Exception:
             return None
+        
+        org_role = (
+            {key: row[lookup] for key, lookup in zip(_ROLE_KEYS, _ROLE_LOOKUPS)}
+            if row is not None else None
+        )
+        cache.set(cache_key, org_role, _ORG_ROLE_CACHE_TIMEOUT)
+        return org_role
@@ -0,0 +1,18 @@
+-- Migration: Make gst.return.box8_net_gst a generated column
+-- box8 (net GST) is always box6 (output tax) - box7 (input tax claimable),
+-- so PostgreSQL computes it instead of the application writing it.
+
+-- Drop the consistency check made redundant by the generated column
+ALTER TABLE gst.return
+    DROP CONSTRAINT IF EXISTS chk_box8_net;
+
+-- Replace the stored column with a generated one
+ALTER TABLE gst.return
+    DROP COLUMN box8_net_gst;
+
+ALTER TABLE gst.return
+    ADD COLUMN box8_net_gst NUMERIC(10,4)
+        GENERATED ALWAYS AS (box6_output_tax - box7_input_tax_claimable) STORED;
+
+-- Add comments
+COMMENT ON COLUMN gst.return.box8_net_gst IS 'Net GST = Box 6 - Box 7 (generated; payable if positive)';
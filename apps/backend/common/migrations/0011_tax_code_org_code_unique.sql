@@ -0,0 +1,8 @@
+-- Migration: Enforce one current tax code per (org_id, code)
+-- UNIQUE(org_id, code, effective_from) still allows rate history; this
+-- partial index additionally rejects a second open-ended row for a code,
+-- so create_tax_code can rely on the database for duplicate detection.
+
+CREATE UNIQUE INDEX IF NOT EXISTS uniq_tax_code_org_code_current
+    ON gst.tax_code(org_id, code)
+    WHERE effective_to IS NULL AND deleted_at IS NULL;
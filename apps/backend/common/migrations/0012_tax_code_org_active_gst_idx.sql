@@ -0,0 +1,6 @@
+-- Migration: Index the tax code list filters
+-- TaxCodeService list queries filter on org_id plus optional is_active /
+-- is_gst_charged and order by code; this index serves all of them.
+
+CREATE INDEX IF NOT EXISTS idx_tax_code_org_active_gst
+    ON gst.tax_code(org_id, is_active, is_gst_charged, code);
@@ -0,0 +1,51 @@
+-- Migration: Maintain invoicing.document totals from its lines by trigger
+-- Each line INSERT/UPDATE/DELETE adjusts the parent document's subtotal,
+-- total_gst and total_amount by the line's delta, so the application no
+-- longer re-aggregates all lines after every line edit.
+
+CREATE OR REPLACE FUNCTION invoicing.apply_line_totals()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    -- Remove the old line's contribution
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE invoicing.document
+        SET subtotal     = subtotal - OLD.line_amount,
+            total_gst    = total_gst - OLD.gst_amount,
+            total_amount = total_amount - (OLD.line_amount + OLD.gst_amount)
+        WHERE id = OLD.document_id;
+    END IF;
+
+    -- Add the new line's contribution
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        UPDATE invoicing.document
+        SET subtotal     = subtotal + NEW.line_amount,
+            total_gst    = total_gst + NEW.gst_amount,
+            total_amount = total_amount + (NEW.line_amount + NEW.gst_amount)
+        WHERE id = NEW.document_id;
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION invoicing.apply_line_totals()
+    IS 'Keeps invoicing.document subtotal/total_gst/total_amount equal to the sum of its lines, incrementally per line change.';
+
+CREATE TRIGGER trg_document_line_totals
+    AFTER INSERT OR UPDATE OF document_id, line_amount, gst_amount OR DELETE
+    ON invoicing.document_line
+    FOR EACH ROW EXECUTE FUNCTION invoicing.apply_line_totals();
+
+-- Bring existing documents in line with their lines
+UPDATE invoicing.document d
+SET subtotal     = COALESCE(t.subtotal, 0),
+    total_gst    = COALESCE(t.total_gst, 0),
+    total_amount = COALESCE(t.subtotal, 0) + COALESCE(t.total_gst, 0)
+FROM (
+    SELECT document_id, SUM(line_amount) AS subtotal, SUM(gst_amount) AS total_gst
+    FROM invoicing.document_line
+    GROUP BY document_id
+) t
+WHERE t.document_id = d.id;
@@ -0,0 +1,15 @@
+-- Migration: Index the invoice document list
+-- DocumentService.list_documents orders every page by document_date DESC,
+-- document_number DESC within an org, and its search filter is a
+-- case-insensitive substring match on document_number (ILIKE '%...%'),
+-- which only a trigram index can serve. Status, type and contact filters
+-- are already covered by idx_document_org_status, idx_document_org_type
+-- and idx_document_contact.
+
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";
+
+CREATE INDEX IF NOT EXISTS idx_document_org_date_number
+    ON invoicing.document(org_id, document_date DESC, document_number DESC);
+
+CREATE INDEX IF NOT EXISTS idx_document_number_search
+    ON invoicing.document USING gin (document_number gin_trgm_ops);
@@ -0,0 +1,10 @@
+-- Migration: Cover the document summary's outstanding aggregate
+-- DocumentSummaryView sums total_amount and counts overdue documents over
+-- APPROVED and PARTIALLY_PAID documents in an org. A partial index on
+-- exactly those statuses, covering due_date and total_amount, lets the
+-- aggregate run as an index-only scan without visiting the table.
+
+CREATE INDEX IF NOT EXISTS idx_document_org_open
+    ON invoicing.document(org_id, due_date)
+    INCLUDE (total_amount)
+    WHERE status IN ('APPROVED', 'PARTIALLY_PAID');
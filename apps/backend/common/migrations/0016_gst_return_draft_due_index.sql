@@ -0,0 +1,7 @@
+-- Migration: Index upcoming GST filing deadlines
+-- GSTReturnService.get_upcoming_deadlines filters DRAFT returns in an org
+-- by filing_due_date and orders by it; this partial index serves both.
+
+CREATE INDEX IF NOT EXISTS idx_gst_return_draft_due
+    ON gst.return(org_id, filing_due_date)
+    WHERE status = 'DRAFT';
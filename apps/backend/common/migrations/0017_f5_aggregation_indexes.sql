@@ -0,0 +1,16 @@
+-- Migration: Index the GST F5 box aggregation
+-- GSTCalculationService.get_f5_box_amounts sums line amounts of posted
+-- documents in a date range. The partial index finds the org's posted
+-- documents by date; the line index covers the summed columns so the
+-- join runs as an index-only scan.
+--
+-- CONCURRENTLY avoids blocking writes on live tables; it cannot run inside
+-- a transaction block, so apply this file with autocommit (plain psql -f).
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_document_org_date_posted
+    ON invoicing.document(org_id, document_date)
+    WHERE status IN ('APPROVED', 'SENT', 'PARTIALLY_PAID', 'PAID');
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_docline_f5_compute
+    ON invoicing.document_line(document_id, tax_code_id)
+    INCLUDE (line_amount, gst_amount);
@@ -0,0 +1,80 @@
+-- Migration: Apply document line totals once per statement
+-- The row-level trigger from 0013 issued one UPDATE of invoicing.document
+-- per line, so a bulk insert of N lines updated the parent N times.
+-- Statement-level triggers read the changed lines from transition tables
+-- and apply one grouped delta per document.
+-- PostgreSQL allows transition tables only on single-event triggers
+-- without a column list, hence one trigger per event.
+
+DROP TRIGGER IF EXISTS trg_document_line_totals ON invoicing.document_line;
+
+CREATE OR REPLACE FUNCTION invoicing.apply_line_totals()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE invoicing.document d
+        SET subtotal     = d.subtotal + delta.subtotal,
+            total_gst    = d.total_gst + delta.total_gst,
+            total_amount = d.total_amount + (delta.subtotal + delta.total_gst)
+        FROM (
+            SELECT document_id, SUM(line_amount) AS subtotal, SUM(gst_amount) AS total_gst
+            FROM new_lines
+            GROUP BY document_id
+        ) delta
+        WHERE d.id = delta.document_id;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE invoicing.document d
+        SET subtotal     = d.subtotal - delta.subtotal,
+            total_gst    = d.total_gst - delta.total_gst,
+            total_amount = d.total_amount - (delta.subtotal + delta.total_gst)
+        FROM (
+            SELECT document_id, SUM(line_amount) AS subtotal, SUM(gst_amount) AS total_gst
+            FROM old_lines
+            GROUP BY document_id
+        ) delta
+        WHERE d.id = delta.document_id;
+
+    ELSE
+        -- UPDATE: new contribution minus old, per document (a line moved
+        -- between documents yields a negative and a positive delta)
+        UPDATE invoicing.document d
+        SET subtotal     = d.subtotal + delta.subtotal,
+            total_gst    = d.total_gst + delta.total_gst,
+            total_amount = d.total_amount + (delta.subtotal + delta.total_gst)
+        FROM (
+            SELECT document_id, SUM(line_amount) AS subtotal, SUM(gst_amount) AS total_gst
+            FROM (
+                SELECT document_id, line_amount, gst_amount FROM new_lines
+                UNION ALL
+                SELECT document_id, -line_amount, -gst_amount FROM old_lines
+            ) changes
+            GROUP BY document_id
+        ) delta
+        WHERE d.id = delta.document_id
+          AND (delta.subtotal <> 0 OR delta.total_gst <> 0);
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION invoicing.apply_line_totals()
+    IS 'Keeps invoicing.document subtotal/total_gst/total_amount equal to the sum of its lines, one grouped delta per statement.';
+
+CREATE TRIGGER trg_document_line_totals_insert
+    AFTER INSERT ON invoicing.document_line
+    REFERENCING NEW TABLE AS new_lines
+    FOR EACH STATEMENT EXECUTE FUNCTION invoicing.apply_line_totals();
+
+CREATE TRIGGER trg_document_line_totals_update
+    AFTER UPDATE ON invoicing.document_line
+    REFERENCING OLD TABLE AS old_lines NEW TABLE AS new_lines
+    FOR EACH STATEMENT EXECUTE FUNCTION invoicing.apply_line_totals();
+
+CREATE TRIGGER trg_document_line_totals_delete
+    AFTER DELETE ON invoicing.document_line
+    REFERENCING OLD TABLE AS old_lines
+    FOR EACH STATEMENT EXECUTE FUNCTION invoicing.apply_line_totals();
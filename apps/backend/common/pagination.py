@@ -2,11 +2,20 @@
 Custom pagination classes for LedgerSG API.
 """
 
+import base64
+import binascii
+import json
+from typing import Any, List, Mapping, Optional, Sequence, Tuple
+
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db.models import Q, QuerySet
 from rest_framework.pagination import (
     PageNumberPagination,
     CursorPagination,
 )
 
+from common.exceptions import ValidationError
+
 
 class StandardPagination(PageNumberPagination):
     """
@@ -54,3 +63,97 @@ class SmallResultPagination(PageNumberPagination):
     page_size_query_param = "page_size"
     max_page_size = 100
     page_query_param = "page"
+
+
+def page_size_param(
+    params: Mapping[str, str],
+    default: int = StandardPagination.page_size,
+    maximum: int = StandardPagination.max_page_size,
+) -> int:
+    """
+    Parse the page_size query parameter, clamped to 1..maximum.
+    
+    Raises:
+        ValidationError: If page_size is not an integer
+    """
+    value = params.get(StandardPagination.page_size_query_param)
+    if value is None:
+        return default
+    try:
+        return min(max(int(value), 1), maximum)
+    except ValueError:
+        raise ValidationError("page_size must be an integer.")
+
+
+def encode_cursor(values: Sequence[Any]) -> str:
+    """Encode a row's ordering values as an opaque URL-safe cursor."""
+    raw = json.dumps(list(values), default=str, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Decode a cursor from encode_cursor().
+    
+    Raises:
+        ValidationError: If the cursor is malformed
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except (binascii.Error, ValueError):
+        raise ValidationError("Invalid cursor.")
+    if not isinstance(values, list) or len(values) != size:
+        raise ValidationError("Invalid cursor.")
+    return values
+
+
+def keyset_page(
+    queryset: QuerySet,
+    ordering: Sequence[str],
+    cursor: Optional[str],
+    page_size: int,
+) -> Tuple[list, Optional[str]]:
+    """
+    Fetch one page of a queryset by keyset (seek) pagination.
+    
+    Rows after the cursor are selected with a WHERE on the ordering
+    columns rather than an OFFSET, so every page costs the same and only
+    page_size + 1 rows are read. The ordering must be unique per row.
+    
+    Args:
+        queryset: Filtered queryset (unordered; ordering is applied here)
+        ordering: Field names, "-" prefixed for descending
+        cursor: Cursor from the previous page, or None for the first page
+        page_size: Rows per page
+        
+    Returns:
+        Tuple of (rows, next_cursor); next_cursor is None on the last page
+        
+    Raises:
+        ValidationError: If the cursor is malformed or its values do not
+            fit the ordering columns
+    """
+    fields = [name.lstrip("-") for name in ordering]
+    
+    if cursor:
+        values = decode_cursor(cursor, len(fields))
+        # (a, b) after (x, y)  ==  a > x OR (a = x AND b > y), per direction
+        after = Q()
+        for index, name in enumerate(ordering):
+            lookup = "lt" if name.startswith("-") else "gt"
+            equal = {field: value for field, value in zip(fields[:index], values)}
+            after |= Q(**equal, **{f"{fields[index]}__{lookup}": values[index]})
+        try:
+            # Lookup values are converted here; a well-formed cursor can
+            # still carry values the columns reject (e.g. a bad date)
+            queryset = queryset.filter(after)
+        except (DjangoValidationError, TypeError, ValueError):
+            raise ValidationError("Invalid cursor.")
+    
+    rows = list(queryset.order_by(*ordering)[:page_size + 1])
+    if len(rows) <= page_size:
+        return rows, None
+    
+    rows = rows[:page_size]
+    return rows, encode_cursor([getattr(rows[-1], field) for field in fields])
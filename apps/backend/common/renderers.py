@@ -6,21 +6,38 @@ to prevent precision loss in API responses.
 """
 
 import json
+from collections.abc import Mapping
 from datetime import datetime, date
 from decimal import Decimal
+from uuid import UUID
 
 from rest_framework.renderers import JSONRenderer
 
 
+# Exact-type fast path for the values API payloads carry most often
+_DEFAULT_ENCODERS = {
+    Decimal: str,
+    UUID: str,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+}
+
+
 class DecimalSafeJSONEncoder(json.JSONEncoder):
     """
     Custom JSON encoder that handles Decimal and datetime values correctly.
     
     Converts Decimal to string to preserve precision.
     Converts datetime to ISO format string.
+    Converts UUID to its canonical string form.
     """
     
     def default(self, obj):
+        encode = _DEFAULT_ENCODERS.get(type(obj))
+        if encode is not None:
+            return encode(obj)
+        
+        # Subclasses and other supported types
         if isinstance(obj, Decimal):
             # Convert Decimal to string to preserve precision
             return str(obj)
@@ -30,6 +47,11 @@ class DecimalSafeJSONEncoder(json.JSONEncoder):
         if isinstance(obj, date):
             # Convert date to ISO format
             return obj.isoformat()
+        if isinstance(obj, UUID):
+            return str(obj)
+        if isinstance(obj, Mapping):
+            # Read-only mappings (e.g. MappingProxyType) serialize as objects
+            return dict(obj)
         return super().default(obj)
 
 
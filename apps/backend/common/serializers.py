@@ -0,0 +1,36 @@
+"""
+Common serializer utilities for LedgerSG.
+"""
+
+from copy import copy, deepcopy
+from typing import Dict
+
+from rest_framework import serializers
+
+
+class CachedFieldsSerializerMixin:
+    """
+    Build a serializer class's fields once per process.
+    
+    ModelSerializer.get_fields() introspects the model and deep-copies
+    every declared field each time a serializer is instantiated. This
+    mixin keeps the built fields per class and hands each instance
+    shallow copies, which bind() then fills in. Nested serializers are
+    still deep-copied, since binding them also rebinds their children.
+    
+    Only for serializers whose fields do not depend on the instance or
+    context (no get_fields() overrides that read self).
+    """
+    
+    _fields_cache: Dict[type, Dict[str, serializers.Field]] = {}
+    
+    def get_fields(self):
+        cls = type(self)
+        fields = CachedFieldsSerializerMixin._fields_cache.get(cls)
+        if fields is None:
+            fields = CachedFieldsSerializerMixin._fields_cache[cls] = super().get_fields()
+        
+        return {
+            name: deepcopy(field) if isinstance(field, serializers.BaseSerializer) else copy(field)
+            for name, field in fields.items()
+        }
@@ -5,12 +5,93 @@ Response wrappers and view helpers used across all apps.
 """
 
 from functools import wraps
-from typing import Callable, Any
+from typing import Callable, Any, Iterable, Iterator, Mapping, Optional, Sequence
 
+from django.db import transaction
+from django.http import HttpRequest, StreamingHttpResponse
+from django.utils.http import parse_etags
+from pydantic import ValidationError as PydanticValidationError
 from rest_framework.response import Response
 from rest_framework import status
 
 from common.exceptions import ValidationError, ResourceNotFound, DuplicateResource
+from common.middleware.tenant_context import set_rls_context
+from common.renderers import DecimalSafeJSONEncoder
+
+
+# Query-string spellings of True; the common ones are listed verbatim so
+# most lookups hit without lowercasing the value
+_TRUE_VALUES = frozenset({"true", "True", "TRUE", "1", "yes", "on"})
+
+
+def query_bool(
+    params: Mapping[str, str],
+    name: str,
+    default: Optional[bool] = None
+) -> Optional[bool]:
+    """
+    Parse a boolean query parameter.
+    
+    Args:
+        params: request.query_params
+        name: Parameter name
+        default: Returned when the parameter is absent
+        
+    Returns:
+        True for true/1/yes/on (any case), False for any other value,
+        or `default` if the parameter is not given
+    """
+    value = params.get(name)
+    if value is None:
+        return default
+    return value in _TRUE_VALUES or value.lower() in _TRUE_VALUES
+
+
+def parse_query(serializer_class: type, params: Mapping[str, str]) -> dict:
+    """
+    Validate query parameters with a DRF serializer.
+    
+    Params are passed as a plain dict so absent BooleanFields stay absent
+    (a QueryDict would make them False, as for unchecked HTML checkboxes).
+    
+    Args:
+        serializer_class: Serializer declaring the accepted parameters
+        params: request.query_params
+        
+    Returns:
+        The serializer's validated_data
+        
+    Raises:
+        ValidationError: For the first invalid parameter
+    """
+    query = serializer_class(data=params.dict() if hasattr(params, "dict") else dict(params))
+    if not query.is_valid():
+        field, errors = next(iter(query.errors.items()))
+        raise ValidationError(f"{field}: {errors[0]}")
+    return query.validated_data
+
+
+def etag_matches(request: HttpRequest, etag: str) -> bool:
+    """
+    Check a request's If-None-Match header against `etag`.
+    
+    Uses the weak comparison RFC 9110 prescribes for If-None-Match, so
+    a W/-prefixed copy of the tag also matches.
+    
+    Args:
+        request: Incoming request
+        etag: Current quoted entity tag of the resource
+        
+    Returns:
+        True if the client's cached copy is current (answer with 304)
+    """
+    header = request.headers.get("If-None-Match")
+    if not header:
+        return False
+    tags = parse_etags(header)
+    return tags == ["*"] or etag.removeprefix("W/") in (
+        tag.removeprefix("W/") for tag in tags
+    )
 
 
 def wrap_response(func: Callable) -> Callable:
@@ -19,7 +100,8 @@ def wrap_response(func: Callable) -> Callable:
     and standardize response format.
     
     Handles:
-    - ValidationError -> 400 Bad Request
+    - ValidationError -> 400 Bad Request (with its details, if any)
+    - pydantic.ValidationError (request schemas) -> 400 Bad Request
     - ResourceNotFound -> 404 Not Found
     - DuplicateResource -> 409 Conflict
     - Generic exceptions -> 500 Internal Server Error
@@ -35,11 +117,23 @@ def wrap_response(func: Callable) -> Callable:
         try:
             return func(*args, **kwargs)
         except ValidationError as e:
+            error = {
+                "code": e.code,
+                "message": e.message,
+            }
+            if e.details:
+                # e.g. per-item serializer errors, as custom_exception_handler reports them
+                error["details"] = e.details
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+        except PydanticValidationError as e:
+            # Request schema (pydantic) failures are reported like ValidationError
+            error = e.errors()[0]
+            field = ".".join(str(part) for part in error["loc"])
             return Response(
                 {
                     "error": {
-                        "code": e.code,
-                        "message": e.message,
+                        "code": ValidationError.default_code,
+                        "message": f"{field}: {error['msg']}" if field else error["msg"],
                     }
                 },
                 status=status.HTTP_400_BAD_REQUEST
@@ -76,3 +170,71 @@ def wrap_response(func: Callable) -> Callable:
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     return wrapper
+
+
+def _iter_json_list(
+    items: Sequence[Any],
+    to_representation: Callable[[Any], Any]
+) -> Iterator[bytes]:
+    """Yield {"data": [...], "count": N} as JSON, one item at a time."""
+    encode = DecimalSafeJSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    
+    yield b'{"data":['
+    for index, item in enumerate(items):
+        if index:
+            yield b","
+        yield encode(to_representation(item)).encode("utf-8")
+    yield b'],"count":%d}' % len(items)
+
+
+def stream_list_response(
+    items: Sequence[Any],
+    to_representation: Callable[[Any], Any]
+) -> StreamingHttpResponse:
+    """
+    Stream a list payload ({"data": [...], "count": N}) item by item.
+    
+    Only one serialized item is held in memory at a time. The items must
+    already be fetched (e.g. a list, not a lazy queryset): the body is
+    generated after the view returns, outside the request transaction
+    and its RLS context.
+    
+    Usage:
+        returns = GSTReturnService.list_returns(org_id)
+        return stream_list_response(returns, GSTReturnListSerializer().to_representation)
+    """
+    return StreamingHttpResponse(
+        _iter_json_list(items, to_representation),
+        content_type="application/json",
+    )
+
+
+def _iter_ndjson(rows: Iterable[Any], org_id, user_id) -> Iterator[bytes]:
+    """Encode rows as NDJSON lines inside their own RLS-scoped transaction."""
+    encode = DecimalSafeJSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    with transaction.atomic():
+        set_rls_context(org_id, user_id)
+        for row in rows:
+            yield encode(row).encode("utf-8") + b"\n"
+
+
+def ndjson_response(rows: Iterable[Any], org_id, user_id) -> StreamingHttpResponse:
+    """
+    Stream rows as newline-delimited JSON, one encoded line per row.
+    
+    The body is generated after the view returns, when the request
+    transaction has already ended, so the generator opens its own
+    transaction and sets the RLS context for org_id/user_id before the
+    first row is read. rows must therefore be lazy (e.g. a
+    QuerySet.iterator()); with a server-side cursor only one chunk of
+    rows and one encoded line are held at a time. Errors raised while
+    streaming end the response early rather than becoming an error body.
+    
+    Usage:
+        return ndjson_response(
+            ContactService.iter_contacts(org_id), org_id, request.user.id
+        )
+    """
+    return StreamingHttpResponse(
+        _iter_ndjson(rows, org_id, user_id), content_type="application/x-ndjson"
+    )
@@ -699,7 +699,8 @@ CREATE TABLE gst.return (
     -- TAX
     box6_output_tax                 NUMERIC(10,4) NOT NULL DEFAULT 0,  -- Output tax due (9% of Box 1)
     box7_input_tax_claimable        NUMERIC(10,4) NOT NULL DEFAULT 0,  -- Input tax claimable
-    box8_net_gst                    NUMERIC(10,4) NOT NULL DEFAULT 0,  -- = Box 6 - Box 7 (payable if +ve)
+    box8_net_gst                    NUMERIC(10,4) GENERATED ALWAYS AS
+        (box6_output_tax - box7_input_tax_claimable) STORED,           -- = Box 6 - Box 7 (payable if +ve)
 
     -- SCHEMES (for eligible businesses)
     box9_imports_under_schemes      NUMERIC(10,4) NOT NULL DEFAULT 0,  -- MES/3PL/etc.
@@ -731,9 +732,8 @@ CREATE TABLE gst.return (
     CONSTRAINT chk_box4_total CHECK (
         status = 'DRAFT' OR box4_total_supplies = box1_std_rated_supplies + box2_zero_rated_supplies + box3_exempt_supplies
     ),
-    CONSTRAINT chk_box8_net CHECK (
-        status = 'DRAFT' OR box8_net_gst = box6_output_tax - box7_input_tax_claimable
-    ),
+    -- NOTE: box8_net_gst is GENERATED ALWAYS AS (box6 - box7) STORED
+    -- No CHECK constraint needed — PostgreSQL computes it automatically
     UNIQUE(org_id, return_type, period_start, period_end)
 );
 
@@ -1130,6 +1130,79 @@ COMMENT ON COLUMN invoicing.document_line.tax_rate
 COMMENT ON COLUMN invoicing.document_line.is_bcrs_deposit
     IS 'BCRS deposit flag (S$0.10 per container). BCRS deposits are NOT subject to GST and must NOT appear in GST F5 returns. Per IRAS: "A BCRS deposit is not payment received for a supply of goods or services."';
 
+-- Document totals follow their lines (one grouped delta per statement,
+-- inside the caller's transaction)
+CREATE OR REPLACE FUNCTION invoicing.apply_line_totals()
+RETURNS TRIGGER
+LANGUAGE plpgsql
+AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        UPDATE invoicing.document d
+        SET subtotal     = d.subtotal + delta.subtotal,
+            total_gst    = d.total_gst + delta.total_gst,
+            total_amount = d.total_amount + (delta.subtotal + delta.total_gst)
+        FROM (
+            SELECT document_id, SUM(line_amount) AS subtotal, SUM(gst_amount) AS total_gst
+            FROM new_lines
+            GROUP BY document_id
+        ) delta
+        WHERE d.id = delta.document_id;
+
+    ELSIF TG_OP = 'DELETE' THEN
+        UPDATE invoicing.document d
+        SET subtotal     = d.subtotal - delta.subtotal,
+            total_gst    = d.total_gst - delta.total_gst,
+            total_amount = d.total_amount - (delta.subtotal + delta.total_gst)
+        FROM (
+            SELECT document_id, SUM(line_amount) AS subtotal, SUM(gst_amount) AS total_gst
+            FROM old_lines
+            GROUP BY document_id
+        ) delta
+        WHERE d.id = delta.document_id;
+
+    ELSE
+        -- UPDATE: new contribution minus old, per document (a line moved
+        -- between documents yields a negative and a positive delta)
+        UPDATE invoicing.document d
+        SET subtotal     = d.subtotal + delta.subtotal,
+            total_gst    = d.total_gst + delta.total_gst,
+            total_amount = d.total_amount + (delta.subtotal + delta.total_gst)
+        FROM (
+            SELECT document_id, SUM(line_amount) AS subtotal, SUM(gst_amount) AS total_gst
+            FROM (
+                SELECT document_id, line_amount, gst_amount FROM new_lines
+                UNION ALL
+                SELECT document_id, -line_amount, -gst_amount FROM old_lines
+            ) changes
+            GROUP BY document_id
+        ) delta
+        WHERE d.id = delta.document_id
+          AND (delta.subtotal <> 0 OR delta.total_gst <> 0);
+    END IF;
+
+    RETURN NULL;
+END;
+$$;
+
+COMMENT ON FUNCTION invoicing.apply_line_totals()
+    IS 'Keeps invoicing.document subtotal/total_gst/total_amount equal to the sum of its lines, one grouped delta per statement.';
+
+CREATE TRIGGER trg_document_line_totals_insert
+    AFTER INSERT ON invoicing.document_line
+    REFERENCING NEW TABLE AS new_lines
+    FOR EACH STATEMENT EXECUTE FUNCTION invoicing.apply_line_totals();
+
+CREATE TRIGGER trg_document_line_totals_update
+    AFTER UPDATE ON invoicing.document_line
+    REFERENCING OLD TABLE AS old_lines NEW TABLE AS new_lines
+    FOR EACH STATEMENT EXECUTE FUNCTION invoicing.apply_line_totals();
+
+CREATE TRIGGER trg_document_line_totals_delete
+    AFTER DELETE ON invoicing.document_line
+    REFERENCING OLD TABLE AS old_lines
+    FOR EACH STATEMENT EXECUTE FUNCTION invoicing.apply_line_totals();
+
 
 -- ──────────────────────────────────────────────
 -- 7e. Document Attachment
@@ -2389,7 +2462,12 @@ CREATE INDEX idx_account_type ON coa.account(org_id, account_type_id);
 -- ── GST ──
 CREATE INDEX idx_tax_code_lookup ON gst.tax_code(code, effective_from DESC)
     WHERE is_active = TRUE;
+CREATE UNIQUE INDEX uniq_tax_code_org_code_current ON gst.tax_code(org_id, code)
+    WHERE effective_to IS NULL AND deleted_at IS NULL;  -- One current row per code
+CREATE INDEX idx_tax_code_org_active_gst ON gst.tax_code(org_id, is_active, is_gst_charged, code);
 CREATE INDEX idx_gst_return_org ON gst.return(org_id, period_start, period_end);
+CREATE INDEX idx_gst_return_draft_due ON gst.return(org_id, filing_due_date)
+    WHERE status = 'DRAFT';  -- Upcoming filing deadlines widget
 
 -- ── Journal ──
 CREATE INDEX idx_journal_entry_org_date ON journal.entry(org_id, entry_date DESC);
@@ -2410,8 +2488,16 @@ CREATE INDEX idx_contact_search ON invoicing.contact
 CREATE INDEX idx_document_org_status ON invoicing.document(org_id, status, document_date DESC);
 CREATE INDEX idx_document_org_type ON invoicing.document(org_id, document_type, document_date DESC);
 CREATE INDEX idx_document_contact ON invoicing.document(contact_id);
+-- DocumentService.list_documents default ordering, and trigram search on numbers
+CREATE INDEX idx_document_org_date_number ON invoicing.document(org_id, document_date DESC, document_number DESC);
+CREATE INDEX idx_document_number_search ON invoicing.document
+    USING gin (document_number gin_trgm_ops);
 CREATE INDEX idx_document_due_date ON invoicing.document(org_id, due_date)
     WHERE status IN ('APPROVED', 'SENT', 'PARTIALLY_PAID');  -- For aging reports
+-- DocumentSummaryView outstanding total and overdue count (index-only scan)
+CREATE INDEX idx_document_org_open ON invoicing.document(org_id, due_date)
+    INCLUDE (total_amount)
+    WHERE status IN ('APPROVED', 'PARTIALLY_PAID');
 CREATE INDEX idx_document_invoicenow ON invoicing.document(org_id, invoicenow_status)
     WHERE invoicenow_status NOT IN ('NOT_APPLICABLE');
 
@@ -2423,6 +2509,14 @@ CREATE INDEX idx_document_line_account ON invoicing.document_line(account_id);
 CREATE INDEX idx_docline_gst_compute ON invoicing.document_line(org_id, tax_code_id)
     INCLUDE (base_line_amount, base_gst_amount);
 
+-- GST F5 box aggregation (GSTCalculationService.get_f5_box_amounts):
+-- partial index on posted documents by date, joined to lines covering the
+-- summed columns so the aggregate runs as an index-only scan.
+CREATE INDEX idx_document_org_date_posted ON invoicing.document(org_id, document_date)
+    WHERE status IN ('APPROVED', 'SENT', 'PARTIALLY_PAID', 'PAID');
+CREATE INDEX idx_docline_f5_compute ON invoicing.document_line(document_id, tax_code_id)
+    INCLUDE (line_amount, gst_amount);
+
 -- ── Banking ──
 CREATE INDEX idx_bank_account_org ON banking.bank_account(org_id);
 CREATE INDEX idx_payment_org_date ON banking.payment(org_id, payment_date DESC);
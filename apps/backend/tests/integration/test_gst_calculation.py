@@ -129,13 +129,57 @@ def test_gst_tax_code_info(auth_client):
     response = auth_client.get(url)
     
     assert response.status_code == status.HTTP_200_OK
-    assert "data" in response.data
+    assert response["ETag"]
+    payload = response.json()
+    assert "data" in payload
     
     # Should have SR code info
-    codes = response.data["data"]
+    codes = payload["data"]
     assert "SR" in codes
     assert codes["SR"]["rate"] == "0.09"
     assert codes["SR"]["box_mapping"] == "box1"
+    
+    # Revalidation with the ETag is answered with 304 Not Modified
+    response = auth_client.get(url, HTTP_IF_NONE_MATCH=response["ETag"])
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+
+
+@pytest.mark.django_db
+def test_gst_tax_code_list_etag(auth_client, test_organisation, test_tax_codes):
+    """Test tax code list revalidation with ETag."""
+    url = f"/api/v1/{test_organisation.id}/gst/tax-codes/"
+    
+    response = auth_client.get(url)
+    
+    assert response.status_code == status.HTTP_200_OK
+    rows = {row["code"]: row for row in response.data["data"]}
+    assert rows["SR"]["rate"] == "0.0900"
+    assert rows["SR"]["f5_supply_box"] == 1
+    assert rows["TX"]["f5_purchase_box"] == 5
+    etag = response["ETag"]
+    assert etag
+    
+    response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_304_NOT_MODIFIED
+    
+    # Any change to the org's tax codes changes the ETag
+    tax_code = test_tax_codes["ZR"]
+    tax_code.name = "Zero-Rated Export"
+    tax_code.save()
+    response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == status.HTTP_200_OK
+    assert response["ETag"] != etag
+
+
+@pytest.mark.django_db
+def test_gst_tax_code_list_excludes_system(auth_client, test_organisation, test_tax_codes):
+    """Test include_system=false leaves out the IRAS-reserved codes."""
+    url = f"/api/v1/{test_organisation.id}/gst/tax-codes/"
+    
+    response = auth_client.get(url, {"include_system": "false"})
+    
+    assert response.status_code == status.HTTP_200_OK
+    assert [row["code"] for row in response.data["data"]] == ["TX"]
 
 
 @pytest.mark.django_db
@@ -162,6 +206,23 @@ def test_gst_iras_compliance_validation(auth_client, test_organisation):
             f"GST for {amount} @ {rate} should be {expected_gst}, got {result['gst_amount']}"
 
 
+def test_gst_batch_line_calculation_matches_single():
+    """Batch line GST matches calculate_line_gst line by line."""
+    from apps.gst.services import GSTCalculationService
+    
+    amounts = [Decimal("100.00"), Decimal("0.05"), Decimal("33.33"), Decimal("12.50")]
+    rates = [Decimal("0.09"), Decimal("0.09"), Decimal("0.08"), Decimal("0.09")]
+    bcrs_flags = [False, False, False, True]
+    
+    result = GSTCalculationService.calculate_lines_gst(amounts, rates, bcrs_flags)
+    
+    assert result == [
+        GSTCalculationService.calculate_line_gst(amount, rate, is_bcrs)["gst_amount"]
+        for amount, rate, is_bcrs in zip(amounts, rates, bcrs_flags)
+    ]
+    assert result[3] == Decimal("0.00")
+
+
 @pytest.mark.django_db
 def test_gst_f5_generation(auth_client, test_organisation, test_fiscal_period, test_accounts, test_tax_codes):
     """Test F5 form generation."""
@@ -186,6 +247,68 @@ def test_gst_f5_generation(auth_client, test_organisation, test_fiscal_period, t
     assert response.status_code in [status.HTTP_200_OK, status.HTTP_201_CREATED]
 
 
+@pytest.mark.django_db
+def test_gst_f5_cache_follows_document_changes(
+    test_organisation, test_user, test_fiscal_period, test_accounts, test_tax_codes,
+    django_capture_on_commit_callbacks
+):
+    """Test regenerated F5 boxes reflect approvals and voids, and force bypasses the cache."""
+    from datetime import date
+    from apps.core.models import Contact, GSTReturn, InvoiceDocument
+    from apps.gst.services import GSTReturnService
+    from apps.invoicing.services import DocumentService
+    
+    contact = Contact.objects.create(
+        org=test_organisation, contact_type="CUSTOMER", name="Alpha", is_customer=True
+    )
+    gst_return = GSTReturn.objects.create(
+        org=test_organisation,
+        return_type="F5",
+        period_start=test_fiscal_period.start_date,
+        period_end=test_fiscal_period.end_date,
+        filing_due_date=date(2024, 2, 29),
+        status="DRAFT",
+    )
+    
+    def box1():
+        return GSTReturnService.generate_f5(
+            test_organisation.id, gst_return.id
+        ).box1_std_rated_supplies
+    
+    with django_capture_on_commit_callbacks(execute=True):
+        invoice = DocumentService.create_document(
+            org_id=test_organisation.id,
+            document_type="SALES_INVOICE",
+            contact_id=contact.id,
+            issue_date=date(2024, 1, 15),
+            lines=[{
+                "account_id": test_accounts["4000"].id,
+                "description": "Services",
+                "quantity": 1,
+                "unit_price": Decimal("100.00"),
+                "tax_code_id": test_tax_codes["SR"].id,
+            }],
+            user_id=test_user.id,
+        )
+    assert box1() == Decimal("0.00")  # drafts are not reported
+    
+    with django_capture_on_commit_callbacks(execute=True):
+        DocumentService.transition_status(test_organisation.id, invoice.id, "SENT", test_user.id)
+    assert box1() == Decimal("100.00")
+    
+    with django_capture_on_commit_callbacks(execute=True):
+        DocumentService.transition_status(test_organisation.id, invoice.id, "VOID", test_user.id)
+    assert box1() == Decimal("0.00")
+    
+    # A write that bypasses signals leaves the cache stale until forced
+    InvoiceDocument.objects.filter(id=invoice.id).update(status="SENT")
+    assert box1() == Decimal("0.00")
+    forced = GSTReturnService.generate_f5(
+        test_organisation.id, gst_return.id, force_recalculate=True
+    )
+    assert forced.box1_std_rated_supplies == Decimal("100.00")
+
+
 @pytest.mark.django_db
 def test_gst_create_return_periods(auth_client, test_organisation):
     """Test creating GST return periods."""
@@ -201,6 +324,60 @@ def test_gst_create_return_periods(auth_client, test_organisation):
     assert response.data["count"] == 3
 
 
+@pytest.mark.django_db
+def test_gst_create_return_periods_skips_existing(auth_client, test_organisation):
+    """Test re-creating overlapping periods only counts the new ones."""
+    from apps.core.models import GSTReturn
+    
+    url = f"/api/v1/{test_organisation.id}/gst/returns/"
+    auth_client.post(url, {
+        "filing_frequency": "MONTHLY",
+        "start_date": "2024-01-01",
+        "periods": 2
+    }, format="json")
+    
+    response = auth_client.post(url, {
+        "filing_frequency": "MONTHLY",
+        "start_date": "2024-01-01",
+        "periods": 3
+    }, format="json")
+    
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.data["count"] == 1
+    assert response.data["data"][0]["period_start"] == "2024-03-01"
+    assert GSTReturn.objects.get(
+        org=test_organisation, period_start="2024-03-01"
+    ).filing_due_date.isoformat() == "2024-04-30"
+
+
+@pytest.mark.django_db
+def test_gst_list_returns(auth_client, test_organisation):
+    """Test listing GST returns reads only real gst.return columns."""
+    import json
+    from datetime import date
+    from apps.core.models import GSTReturn
+    
+    GSTReturn.objects.create(
+        org=test_organisation,
+        return_type="F5",
+        period_start=date(2024, 1, 1),
+        period_end=date(2024, 3, 31),
+        filing_due_date=date(2024, 4, 30),
+        status="DRAFT",
+    )
+    
+    url = f"/api/v1/{test_organisation.id}/gst/returns/"
+    response = auth_client.get(url)
+    
+    assert response.status_code == status.HTTP_200_OK
+    body = json.loads(b"".join(response.streaming_content))
+    assert body["count"] == 1
+    row = body["data"][0]
+    assert row["label"] == "Q1 2024"
+    assert row["due_date"] == "2024-04-30"
+    assert row["filing_frequency"] == "QUARTERLY"
+
+
 @pytest.mark.django_db
 def test_gst_deadlines(auth_client, test_organisation, test_fiscal_period):
     """Test upcoming GST filing deadlines."""
@@ -221,3 +398,115 @@ def test_gst_deadlines(auth_client, test_organisation, test_fiscal_period):
     
     assert response.status_code == status.HTTP_200_OK
     assert "data" in response.data
+
+
+@pytest.mark.django_db
+def test_tax_code_update_system_and_custom(test_organisation, test_tax_codes):
+    """Test IRAS-reserved codes only accept description/active changes."""
+    from apps.gst.services import TaxCodeService
+    from common.exceptions import ValidationError
+    
+    with pytest.raises(ValidationError):
+        TaxCodeService.update_tax_code(
+            test_organisation.id, test_tax_codes["SR"].id, rate=Decimal("0.10")
+        )
+    
+    updated = TaxCodeService.update_tax_code(
+        test_organisation.id, test_tax_codes["SR"].id, description="Standard"
+    )
+    assert updated.description == "Standard"
+    
+    # TX is not an IRAS-reserved code, so it is fully editable
+    updated = TaxCodeService.update_tax_code(
+        test_organisation.id, test_tax_codes["TX"].id, rate=Decimal("0.08")
+    )
+    assert updated.rate == Decimal("0.08")
+
+
+@pytest.mark.django_db
+def test_tax_code_deactivate_system_and_custom(test_organisation, test_tax_codes):
+    """Test IRAS-reserved codes cannot be deactivated; custom codes can."""
+    from apps.gst.services import TaxCodeService
+    from common.exceptions import ValidationError
+    
+    with pytest.raises(ValidationError):
+        TaxCodeService.deactivate_tax_code(test_organisation.id, test_tax_codes["SR"].id)
+    test_tax_codes["SR"].refresh_from_db()
+    assert test_tax_codes["SR"].is_active is True
+    
+    deactivated = TaxCodeService.deactivate_tax_code(
+        test_organisation.id, test_tax_codes["TX"].id
+    )
+    assert deactivated.is_active is False
+
+
+@pytest.mark.django_db
+def test_seed_default_tax_codes(test_organisation):
+    """Test seeding creates every IRAS code with its F5 box columns."""
+    from apps.core.models import TaxCode
+    from apps.gst.services import TaxCodeService, IRAS_TAX_CODES
+    
+    created = TaxCodeService.seed_default_tax_codes(test_organisation.id)
+    
+    assert sorted(tax_code.code for tax_code in created) == sorted(IRAS_TAX_CODES)
+    sr = TaxCode.objects.get(org=test_organisation, code="SR")
+    assert (sr.f5_supply_box, sr.f5_tax_box, sr.is_output) == (1, 6, True)
+    im = TaxCode.objects.get(org=test_organisation, code="IM")
+    assert (im.f5_purchase_box, im.is_input, im.is_output) == (9, True, False)
+    assert TaxCode.objects.get(org=test_organisation, code="ES").rate == Decimal("0.00")
+    
+    # Seeding again is a no-op
+    assert TaxCodeService.seed_default_tax_codes(test_organisation.id) == []
+
+
+@pytest.mark.django_db
+def test_create_tax_code_duplicate(test_organisation):
+    """Test creating the same custom code twice raises DuplicateResource."""
+    from apps.gst.services import TaxCodeService
+    from common.exceptions import DuplicateResource
+    
+    tax_code = TaxCodeService.create_tax_code(
+        org_id=test_organisation.id,
+        code="SR8",
+        name="Standard-Rated 8%",
+        rate=Decimal("0.08"),
+        is_gst_charged=True,
+        box_mapping="box1",
+    )
+    assert (tax_code.f5_supply_box, tax_code.f5_tax_box, tax_code.is_output) == (1, 6, True)
+    
+    with pytest.raises(DuplicateResource):
+        TaxCodeService.create_tax_code(
+            org_id=test_organisation.id,
+            code="sr8",
+            name="Standard-Rated 8% again",
+            rate=Decimal("0.08"),
+            is_gst_charged=True,
+        )
+
+
+@pytest.mark.django_db
+def test_validate_tax_codes_for_invoice_batch(test_organisation, test_tax_codes):
+    """Test batch validation computes GST and F5 boxes per line."""
+    from apps.gst.services import TaxCodeService
+    
+    results = TaxCodeService.validate_tax_codes_for_invoice_batch(test_organisation.id, [
+        {"tax_code_id": test_tax_codes["SR"].id, "amount": Decimal("100.00")},
+        {"tax_code_id": test_tax_codes["ZR"].id, "amount": Decimal("50.00")},
+        {"tax_code_id": test_tax_codes["TX"].id, "amount": Decimal("10.00")},
+        {"tax_code_id": test_tax_codes["SR"].id, "amount": Decimal("0.10"), "is_bcrs_deposit": True},
+    ])
+    
+    assert [(r["tax_code"], r["gst_amount"]) for r in results] == [
+        ("SR", Decimal("9.00")),
+        ("ZR", Decimal("0.00")),
+        ("TX", Decimal("0.00")),  # fixture TX is not GST-charged
+        ("SR", Decimal("0.00")),
+    ]
+    assert [r.get("box_mapping") for r in results] == ["box1", "box2", "box5", None]
+    assert results[3]["is_bcrs_exempt"] is True
+    
+    single = TaxCodeService.validate_tax_code_for_invoice(
+        test_organisation.id, test_tax_codes["SR"].id, Decimal("100.00")
+    )
+    assert single == results[0]
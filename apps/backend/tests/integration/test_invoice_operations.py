@@ -142,6 +142,50 @@ class TestInvoiceOperationsBusinessLogic:
             assert response.data['sent'] is True
             mock_delay.assert_called_once()
 
+    @pytest.mark.django_db
+    def test_bulk_transition_task_partial_failure(self, test_organisation, test_invoice, monkeypatch):
+        """
+        Bulk transitions should:
+        - Transition valid documents
+        - Leave documents already in the target status alone (retry-safe)
+        - Report a chunk with an invalid transition instead of raising
+        """
+        from datetime import date, timedelta
+        from apps.core.models import InvoiceDocument
+        from apps.invoicing import tasks
+        
+        def create_invoice(number, status):
+            return InvoiceDocument.objects.create(
+                org=test_organisation,
+                document_type="SALES_INVOICE",
+                document_number=number,
+                contact=test_invoice.contact,
+                issue_date=date.today(),
+                due_date=date.today() + timedelta(days=30),
+                status=status,
+            )
+        
+        already_sent = create_invoice("INV-00002", "SENT")
+        voided = create_invoice("INV-00003", "VOID")
+        monkeypatch.setattr(tasks, "BULK_TRANSITION_CHUNK_SIZE", 1)
+        
+        ids = [str(test_invoice.id), str(already_sent.id), str(voided.id)]
+        result = tasks.bulk_transition_status_task(str(test_organisation.id), ids, "SENT")
+        
+        assert result["transitioned"] == 1
+        assert result["already"] == 1
+        assert result["skipped"] == []
+        assert [chunk["document_ids"] for chunk in result["failed"]] == [[str(voided.id)]]
+        test_invoice.refresh_from_db()
+        voided.refresh_from_db()
+        assert test_invoice.status == "SENT"
+        assert voided.status == "VOID"
+        
+        # Re-running the batch (as a retry would) transitions nothing again
+        result = tasks.bulk_transition_status_task(str(test_organisation.id), ids[:2], "SENT")
+        assert result["transitioned"] == 0
+        assert result["already"] == 2
+
     def test_invoicenow_queuing(self):
         """
         InvoiceNow sending should:
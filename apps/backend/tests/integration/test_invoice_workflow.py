@@ -217,6 +217,48 @@ def test_invoice_gst_calculation(auth_client, test_organisation, test_user, test
     assert invoice.total_incl == Decimal("109.00")
 
 
+@pytest.mark.django_db
+def test_get_document_with_lines_query_count(
+    auth_client, test_organisation, test_user, test_accounts, test_tax_codes, django_assert_num_queries
+):
+    """Test document detail reads load contact and lines without N+1 queries."""
+    from apps.core.models import Contact
+    from apps.invoicing.services import DocumentService
+    
+    contact = Contact.objects.create(
+        org=test_organisation,
+        contact_type="CUSTOMER",
+        name="Test Customer",
+        is_customer=True,
+        is_active=True,
+    )
+    
+    lines = [{
+        "account_id": test_accounts["4000"].id,
+        "description": f"Line {i}",
+        "quantity": 1,
+        "unit_price": Decimal("10.00"),
+        "tax_code_id": test_tax_codes["SR"].id,
+    } for i in range(5)]
+    
+    invoice = DocumentService.create_document(
+        org_id=test_organisation.id,
+        document_type="SALES_INVOICE",
+        contact_id=contact.id,
+        issue_date=date.today(),
+        lines=lines,
+        user_id=test_user.id
+    )
+    
+    # Document + contact join, then one prefetch query for all lines
+    with django_assert_num_queries(2):
+        document = DocumentService.get_document(test_organisation.id, invoice.id, with_lines=True)
+        assert document.contact.name == "Test Customer"
+        assert [
+            (line.account.code, line.tax_code.code) for line in document.lines.all()
+        ] == [("4000", "SR")] * 5
+
+
 @pytest.mark.django_db
 def test_invoice_bcrs_exemption(auth_client, test_organisation, test_user, test_accounts, test_tax_codes):
     """Test BCRS deposit GST exemption."""
@@ -309,6 +351,71 @@ def test_quote_conversion_to_invoice(auth_client, test_organisation, test_user,
     assert quote.status == "APPROVED"
 
 
+@pytest.mark.django_db
+def test_document_totals_follow_lines(auth_client, test_organisation, test_user, test_accounts, test_tax_codes):
+    """Test the line totals triggers keep document totals equal to the lines."""
+    from apps.core.models import Contact
+    from apps.invoicing.services import DocumentService
+    
+    contact = Contact.objects.create(
+        org=test_organisation,
+        contact_type="CUSTOMER",
+        name="Test Customer",
+        is_customer=True,
+        is_active=True,
+    )
+    
+    def line(unit_price):
+        return {
+            "account_id": test_accounts["4000"].id,
+            "description": "Services",
+            "quantity": 1,
+            "unit_price": Decimal(unit_price),
+            "tax_code_id": test_tax_codes["SR"].id,
+        }
+    
+    def assert_totals(document, total_excl, gst_total):
+        document.refresh_from_db()
+        assert document.total_excl == Decimal(total_excl)
+        assert document.gst_total == Decimal(gst_total)
+        assert document.total_incl == Decimal(total_excl) + Decimal(gst_total)
+    
+    quote = DocumentService.create_document(
+        org_id=test_organisation.id,
+        document_type="SALES_QUOTE",
+        contact_id=contact.id,
+        issue_date=date.today(),
+        lines=None,
+        user_id=test_user.id
+    )
+    assert_totals(quote, "0.00", "0.00")
+    
+    # add_line
+    first = DocumentService.add_line(
+        org_id=test_organisation.id, document_id=quote.id, **line("100.00")
+    )
+    assert_totals(quote, "100.00", "9.00")
+    
+    # add_lines: one bulk statement for several lines
+    DocumentService.add_lines(
+        test_organisation.id, quote.id, [line("200.00"), line("300.00")]
+    )
+    assert_totals(quote, "600.00", "54.00")
+    
+    # remove_line
+    DocumentService.remove_line(test_organisation.id, quote.id, first.id)
+    assert_totals(quote, "500.00", "45.00")
+    
+    # convert_quote_to_invoice copies the lines in one INSERT ... SELECT
+    invoice = DocumentService.convert_quote_to_invoice(
+        org_id=test_organisation.id,
+        quote_id=quote.id,
+        user_id=test_user.id
+    )
+    assert_totals(invoice, "500.00", "45.00")
+    assert_totals(quote, "500.00", "45.00")
+
+
 
 @pytest.mark.django_db
 def test_invoice_voiding(auth_client, test_organisation, test_user, test_accounts, test_tax_codes):
@@ -140,3 +140,43 @@ def test_permission_unauthenticated(api_client, test_organisation):
     for url in endpoints:
         response = api_client.get(url)
         assert response.status_code == status.HTTP_401_UNAUTHORIZED, f"Endpoint {url} should require auth"
+
+
+@pytest.mark.django_db
+def test_permission_revoked_role_applies_immediately(
+    auth_client, test_organisation, django_capture_on_commit_callbacks
+):
+    """Test that a revoked role flag is not served from the role cache once committed."""
+    url = f"/api/v1/{test_organisation.id}/reports/reports/financial/"
+    
+    # First request caches the owner's role
+    response = auth_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    
+    role = Role.objects.get(org=test_organisation, name="Owner")
+    role.can_view_reports = False
+    with django_capture_on_commit_callbacks(execute=True):
+        role.save()
+    
+    response = auth_client.get(url)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
+
+
+@pytest.mark.django_db
+def test_permission_removed_membership_applies_immediately(
+    auth_client, test_user, test_organisation, django_capture_on_commit_callbacks
+):
+    """Test that a removed membership is not served from the role cache once committed."""
+    url = f"/api/v1/{test_organisation.id}/invoicing/contacts/"
+    
+    # First request caches the membership
+    response = auth_client.get(url)
+    assert response.status_code == status.HTTP_200_OK
+    
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        UserOrganisation.objects.get(user=test_user, org=test_organisation).delete()
+    # Invalidation is deferred to commit, not run inside the transaction
+    assert len(callbacks) == 1
+    
+    response = auth_client.get(url)
+    assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -361,6 +361,39 @@ class TestGSTAPI:
         }, format="json")
         
         assert response.status_code == status.HTTP_200_OK
+        # Rate is echoed at 4 dp, as DecimalField(decimal_places=4) returned it
+        assert response.data["rate"] == "0.0900"
+    
+    def test_calculate_gst_requires_rate_or_tax_code(self, auth_client, test_organisation):
+        """POST /api/v1/{org_id}/gst/calculate/ - Neither tax_code_id nor rate is a 400."""
+        response = auth_client.post(f"/api/v1/{test_organisation.id}/gst/calculate/", {
+            "amount": "100.00",
+        }, format="json")
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    def test_calculate_gst_by_tax_code(self, auth_client, test_organisation, test_tax_codes):
+        """POST /api/v1/{org_id}/gst/calculate/ - tax_code_id selects that code's rate."""
+        url = f"/api/v1/{test_organisation.id}/gst/calculate/"
+        
+        response = auth_client.post(url, {
+            "amount": "100.00",
+            "tax_code_id": str(test_tax_codes["ZR"].id),
+        }, format="json")
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["gst_amount"] == "0.00"
+        
+        response = auth_client.post(url, {
+            "amount": "100.00",
+            "tax_code_id": str(test_tax_codes["SR"].id),
+        }, format="json")
+        assert response.data["gst_amount"] == "9.00"
+        
+        response = auth_client.post(url, {
+            "amount": "100.00",
+            "tax_code_id": str(uuid.uuid4()),
+        }, format="json")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
     
     def test_calculate_document_gst(self, auth_client, test_organisation):
         """POST /api/v1/{org_id}/gst/calculate/document/ - Calculate document GST."""
@@ -397,6 +430,24 @@ class TestGSTAPI:
 # Invoicing API Tests
 # =============================================================================
 
+def _create_draft_invoice(org):
+    """Create a DRAFT sales invoice (with its contact) for an organisation."""
+    from apps.core.models import Contact, InvoiceDocument
+    
+    contact = Contact.objects.create(
+        org=org, contact_type="CUSTOMER", name="Alpha", is_customer=True
+    )
+    return InvoiceDocument.objects.create(
+        org=org,
+        document_type="SALES_INVOICE",
+        document_number="INV-00001",
+        contact=contact,
+        issue_date=date.today(),
+        due_date=date.today() + timedelta(days=30),
+        status="DRAFT",
+    )
+
+
 @pytest.mark.django_db
 class TestInvoicingAPI:
     """Test invoicing module endpoints."""
@@ -407,6 +458,68 @@ class TestInvoicingAPI:
         
         assert response.status_code == status.HTTP_200_OK
     
+    def test_list_contacts_cursor_pages(self, auth_client, test_organisation):
+        """Contact list pages follow next_cursor without repeats."""
+        from apps.core.models import Contact
+        
+        for name in ("Alpha", "Bravo", "Charlie"):
+            Contact.objects.create(
+                org=test_organisation, contact_type="CUSTOMER", name=name, is_customer=True
+            )
+        
+        url = f"/api/v1/{test_organisation.id}/invoicing/contacts/"
+        first = auth_client.get(url, {"page_size": 2})
+        assert first.status_code == status.HTTP_200_OK
+        assert [c["name"] for c in first.data["data"]] == ["Alpha", "Bravo"]
+        assert first.data["next_cursor"]
+        
+        second = auth_client.get(url, {"page_size": 2, "cursor": first.data["next_cursor"]})
+        assert [c["name"] for c in second.data["data"]] == ["Charlie"]
+        assert second.data["next_cursor"] is None
+    
+    def test_export_contacts_ndjson(self, auth_client, test_organisation):
+        """GET .../contacts/?export=ndjson - One JSON line per contact."""
+        import json
+        from apps.core.models import Contact
+        
+        for name in ("Alpha", "Bravo"):
+            Contact.objects.create(
+                org=test_organisation, contact_type="CUSTOMER", name=name, is_customer=True
+            )
+        
+        response = auth_client.get(
+            f"/api/v1/{test_organisation.id}/invoicing/contacts/", {"export": "ndjson"}
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response["Content-Type"] == "application/x-ndjson"
+        assert response.streaming
+        body = b"".join(response.streaming_content)
+        rows = [json.loads(line) for line in body.splitlines()]
+        assert sorted(row["name"] for row in rows) == ["Alpha", "Bravo"]
+    
+    def test_contact_detail_etag(self, auth_client, test_organisation):
+        """Contact detail revalidates with ETag until the contact changes."""
+        from apps.core.models import Contact
+        
+        contact = Contact.objects.create(
+            org=test_organisation, contact_type="CUSTOMER", name="Alpha", is_customer=True
+        )
+        url = f"/api/v1/{test_organisation.id}/invoicing/contacts/{contact.id}/"
+        
+        response = auth_client.get(url)
+        assert response.status_code == status.HTTP_200_OK
+        etag = response["ETag"]
+        
+        response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        
+        contact.name = "Alpha Trading"
+        contact.save()
+        response = auth_client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response["ETag"] != etag
+    
     def test_create_contact(self, auth_client, test_organisation):
         """POST /api/v1/{org_id}/invoicing/contacts/ - Create contact."""
         response = auth_client.post(
@@ -429,6 +542,64 @@ class TestInvoicingAPI:
         
         assert response.status_code == status.HTTP_200_OK
     
+    def test_list_documents_cursor_pages(self, auth_client, test_organisation):
+        """Document list pages follow next_cursor, newest first, without repeats."""
+        from apps.core.models import Contact, InvoiceDocument
+        from common.pagination import encode_cursor
+        
+        contact = Contact.objects.create(
+            org=test_organisation, contact_type="CUSTOMER", name="Alpha", is_customer=True
+        )
+        for day, number in ((1, "INV-00001"), (2, "INV-00002"), (3, "INV-00003")):
+            InvoiceDocument.objects.create(
+                org=test_organisation,
+                document_type="SALES_INVOICE",
+                document_number=number,
+                contact=contact,
+                issue_date=date(2024, 1, day),
+                due_date=date(2024, 1, day) + timedelta(days=30),
+                status="DRAFT",
+            )
+        
+        url = f"/api/v1/{test_organisation.id}/invoicing/documents/"
+        first = auth_client.get(url, {"page_size": 2})
+        assert first.status_code == status.HTTP_200_OK
+        assert [d["document_number"] for d in first.data["data"]] == ["INV-00003", "INV-00002"]
+        assert first.data["next_cursor"]
+        
+        second = auth_client.get(url, {"page_size": 2, "cursor": first.data["next_cursor"]})
+        assert [d["document_number"] for d in second.data["data"]] == ["INV-00001"]
+        assert second.data["next_cursor"] is None
+        
+        # Well-formed cursor whose values do not fit the columns
+        response = auth_client.get(url, {"cursor": encode_cursor(["not-a-date", "INV-00001"])})
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
+    def test_bulk_add_lines_reports_line_errors(self, auth_client, test_organisation):
+        """POST .../documents/{id}/lines/bulk/ - Invalid lines return per-line errors."""
+        document = _create_draft_invoice(test_organisation)
+        
+        response = auth_client.post(
+            f"/api/v1/{test_organisation.id}/invoicing/documents/{document.id}/lines/bulk/",
+            [{"description": "Missing account and price"}],
+            format="json",
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        errors = response.data["error"]["details"]["errors"]
+        assert "unit_price" in errors[0]
+    
+    def test_status_transition_rejects_malformed_body(self, auth_client, test_organisation):
+        """POST .../documents/{id}/status/ - A list body or unhashable status is a 400."""
+        document = _create_draft_invoice(test_organisation)
+        url = f"/api/v1/{test_organisation.id}/invoicing/documents/{document.id}/status/"
+        
+        response = auth_client.post(url, [{"status": "APPROVED"}], format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        
+        response = auth_client.post(url, {"status": ["APPROVED"]}, format="json")
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+    
     def test_get_document_summary(self, auth_client, test_organisation):
         """GET /api/v1/{org_id}/invoicing/documents/summary/ - Get document stats."""
         response = auth_client.get(